@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import secrets
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeVar, cast
 
 from fastapi import (
     Cookie,
@@ -25,7 +30,18 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 
-from privacy_guard import PiiType, PrivacyScanner, ScanResult
+from privacy_guard import (
+    MappedWhitelist,
+    MicroBatcher,
+    PiiType,
+    PrivacyScanner,
+    RegexGuard,
+    ScanResult,
+    SegmentCache,
+    WhitelistManager,
+)
+from privacy_guard.conversation import Conversation
+from privacy_guard.scanner import NameBackend
 
 # ── Auth / API key ───────────────────────────────────────────────────────────
 
@@ -73,6 +89,7 @@ class ScanRequest(BaseModel):
     text: str
     detectors: list[PiiType] | None = None
     whitelist: list[str] | None = None
+    name_backend: NameBackend | None = None
 
 
 class FindingOut(BaseModel):
@@ -88,10 +105,37 @@ class ScanResponse(BaseModel):
     anonymised_text: str
     findings: list[FindingOut]
     mapping: dict[str, str]
+    budget_exceeded: list[str] = []  # rules stopped by the regex time budget
 
 
 class AnonymizeResponse(BaseModel):
     anonymised_text: str
+    budget_exceeded: list[str] = []
+
+
+class MessageIn(BaseModel):
+    id: str
+    text: str
+
+
+class ConversationScanRequest(BaseModel):
+    messages: list[MessageIn]
+    detectors: list[PiiType] | None = None
+    whitelist: list[str] | None = None
+    name_backend: NameBackend | None = None
+
+
+class MessageOut(BaseModel):
+    id: str
+    anonymised_text: str
+    findings: list[FindingOut]
+    budget_exceeded: list[str] = []
+
+
+class ConversationScanResponse(BaseModel):
+    messages: list[MessageOut]  # only messages not scanned before
+    mapping: dict[str, str]  # placeholders occurring in these messages
+    budget_exceeded: list[str] = []  # over all messages
 
 
 # ── Scanner singleton ────────────────────────────────────────────────────────
@@ -100,29 +144,272 @@ _scanner: PrivacyScanner | None = None
 
 _ALL_PII_TYPES = [t.value for t in PiiType]
 
+# Segment cache for repeated prompt parts (system prompts, signatures, …); 0 = off
+_CACHE_ENTRIES = int(os.getenv("SCAN_CACHE_ENTRIES", "0"))
+_CACHE_TTL = float(os.getenv("SCAN_CACHE_TTL", "0")) or None
+
+# Default name backend ("spacy" or "gazetteer"); requests may override it
+_NAME_BACKEND = cast(NameBackend, os.getenv("NAME_BACKEND", "spacy"))
+
+# Pre-built whitelist store (python -m privacy_guard.whitelist_store); mapped
+# read-only and shared by all workers, replaced files are picked up live
+_WHITELIST_STORE = os.getenv("WHITELIST_STORE")
+
+# Prompts are untrusted: regex rules run on bounded slices and are stopped
+# after REGEX_BUDGET_MS plus REGEX_BUDGET_MS_PER_KCHARS per 1000 characters of
+# the text (REGEX_BUDGET_MS=0: unguarded). A text a rule could not finish is
+# not fully masked: it is rejected with 422 unless REGEX_BUDGET_EXCEEDED is
+# "report", which returns the partial result with budget_exceeded set.
+_REGEX_BUDGET_MS = float(os.getenv("REGEX_BUDGET_MS", "100"))
+_REGEX_BUDGET_MS_PER_KCHARS = float(os.getenv("REGEX_BUDGET_MS_PER_KCHARS", "5"))
+_REGEX_SLICE_CHARS = int(os.getenv("REGEX_SLICE_CHARS", "4096"))
+_REGEX_BUDGET_EXCEEDED = os.getenv("REGEX_BUDGET_EXCEEDED", "reject")
+if _REGEX_BUDGET_EXCEEDED not in ("reject", "report"):
+    raise ValueError("REGEX_BUDGET_EXCEEDED must be 'reject' or 'report'")
+
+# Secret rules to run: comma-separated tags (empty = all) and minimum severity
+_SECRET_TAGS = [t for t in os.getenv("SECRET_TAGS", "").split(",") if t.strip()]
+_SECRET_MIN_SEVERITY = os.getenv("SECRET_MIN_SEVERITY") or None
+
+
+# Scans run on a worker pool so a large prompt never blocks the event loop.
+# At most SCAN_WORKERS + SCAN_QUEUE scans are admitted at once; further
+# requests get 503 instead of piling up.
+_SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", str(min(4, os.cpu_count() or 1))))
+_SCAN_QUEUE = int(os.getenv("SCAN_QUEUE", "32"))
+_SCAN_TIMEOUT = float(os.getenv("SCAN_TIMEOUT", "30"))
+_MAX_TEXT_CHARS = int(os.getenv("MAX_TEXT_CHARS", "1000000"))
+
+# Micro-batching: /scan and /anonymize requests arriving within
+# SCAN_BATCH_WINDOW_MS are scanned together (one nlp.pipe call); 0 = off
+_BATCH_WINDOW_MS = float(os.getenv("SCAN_BATCH_WINDOW_MS", "0"))
+_BATCH_MAX = int(os.getenv("SCAN_BATCH_MAX", "32"))
+
+_executor: ThreadPoolExecutor | None = None
+_batcher: MicroBatcher | None = None
+_slots = threading.BoundedSemaphore(_SCAN_WORKERS + _SCAN_QUEUE)
+
+_T = TypeVar("_T")
+
+
+# Warm-up: the lifespan hook loads the model and runs every detector once in
+# the background; /ready answers 503 until it has finished
+_WARM_UP = os.getenv("WARM_UP", "1") != "0"
+_ready = threading.Event()
+
+# Set by preload() in a parent process before the workers are forked
+_preloaded: PrivacyScanner | None = None
+
+
+def _build_scanner() -> PrivacyScanner:
+    cache = (
+        SegmentCache(max_entries=_CACHE_ENTRIES, ttl=_CACHE_TTL)
+        if _CACHE_ENTRIES > 0
+        else None
+    )
+    whitelist = (
+        WhitelistManager(store=MappedWhitelist(_WHITELIST_STORE))
+        if _WHITELIST_STORE
+        else None
+    )
+    guard = (
+        RegexGuard(
+            budget=_REGEX_BUDGET_MS / 1000,
+            slice_chars=_REGEX_SLICE_CHARS,
+            budget_per_char=_REGEX_BUDGET_MS_PER_KCHARS / 1_000_000,
+        )
+        if _REGEX_BUDGET_MS > 0
+        else None
+    )
+    return PrivacyScanner(
+        whitelist=whitelist,
+        cache=cache,
+        name_backend=_NAME_BACKEND,
+        guard=guard,
+        secret_tags=_SECRET_TAGS or None,
+        secret_min_severity=_SECRET_MIN_SEVERITY,
+    )
+
+
+def preload() -> None:
+    """Build and warm up the scanner in the current process.
+
+    Called by ``main.py --preload`` before forking the workers: they inherit
+    the loaded model and share its memory pages copy-on-write instead of each
+    loading a copy.
+    """
+    global _preloaded
+    scanner = _build_scanner()
+    scanner.warm_up()
+    _preloaded = scanner
+
+
+def _warm_up(scanner: PrivacyScanner) -> None:
+    scanner.warm_up()
+    _ready.set()
+
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     from api.db import init_db
 
     init_db()
-    global _scanner
-    _scanner = PrivacyScanner()
+    global _scanner, _executor, _batcher
+    _scanner = _preloaded or _build_scanner()
+    _ready.clear()
+    warm_up: asyncio.Future[None] | None = None
+    if _preloaded is not None or not _WARM_UP:
+        _ready.set()
+    else:
+        warm_up = asyncio.ensure_future(asyncio.to_thread(_warm_up, _scanner))
+    executor = ThreadPoolExecutor(_SCAN_WORKERS, thread_name_prefix="scan")
+    _executor = executor
+    batcher = (
+        MicroBatcher(_scanner, max_wait_ms=_BATCH_WINDOW_MS, max_batch=_BATCH_MAX)
+        if _BATCH_WINDOW_MS > 0
+        else None
+    )
+    _batcher = batcher
     yield
+    if warm_up is not None:
+        await warm_up
+    executor.shutdown(wait=False, cancel_futures=True)
+    if batcher is not None:
+        batcher.close()
+    _executor = None
+    _batcher = None
     _scanner = None
+    _conversations.clear()
+
+
+def _check_size(chars: int) -> None:
+    if chars > _MAX_TEXT_CHARS:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Text exceeds the limit of {_MAX_TEXT_CHARS} characters",
+        )
 
 
-def _get_scanner(
-    detectors: list[PiiType] | None, whitelist: list[str] | None
-) -> PrivacyScanner:
-    if detectors is None and not whitelist:
-        assert _scanner is not None
-        return _scanner
-    scanner = PrivacyScanner(extra_whitelist_names=whitelist or [])
-    if detectors is not None:
-        for pii_type in set(PiiType) - set(detectors):
-            scanner.disable_detector(pii_type)
-    return scanner
+async def _admit(submit: Callable[[], Future[_T]]) -> _T:
+    """Run the work started by submit if a slot is free, within the timeout."""
+    if not _slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Scanner is busy, retry later",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = submit()
+    except BaseException:
+        _slots.release()
+        raise
+    # The slot is freed when the work is really done, not when we stop waiting:
+    # a timed-out scan that is already running still occupies a worker
+    future.add_done_callback(lambda _: _slots.release())
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), _SCAN_TIMEOUT)
+    except TimeoutError:
+        # Cancels the scan if it is still queued
+        future.cancel()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Scan did not finish within {_SCAN_TIMEOUT:g} seconds",
+            headers={"Retry-After": "1"},
+        ) from None
+
+
+def _check_budget(rules: list[str]) -> None:
+    """Fail closed: text that a rule stopped by the guard did not scan to the
+    end may still contain PII of that type."""
+    if rules and _REGEX_BUDGET_EXCEEDED == "reject":
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=(
+                "Text could not be fully scanned within the regex time budget "
+                f"(rules: {', '.join(rules)})"
+            ),
+        )
+
+
+async def _offload(fn: Callable[..., _T], *args: Any) -> _T:
+    assert _executor is not None
+    executor = _executor
+    return await _admit(lambda: executor.submit(fn, *args))
+
+
+def _scan_sync(
+    text: str,
+    detectors: list[PiiType] | None,
+    whitelist: list[str] | None,
+    name_backend: NameBackend | None = None,
+) -> ScanResult:
+    # Detector selection, whitelist and name backend are applied per call on
+    # the shared scanner
+    assert _scanner is not None
+    result = _scanner.scan(
+        text,
+        detectors=detectors,
+        extra_whitelist=whitelist,
+        name_backend=name_backend,
+    )
+    # Rendering is lazy; do it on the worker, not on the event loop
+    result.anonymised_text
+    result.findings
+    return result
+
+
+async def _scan(
+    text: str,
+    detectors: list[PiiType] | None,
+    whitelist: list[str] | None,
+    name_backend: NameBackend | None = None,
+) -> ScanResult:
+    _check_size(len(text))
+    if _batcher is not None:
+        batcher = _batcher
+        return await _admit(
+            lambda: batcher.submit(text, detectors, whitelist, name_backend)
+        )
+    return await _offload(_scan_sync, text, detectors, whitelist, name_backend)
+
+
+# ── Conversations (in-process, bounded) ─────────────────────────────────────
+
+_CONVERSATION_MAX = int(os.getenv("CONVERSATION_MAX", "1000"))
+_CONVERSATION_TTL = float(os.getenv("CONVERSATION_TTL", "3600"))
+
+# conversation id → (last use, conversation); least recently used first
+_conversations: OrderedDict[str, tuple[float, Conversation]] = OrderedDict()
+
+
+def _scan_conversation_sync(
+    conversation: Conversation,
+    messages: list[tuple[str, str]],
+    detectors: list[PiiType] | None,
+    whitelist: list[str] | None,
+    name_backend: NameBackend | None,
+) -> dict[str, ScanResult]:
+    results = conversation.scan(messages, detectors, whitelist, name_backend)
+    for result in results.values():
+        result.anonymised_text
+        result.findings
+    return results
+
+
+def _get_conversation(conversation_id: str) -> Conversation:
+    assert _scanner is not None
+    now = time.monotonic()
+    while _conversations:
+        oldest_id, (last_used, _) = next(iter(_conversations.items()))
+        if now - last_used <= _CONVERSATION_TTL:
+            break
+        del _conversations[oldest_id]
+    entry = _conversations.pop(conversation_id, None)
+    conversation = entry[1] if entry else _scanner.conversation()
+    _conversations[conversation_id] = (now, conversation)
+    while len(_conversations) > _CONVERSATION_MAX:
+        _conversations.popitem(last=False)
+    return conversation
 
 
 # ── FastAPI app ──────────────────────────────────────────────────────────────
@@ -219,40 +506,46 @@ async def ui_scan_post(
     if selected != _ALL_PII_TYPES:
         pii_types = [PiiType(d) for d in selected]
 
-    result: ScanResult | None = None
+    result_dict: dict[str, Any] | None = None
+    error: str | None = None
     if text.strip():
         t0 = time.monotonic()
-        result = _get_scanner(pii_types, None).scan(text)
+        result = await _scan(text, pii_types, None)
         duration_ms = (time.monotonic() - t0) * 1000
 
-        findings_out = [
-            {
-                "pii_type": f.pii_type.value,
-                "text": f.text,
-                "confidence": f.confidence,
-                "placeholder": f.placeholder,
-                "start": f.start,
-                "end": f.end,
+        if result.budget_exceeded:
+            # Never show (or store) a partly masked text as anonymised
+            error = (
+                "Der Text konnte nicht vollständig gescannt werden "
+                f"(Zeitbudget überschritten: {', '.join(result.budget_exceeded)})."
+            )
+        else:
+            findings_out = [
+                {
+                    "pii_type": f.pii_type.value,
+                    "text": f.text,
+                    "confidence": f.confidence,
+                    "placeholder": f.placeholder,
+                    "start": f.start,
+                    "end": f.end,
+                }
+                for f in result.findings
+            ]
+            save_scan(
+                user_id=sess["id"],
+                input_text=text,
+                anonymised_text=result.anonymised_text,
+                findings_json=json.dumps(findings_out),
+                pii_count=len(result.findings),
+                duration_ms=duration_ms,
+            )
+
+            # Attach serialisable findings for template
+            result_dict = {
+                "anonymised_text": result.anonymised_text,
+                "findings": findings_out,
+                "mapping": result.mapping,
             }
-            for f in result.findings
-        ]
-        save_scan(
-            user_id=sess["id"],
-            input_text=text,
-            anonymised_text=result.anonymised_text,
-            findings_json=json.dumps(findings_out),
-            pii_count=len(result.findings),
-            duration_ms=duration_ms,
-        )
-
-        # Attach serialisable findings for template
-        result_dict = {
-            "anonymised_text": result.anonymised_text,
-            "findings": findings_out,
-            "mapping": result.mapping,
-        }
-    else:
-        result_dict = None  # type: ignore[assignment]
 
     return templates.TemplateResponse(
         request,
@@ -260,6 +553,7 @@ async def ui_scan_post(
         {
             "text": text,
             "result": result_dict,
+            "error": error,
             "all_types": _ALL_PII_TYPES,
             "selected_types": selected,
         },
@@ -376,7 +670,7 @@ async def ui_apikeys_revoke(
     )
 
 
-# ── JSON API routes (unchanged) ──────────────────────────────────────────────
+# ── JSON API routes ──────────────────────────────────────────────────────────
 
 
 @app.get("/health")
@@ -384,12 +678,32 @@ async def health() -> dict[str, Any]:
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready() -> dict[str, Any]:
+    if not _ready.is_set():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Warming up",
+        )
+    return {"status": "ready"}
+
+
 @app.post("/scan", response_model=ScanResponse, dependencies=[Depends(verify_api_key)])
 async def scan(request: ScanRequest) -> ScanResponse:
-    result: ScanResult = _get_scanner(request.detectors, request.whitelist).scan(
-        request.text
+    result = await _scan(
+        request.text, request.detectors, request.whitelist, request.name_backend
+    )
+    _check_budget(result.budget_exceeded)
+    return ScanResponse(
+        anonymised_text=result.anonymised_text,
+        findings=_findings_out(result),
+        mapping=result.mapping,
+        budget_exceeded=result.budget_exceeded,
     )
-    findings = [
+
+
+def _findings_out(result: ScanResult) -> list[FindingOut]:
+    return [
         FindingOut(
             start=f.start,
             end=f.end,
@@ -400,11 +714,6 @@ async def scan(request: ScanRequest) -> ScanResponse:
         )
         for f in result.findings
     ]
-    return ScanResponse(
-        anonymised_text=result.anonymised_text,
-        findings=findings,
-        mapping=result.mapping,
-    )
 
 
 @app.post(
@@ -413,7 +722,60 @@ async def scan(request: ScanRequest) -> ScanResponse:
     dependencies=[Depends(verify_api_key)],
 )
 async def anonymize(request: ScanRequest) -> AnonymizeResponse:
-    result: ScanResult = _get_scanner(request.detectors, request.whitelist).scan(
-        request.text
+    result = await _scan(
+        request.text, request.detectors, request.whitelist, request.name_backend
+    )
+    _check_budget(result.budget_exceeded)
+    return AnonymizeResponse(
+        anonymised_text=result.anonymised_text,
+        budget_exceeded=result.budget_exceeded,
+    )
+
+
+@app.post(
+    "/conversations/{conversation_id}/scan",
+    response_model=ConversationScanResponse,
+    dependencies=[Depends(verify_api_key)],
+)
+async def scan_conversation(
+    conversation_id: str, request: ConversationScanRequest
+) -> ConversationScanResponse:
+    _check_size(sum(len(m.text) for m in request.messages))
+    conversation = _get_conversation(conversation_id)
+    results = await _offload(
+        _scan_conversation_sync,
+        conversation,
+        [(m.id, m.text) for m in request.messages],
+        request.detectors,
+        request.whitelist,
+        request.name_backend,
     )
-    return AnonymizeResponse(anonymised_text=result.anonymised_text)
+    exceeded = sorted({rule for r in results.values() for rule in r.budget_exceeded})
+    if exceeded and _REGEX_BUDGET_EXCEEDED == "reject":
+        # None of these results reach the client: scan them again on retry
+        conversation.forget(results)
+    _check_budget(exceeded)
+    mapping: dict[str, str] = {}
+    messages: list[MessageOut] = []
+    for message_id, result in results.items():
+        mapping.update(result.mapping)
+        messages.append(
+            MessageOut(
+                id=message_id,
+                anonymised_text=result.anonymised_text,
+                findings=_findings_out(result),
+                budget_exceeded=result.budget_exceeded,
+            )
+        )
+    return ConversationScanResponse(
+        messages=messages, mapping=mapping, budget_exceeded=exceeded
+    )
+
+
+@app.delete(
+    "/conversations/{conversation_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(verify_api_key)],
+)
+async def delete_conversation(conversation_id: str) -> None:
+    _conversations.pop(conversation_id, None)
@@ -0,0 +1 @@
+"""Reproducible performance benchmarks for privacy-guard (``python -m benchmarks``)."""
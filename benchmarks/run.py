@@ -0,0 +1,235 @@
+"""Benchmark runner.
+
+Usage:
+    uv run python -m benchmarks
+    uv run python -m benchmarks --sizes 1KB 100KB 1MB --output bench.json
+    uv run python -m benchmarks --baseline bench.json --tolerance 0.15
+
+Every benchmark is run ``--repeat`` times after one warm-up call; the JSON
+output stores min/median/mean seconds per benchmark. With ``--baseline`` the
+medians are compared and the exit code is 1 if any benchmark got slower by
+more than the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from privacy_guard import PrivacyScanner, StreamingRestorer
+
+from .corpus import PII_KINDS, generate
+
+SIZES: dict[str, int] = {
+    "100B": 100,
+    "1KB": 1_000,
+    "10KB": 10_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+    "10MB": 10_000_000,
+}
+# Texts above this are scanned with scan_stream (spaCy's nlp.max_length is 1M)
+_STREAM_ABOVE = 500_000
+
+Results = dict[str, dict[str, Any]]
+
+
+def _measure(fn: Callable[[], object], repeat: int, chars: int) -> dict[str, Any]:
+    fn()  # warm-up: model loading, lazy compilation, caches
+    runs: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - started)
+    median = statistics.median(runs)
+    return {
+        "min": min(runs),
+        "median": median,
+        "mean": statistics.fmean(runs),
+        "runs": repeat,
+        "chars": chars,
+        "chars_per_s": chars / median if median else None,
+    }
+
+
+def bench_scan(scanner: PrivacyScanner, texts: dict[str, str], repeat: int) -> Results:
+    results: Results = {}
+    for label, text in texts.items():
+        if len(text) > _STREAM_ABOVE:
+            results[f"scan_stream/{label}"] = _measure(
+                lambda: scanner.scan_stream(text).read(), repeat, len(text)
+            )
+        else:
+            results[f"scan/{label}"] = _measure(
+                lambda: scanner.scan(text).anonymised_text, repeat, len(text)
+            )
+    return results
+
+
+def bench_detectors(scanner: PrivacyScanner, text: str, repeat: int) -> Results:
+    return {
+        f"detector/{pii_type.value}": _measure(
+            lambda: detector.detect(text), repeat, len(text)
+        )
+        for pii_type, detector in scanner._detectors.items()
+    }
+
+
+def bench_restore(scanner: PrivacyScanner, text: str, repeat: int) -> Results:
+    result = scanner.scan(text)
+    answer = result.anonymised_text
+    tokens = [answer[i : i + 4] for i in range(0, len(answer), 4)]
+
+    def streamed() -> str:
+        restorer = StreamingRestorer(result.mapping)
+        return "".join(restorer.feed(t) for t in tokens) + restorer.flush()
+
+    return {
+        "restore/full": _measure(lambda: result.restore(answer), repeat, len(answer)),
+        "restore/streaming": _measure(streamed, repeat, len(answer)),
+    }
+
+
+def bench_api(text: str, repeat: int) -> Results:
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        print("skipping API benchmarks: fastapi/httpx not installed", file=sys.stderr)
+        return {}
+
+    # Keep the UI database of the benchmark out of the working directory
+    os.environ.setdefault("UI_DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+    from api.main import app
+
+    results: Results = {}
+    with TestClient(app) as client:
+        for endpoint in ("/scan", "/anonymize"):
+            body = {"text": text}
+            results[f"api{endpoint}"] = _measure(
+                lambda: client.post(endpoint, json=body).raise_for_status(),
+                repeat,
+                len(text),
+            )
+        body = {"text": text, "detectors": ["IBAN", "EMAIL", "NAME"]}
+        results["api/scan+detectors"] = _measure(
+            lambda: client.post("/scan", json=body).raise_for_status(),
+            repeat,
+            len(text),
+        )
+    return results
+
+
+def compare(current: Results, baseline: Results, tolerance: float) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressed: list[str] = []
+    print(f"{'benchmark':32} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["median"], stats["median"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressed.append(name)
+            flag = "  SLOWER"
+        elif ratio < 1 - tolerance:
+            flag = "  faster"
+        print(
+            f"{name:32} {before * 1000:10.2f}ms {after * 1000:10.2f}ms "
+            f"{ratio:6.2f}x{flag}"
+        )
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run privacy-guard benchmarks")
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=["100B", "1KB", "10KB", "100KB"],
+        help="Corpus sizes for the scan benchmark (default: 100B 1KB 10KB 100KB)",
+    )
+    parser.add_argument(
+        "--density", type=float, default=0.2, help="Share of sentences with PII"
+    )
+    parser.add_argument(
+        "--mix",
+        nargs="+",
+        metavar="KIND=WEIGHT",
+        help=f"PII mix, e.g. iban=2 name=1 (kinds: {', '.join(PII_KINDS)})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=["scan", "detectors", "restore", "api"],
+        default=["scan", "detectors", "restore", "api"],
+        help="Benchmark groups to run",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare with a previous run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown against the baseline (default: 0.10 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    mix = None
+    if args.mix:
+        mix = {k: float(w) for k, _, w in (item.partition("=") for item in args.mix)}
+    texts = {
+        label: generate(SIZES[label], args.density, mix, args.seed)
+        for label in args.sizes
+    }
+    fixed = generate(SIZES["10KB"], args.density, mix, args.seed)
+
+    scanner = PrivacyScanner()
+    results: Results = {}
+    if "scan" in args.only:
+        results.update(bench_scan(scanner, texts, args.repeat))
+    if "detectors" in args.only:
+        results.update(bench_detectors(scanner, fixed, args.repeat))
+    if "restore" in args.only:
+        results.update(bench_restore(scanner, fixed, args.repeat))
+    if "api" in args.only:
+        results.update(bench_api(fixed, args.repeat))
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "density": args.density,
+            "mix": mix,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressed = compare(results, baseline, args.tolerance)
+        if regressed:
+            print(f"\n{len(regressed)} benchmark(s) slower than baseline")
+            return 1
+    else:
+        for name, stats in results.items():
+            print(f"{name:32} {stats['median'] * 1000:10.2f}ms")
+    return 0
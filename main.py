@@ -4,14 +4,56 @@ API start script — runs the FastAPI app via uvicorn.
 Usage:
     uv run python main.py
     uv run python main.py --host 0.0.0.0 --port 8080 --reload
+    uv run python main.py --workers 4 --preload
 """
 
 from __future__ import annotations
 
 import argparse
+import gc
+import os
+import signal
+import socket
 import uvicorn
 
 
+def _serve_preforked(host: str, port: int, workers: int) -> None:
+    """Load the model once, then fork the workers onto a shared socket.
+
+    uvicorn's own ``--workers`` starts fresh interpreters, so every worker
+    loads its own copy of the spaCy model. Forked workers share the parent's
+    pages copy-on-write instead.
+    """
+    from api.main import app, preload
+
+    preload()
+    # Keep the garbage collector from touching (and so copying) shared pages
+    gc.freeze()
+
+    sock = socket.create_server((host, port), backlog=2048)
+    children: list[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            server = uvicorn.Server(uvicorn.Config(app))
+            server.run(sockets=[sock])
+            os._exit(0)
+        children.append(pid)
+    sock.close()
+
+    def stop(signum: int, _frame: object) -> None:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Start the privacy-guard API")
     parser.add_argument(
@@ -26,8 +68,21 @@ def main() -> None:
     parser.add_argument(
         "--workers", type=int, default=1, help="Number of worker processes (default: 1)"
     )
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Load the model before forking the workers so they share its memory",
+    )
     args = parser.parse_args()
 
+    if args.preload:
+        if args.reload:
+            parser.error("--preload cannot be combined with --reload")
+        if not hasattr(os, "fork"):
+            parser.error("--preload needs os.fork (Linux/macOS)")
+        _serve_preforked(args.host, args.port, args.workers)
+        return
+
     uvicorn.run(
         "api.main:app",
         host=args.host,
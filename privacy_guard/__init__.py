@@ -1,13 +1,55 @@
 """privacy-guard: DSGVO-konformes Erkennen und Ersetzen von PII in LLM-Prompts."""
 
+from typing import TYPE_CHECKING
+
+from .cache import SegmentCache
+from .engine import RegexGuard
 from .models import Finding, PiiType, ScanResult
+from .restore import StreamingRestorer
 from .scanner import PrivacyScanner
 from .whitelist import WhitelistManager
 
+if TYPE_CHECKING:
+    from .batching import MicroBatcher
+    from .parallel import ParallelScanner, scan_many
+    from .whitelist_store import MappedWhitelist, build_whitelist_store
+
+# Imported on first access: they pull in multiprocessing / concurrent.futures,
+# which scripts that only scan in-process should not pay for. The whitelist
+# store also runs as a script (python -m privacy_guard.whitelist_store) and
+# must not be imported by the package before that.
+_LAZY = {
+    "ParallelScanner": ".parallel",
+    "scan_many": ".parallel",
+    "MicroBatcher": ".batching",
+    "MappedWhitelist": ".whitelist_store",
+    "build_whitelist_store": ".whitelist_store",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "Finding",
     "PiiType",
     "ScanResult",
     "PrivacyScanner",
+    "ParallelScanner",
+    "scan_many",
+    "MicroBatcher",
+    "StreamingRestorer",
+    "SegmentCache",
+    "RegexGuard",
     "WhitelistManager",
+    "MappedWhitelist",
+    "build_whitelist_store",
 ]
@@ -0,0 +1,166 @@
+"""Micro-batching of concurrent scan requests.
+
+Under load a server receives many small scans at nearly the same time. Run one
+by one, each pays a separate spaCy call. ``MicroBatcher`` collects the requests
+that arrive within a short window (or until ``max_batch`` are waiting) and
+scans them together with ``scan_batch``, so their NER goes through one
+``nlp.pipe`` call. Every caller still gets its own result.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from .models import PiiType, ScanResult
+
+if TYPE_CHECKING:
+    from .scanner import NameBackend, PrivacyScanner
+
+
+@dataclass
+class _Request:
+    text: str
+    detectors: frozenset[PiiType] | None
+    extra_whitelist: tuple[str, ...]
+    name_backend: NameBackend | None
+    future: Future[ScanResult] = field(default_factory=Future)
+
+    @property
+    def config(
+        self,
+    ) -> tuple[frozenset[PiiType] | None, tuple[str, ...], NameBackend | None]:
+        return self.detectors, self.extra_whitelist, self.name_backend
+
+
+class MicroBatcher:
+    """Scan concurrently submitted texts in batches on a background thread.
+
+    A batch starts with the first waiting request and is closed after
+    ``max_wait_ms`` or as soon as ``max_batch`` requests are collected; a
+    lone request therefore waits at most ``max_wait_ms``. Requests with
+    different ``detectors`` / ``extra_whitelist`` / ``name_backend`` are
+    scanned in separate ``scan_batch`` calls. Use as a context manager or
+    call ``close()``.
+    """
+
+    def __init__(
+        self,
+        scanner: PrivacyScanner,
+        max_wait_ms: float = 5.0,
+        max_batch: int = 32,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._scanner = scanner
+        self._max_wait = max_wait_ms / 1000
+        self._max_batch = max_batch
+        self._queue: queue.SimpleQueue[_Request | None] = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="micro-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        text: str,
+        detectors: Iterable[PiiType] | None = None,
+        extra_whitelist: Iterable[str] | None = None,
+        name_backend: NameBackend | None = None,
+    ) -> Future[ScanResult]:
+        """Queue text for the next batch; the future resolves to its result.
+
+        Cancelling the future before its batch starts drops the request.
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        request = _Request(
+            text,
+            frozenset(detectors) if detectors is not None else None,
+            tuple(sorted(extra_whitelist or ())),
+            name_backend,
+        )
+        self._queue.put(request)
+        return request.future
+
+    def _collect(self, first: _Request) -> list[_Request]:
+        batch = [first]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                self._queue.put(None)  # seen again by _run after this batch
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            groups: dict[tuple, list[_Request]] = {}
+            for request in self._collect(first):
+                # Skips requests cancelled while they were waiting
+                if request.future.set_running_or_notify_cancel():
+                    groups.setdefault(request.config, []).append(request)
+            for config, requests in groups.items():
+                self._scan(requests, *config)
+
+    def _scan(
+        self,
+        requests: list[_Request],
+        detectors: frozenset[PiiType] | None,
+        extra_whitelist: tuple[str, ...],
+        name_backend: NameBackend | None,
+    ) -> None:
+        try:
+            results = self._scanner.scan_batch(
+                [r.text for r in requests],
+                batch_size=len(requests),
+                detectors=detectors,
+                extra_whitelist=extra_whitelist,
+                name_backend=name_backend,
+            )
+            for result in results:
+                # Rendering is lazy; do it here rather than in the caller
+                result.anonymised_text
+                result.findings
+        except Exception as exc:
+            for request in requests:
+                request.future.set_exception(exc)
+            return
+        for request, result in zip(requests, results):
+            request.future.set_result(result)
+
+    def close(self) -> None:
+        """Finish the queued requests and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> MicroBatcher:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
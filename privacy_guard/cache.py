@@ -0,0 +1,174 @@
+"""Segment-level memoisation of detector findings.
+
+Prompts repeat a lot: system prompts, RAG snippets and e-mail signatures arrive
+over and over. With a ``SegmentCache`` the scanner splits every text into
+paragraphs and only runs the detectors on paragraphs it has not seen before
+with the same detector configuration. Placeholder numbering is still computed
+over the whole document.
+
+Cached values are offsets only (type, start, end, confidence, rule id); the
+finding text is sliced from the segment on a hit. With ``hash_keys=True`` (the
+default) keys are BLAKE2b digests, so the cache retains no plaintext at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from .models import Finding, PiiType
+
+# Paragraph breaks: a line break followed by an empty (or blank) line
+_SEGMENT_BREAK = re.compile(r"\n[ \t]*\n")
+
+# Rough per-entry and per-finding overhead used for the memory limit
+_ENTRY_OVERHEAD = 200
+_SPAN_SIZE = 120
+
+_Span = tuple[PiiType, int, int, float, str | None]
+
+
+def segments(text: str) -> list[tuple[int, int]]:
+    """Split text into paragraph spans; the breaks between them are dropped."""
+    spans: list[tuple[int, int]] = []
+    pos = 0
+    for m in _SEGMENT_BREAK.finditer(text):
+        if m.start() > pos:
+            spans.append((pos, m.start()))
+        pos = m.end()
+    if pos < len(text):
+        spans.append((pos, len(text)))
+    return spans
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SegmentCache:
+    """Bounded LRU cache (with optional TTL) from segment to findings.
+
+    ``max_entries`` and ``max_bytes`` (estimated) bound the size; the least
+    recently used entries are evicted first. ``ttl`` (seconds) expires entries
+    regardless of use. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: int | None = 64 * 1024 * 1024,
+        ttl: float | None = None,
+        hash_keys: bool = True,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._hash_keys = hash_keys
+        self._entries: OrderedDict[Hashable, tuple[float, int, list[_Span]]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def _key(self, segment: str, config: Hashable) -> Hashable:
+        if not self._hash_keys:
+            return (config, segment)
+        # The config repr never contains NUL, so the boundary is unambiguous
+        digest = hashlib.blake2b(repr(config).encode("utf-8"), digest_size=16)
+        digest.update(b"\0")
+        digest.update(segment.encode("utf-8"))
+        return digest.digest()
+
+    def get(
+        self, segment: str, config: Hashable, offset: int = 0
+    ) -> list[Finding] | None:
+        """Return the cached findings of segment, shifted by offset."""
+        key = self._key(segment, config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._ttl is not None:
+                if entry[0] < time.monotonic():
+                    self._drop(key)
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            spans = entry[2]
+        return [
+            Finding(
+                pii_type=pii_type,
+                start=start + offset,
+                end=end + offset,
+                text=segment[start:end],
+                confidence=confidence,
+                placeholder="",
+                rule_id=rule_id,
+            )
+            for pii_type, start, end, confidence, rule_id in spans
+        ]
+
+    def put(self, segment: str, config: Hashable, findings: list[Finding]) -> None:
+        key = self._key(segment, config)
+        spans: list[_Span] = [
+            (f.pii_type, f.start, f.end, f.confidence, f.rule_id) for f in findings
+        ]
+        size = _ENTRY_OVERHEAD + _SPAN_SIZE * len(spans)
+        if not self._hash_keys:
+            size += len(segment)
+        expires = time.monotonic() + self._ttl if self._ttl is not None else 0.0
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires, size, spans)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None
+                and self._bytes > self._max_bytes
+                and len(self._entries) > 1
+            ):
+                self._drop(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,79 @@
+"""Vectorised checksum validation for many candidates at once.
+
+The checksum validators of the numeric detectors (Luhn, MOD-97, tax id, KVNR)
+are per-character loops. When one scan yields many candidates for a detector
+(a CSV export passed to ``scan_batch``, a long table in a single text), their
+batch variants put the digits of all candidates into one fixed-width NumPy
+matrix and loop over its columns instead of over every string.
+
+NumPy is optional. It is imported on the first batch large enough to benefit;
+without it, and for small batches, the batch variants call the scalar
+validators one by one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+
+# Below this many candidates building the matrix costs more than it saves
+MIN_BATCH = 32
+
+_numpy: ModuleType | None = None
+_numpy_checked = False
+
+
+def numpy() -> ModuleType | None:
+    """The numpy module, or None if it is not installed."""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy, _numpy_checked = np, True
+    return _numpy
+
+
+def digit_matrix(values: Sequence[str]) -> np.ndarray:
+    """(len(values) × width) int64 matrix of the digits of each value, right
+    aligned and padded with leading zeros. Values must be ASCII digits."""
+    np_ = numpy()
+    assert np_ is not None, "digit_matrix needs numpy"
+    width = max(map(len, values), default=0)
+    data = "".join(value.rjust(width, "0") for value in values).encode("ascii")
+    matrix = np_.frombuffer(data, dtype=np_.uint8).reshape(len(values), width)
+    return matrix.astype(np_.int64) - ord("0")
+
+
+def validate_batch(
+    values: Sequence[str],
+    scalar: Callable[[str], T],
+    vectorised: Callable[[np.ndarray], Sequence[T]],
+) -> list[T]:
+    """``[scalar(v) for v in values]``, computed with ``vectorised`` on the
+    digit matrix of the values where that pays off.
+
+    Values that are not ASCII digit strings (``\\d`` also matches other
+    scripts' digits) always go through ``scalar``.
+    """
+    if len(values) < MIN_BATCH or numpy() is None:
+        return [scalar(value) for value in values]
+    results: list[T | None] = [None] * len(values)
+    fast: list[int] = []
+    for i, value in enumerate(values):
+        if value.isascii() and value.isdigit():
+            fast.append(i)
+        else:
+            results[i] = scalar(value)
+    if fast:
+        computed = vectorised(digit_matrix([values[i] for i in fast]))
+        for i, result in zip(fast, computed):
+            results[i] = result
+    return results  # type: ignore[return-value]
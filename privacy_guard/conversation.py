@@ -0,0 +1,114 @@
+"""Conversation-aware scanning.
+
+Chat gateways send the whole message history with every turn. A
+``Conversation`` remembers which message IDs it has already scanned and only
+scans new (or edited) messages, so a turn costs O(new message) instead of
+O(whole history). All messages share one ``PlaceholderMap``: ``[NAME_1]`` means
+the same person in every turn.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from .models import PiiType, ScanResult
+from .placeholders import PlaceholderMap
+from .restore import StreamingRestorer, restore_placeholders
+
+if TYPE_CHECKING:
+    from .scanner import NameBackend, PrivacyScanner
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class Conversation:
+    """Scan the messages of one conversation with stable placeholders.
+
+    Created by ``PrivacyScanner.conversation()``. Only a digest of each
+    message is kept to recognise it; the plaintext of the PII values lives in
+    the mapping, as for any scan.
+    """
+
+    def __init__(self, scanner: PrivacyScanner) -> None:
+        self._scanner = scanner
+        self._placeholders = PlaceholderMap()
+        self._seen: dict[str, bytes] = {}  # message id -> digest of its text
+        self._lock = threading.Lock()
+
+    def scan(
+        self,
+        messages: Mapping[str, str] | Iterable[tuple[str, str]],
+        detectors: Iterable[PiiType] | None = None,
+        extra_whitelist: Iterable[str] | None = None,
+        name_backend: NameBackend | None = None,
+    ) -> dict[str, ScanResult]:
+        """Scan the messages not seen before and return their results by ID.
+
+        ``messages`` maps message IDs to texts (in conversation order); it may
+        be the full history. Messages whose ID and text are already known are
+        skipped, edited messages are scanned again. Each result's ``mapping``
+        holds the placeholders occurring in that message. A message with
+        rules stopped by the ``RegexGuard`` is not remembered, so it is
+        scanned again next time.
+        """
+        messages = dict(messages)
+        if detectors is not None:
+            detectors = list(detectors)
+        if extra_whitelist is not None:
+            extra_whitelist = list(extra_whitelist)
+
+        results: dict[str, ScanResult] = {}
+        with self._lock:
+            for message_id, text in messages.items():
+                digest = _digest(text)
+                if self._seen.get(message_id) == digest:
+                    continue
+                exceeded: set[str] = set()
+                resolved = self._scanner._detect(
+                    text,
+                    detectors,
+                    extra_whitelist,
+                    name_backend=name_backend,
+                    exceeded=exceeded,
+                )
+                labels = [self._placeholders.placeholder_for(f) for f in resolved]
+                mapping = self._placeholders.mapping
+                result = ScanResult.from_spans(
+                    text, resolved, labels, {p: mapping[p] for p in labels}
+                )
+                result.budget_exceeded = sorted(exceeded)
+                results[message_id] = result
+                if exceeded:
+                    self._seen.pop(message_id, None)
+                else:
+                    self._seen[message_id] = digest
+        return results
+
+    def forget(self, message_ids: Iterable[str]) -> None:
+        """Scan these messages again the next time they are passed in."""
+        with self._lock:
+            for message_id in message_ids:
+                self._seen.pop(message_id, None)
+
+    @property
+    def mapping(self) -> dict[str, str]:
+        """Placeholder → original for the whole conversation."""
+        return self._placeholders.mapping
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, message_id: object) -> bool:
+        return message_id in self._seen
+
+    def restore(self, text: str) -> str:
+        """Replace placeholders from any turn with their original values."""
+        return restore_placeholders(text, self._placeholders.mapping)
+
+    def restorer(self) -> StreamingRestorer:
+        return StreamingRestorer(self._placeholders.mapping)
@@ -1,4 +1,4 @@
-from .base import BaseDetector
+from .base import BaseDetector, PatternDetector
 from .iban import IbanDetector
 from .phone import PhoneDetector
 from .email import EmailDetector
@@ -7,6 +7,7 @@ from .address import AddressDetector
 
 __all__ = [
     "BaseDetector",
+    "PatternDetector",
     "IbanDetector",
     "PhoneDetector",
     "EmailDetector",
@@ -1,7 +1,8 @@
 from __future__ import annotations
 import re
+from functools import lru_cache
 from pathlib import Path
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 _DATA_DIR = Path(__file__).parent.parent / "data"
@@ -31,9 +32,6 @@ def _build_prep_re() -> str:
     return rf"(?:{alts})\s+"
 
 
-_SUFFIX_RE = _build_suffix_re()
-_PREP_RE = _build_prep_re()
-
 # PLZ: 5-digit DE (01000-99999) or 4-digit AT/CH (1000-9999)
 _PLZ_RE = r"(?:\d{5}|\d{4})"
 
@@ -50,40 +48,46 @@ _CITY_RE = r"[A-ZÄÖÜ][a-zäöüß]+(?:(?:\s+|-)[A-ZÄÖÜ]?[a-zäöüß]+)*"
 # Avoids running the expensive pattern on texts that can't match.
 _PLZ_PREFILTER = re.compile(r"\b\d{4,5}\b")
 
-_ADDRESS_PATTERN = re.compile(
-    rf"(?:"
-    # Variant A: optional preposition + street name + suffix
-    # Separator [-\s]* allows direct concat ("Hauptstraße"), space ("Mariahilfer Straße"),
-    # or hyphen ("Achim-Stocker-Straße", "Bad-Straße")
-    rf"(?:{_PREP_RE})?(?P<street>{_STREET_NAME_RE})[-\s]*(?P<suffix>{_SUFFIX_RE})\.?"
-    rf"|"
-    # Variant B: required preposition + bare noun (no suffix), e.g. "Beim Brunnen"
-    rf"(?:{_PREP_RE})(?P<street2>{_STREET_NAME_RE})"
-    rf")"
-    rf"\s+(?P<house>{_HOUSE_RE})"
-    rf",?\s+"
-    rf"(?P<plz>{_PLZ_RE})\s+(?P<city>{_CITY_RE})",
-    re.UNICODE | re.IGNORECASE,
-)
-
-
-class AddressDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        if not _PLZ_PREFILTER.search(text):
-            return []
-
-        findings: list[Finding] = []
-
-        for match in _ADDRESS_PATTERN.finditer(text):
-            findings.append(
-                Finding(
-                    pii_type=PiiType.ADDRESS,
-                    start=match.start(),
-                    end=match.end(),
-                    text=match.group(0),
-                    confidence=0.9,
-                    placeholder="",
-                )
-            )
-
-        return findings
+
+@lru_cache(maxsize=1)
+def _address_pattern() -> re.Pattern[str]:
+    """The address regex, built from the data files on first use."""
+    suffix_re = _build_suffix_re()
+    prep_re = _build_prep_re()
+    return re.compile(
+        # Start at the beginning of a word: otherwise every letter of a long word
+        # is tried as a street start, each scanning to the word's end (quadratic)
+        rf"(?<![a-zäöüß])"
+        rf"(?:"
+        # Variant A: optional preposition + street name + suffix
+        # Separator [-\s]* allows direct concat ("Hauptstraße"), space ("Mariahilfer Straße"),
+        # or hyphen ("Achim-Stocker-Straße", "Bad-Straße")
+        rf"(?:{prep_re})?(?P<street>{_STREET_NAME_RE})[-\s]*(?P<suffix>{suffix_re})\.?"
+        rf"|"
+        # Variant B: required preposition + bare noun (no suffix), e.g. "Beim Brunnen"
+        rf"(?:{prep_re})(?P<street2>{_STREET_NAME_RE})"
+        rf")"
+        rf"\s+(?P<house>{_HOUSE_RE})"
+        rf",?\s+"
+        rf"(?P<plz>{_PLZ_RE})\s+(?P<city>{_CITY_RE})",
+        re.UNICODE | re.IGNORECASE,
+    )
+
+
+class AddressDetector(PatternDetector):
+    pii_type = PiiType.ADDRESS
+    prefilter = _PLZ_PREFILTER
+
+    @property
+    def patterns(self) -> tuple[re.Pattern[str], ...]:  # type: ignore[override]
+        return (_address_pattern(),)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return Finding(
+            pii_type=PiiType.ADDRESS,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(0),
+            confidence=0.9,
+            placeholder="",
+        )
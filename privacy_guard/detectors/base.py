@@ -1,6 +1,10 @@
 from __future__ import annotations
+import re
 from abc import ABC, abstractmethod
-from ..models import Finding
+from functools import cached_property
+from ..engine import PatternEngine
+from ..keywords import extract_keywords
+from ..models import Finding, PiiType
 
 
 class BaseDetector(ABC):
@@ -8,3 +12,62 @@ class BaseDetector(ABC):
     def detect(self, text: str) -> list[Finding]:
         """Return all findings in text."""
         ...
+
+    def detect_batch(
+        self, texts: list[str], batch_size: int = 64, n_process: int = 1
+    ) -> list[list[Finding]]:
+        """Return the findings of each text.
+
+        ``batch_size`` and ``n_process`` are hints for model-backed detectors;
+        the default simply calls ``detect`` per text.
+        """
+        return [self.detect(text) for text in texts]
+
+    def load(self) -> None:
+        """Load models or other lazy resources now instead of on first use."""
+
+
+class PatternDetector(BaseDetector):
+    """Detector defined by compiled patterns plus a per-match validator.
+
+    Subclasses list their patterns in ``patterns`` and turn each raw match into
+    a finding (or ``None`` to drop it) in ``from_match``. The scanner runs all
+    pattern detectors through one shared ``PatternEngine``.
+    """
+
+    pii_type: PiiType
+    patterns: tuple[re.Pattern[str], ...] = ()
+    # Optional whole-text check; the detector is skipped when it finds nothing
+    prefilter: re.Pattern[str] | None = None
+
+    @abstractmethod
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        """Validate a match of ``patterns[index]`` and build its finding."""
+        ...
+
+    def from_matches(
+        self, matches: list[re.Match[str]], index: int
+    ) -> list[Finding | None]:
+        """``from_match`` for many matches of ``patterns[index]`` at once.
+
+        Detectors with checksums override this to validate all candidates
+        together (see ``checksums.py``).
+        """
+        return [self.from_match(match, index) for match in matches]
+
+    def route_keywords(self, index: int) -> tuple[str, ...]:
+        """Case-folded literals of which every match of ``patterns[index]``
+        contains one; an empty tuple disables the keyword prefilter."""
+        return extract_keywords(self.patterns[index])
+
+    def route_id(self, index: int) -> str | None:
+        """Name under which ``patterns[index]`` is profiled individually."""
+        return None
+
+    @cached_property
+    def _engine(self) -> PatternEngine:
+        """Engine over this detector alone, for standalone ``detect`` calls."""
+        return PatternEngine([self])
+
+    def detect(self, text: str) -> list[Finding]:
+        return self._engine.scan(text)
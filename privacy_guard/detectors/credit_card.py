@@ -1,8 +1,14 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from .base import PatternDetector
+from ..checksums import validate_batch
 from ..models import Finding, PiiType
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Formatted card patterns:
 #   16-digit: XXXX[ -]XXXX[ -]XXXX[ -]XXXX  (Visa, MC, Discover, JCB)
 #   15-digit: XXXX[ -]XXXXXX[ -]XXXXX        (AmEx 4-6-5)
@@ -33,32 +39,50 @@ def _luhn_valid(digits: str) -> bool:
     return total % 10 == 0
 
 
-class CreditCardDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
+def _luhn_valid_batch(values: Sequence[str]) -> list[bool]:
+    """``_luhn_valid`` for many digit strings at once."""
+
+    def vectorised(digits: np.ndarray) -> list[bool]:
+        # Every second digit from the right is doubled
+        doubled = digits[:, -2::-2] * 2
+        doubled -= 9 * (doubled > 9)
+        total = digits[:, ::-2].sum(axis=1) + doubled.sum(axis=1)
+        return (total % 10 == 0).tolist()
+
+    return validate_batch(values, _luhn_valid, vectorised)
+
+
+class CreditCardDetector(PatternDetector):
+    pii_type = PiiType.CREDIT_CARD
+    patterns = (_CC_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        raw = match.group(1)
+        digits = raw.replace(" ", "").replace("-", "")
+        return self._finding(match, _luhn_valid(digits))
 
-        for match in _CC_PATTERN.finditer(text):
-            raw = match.group(1)
-            is_formatted = " " in raw or "-" in raw
-            digits = raw.replace(" ", "").replace("-", "")
-            luhn_ok = _luhn_valid(digits)
+    def from_matches(
+        self, matches: list[re.Match[str]], index: int
+    ) -> list[Finding | None]:
+        digits = [m.group(1).replace(" ", "").replace("-", "") for m in matches]
+        return list(map(self._finding, matches, _luhn_valid_batch(digits)))
 
-            if is_formatted:
-                confidence = 1.0 if luhn_ok else 0.6
-            else:
-                if not luhn_ok:
-                    continue  # too many false positives for raw unvalidated strings
-                confidence = 0.9
+    def _finding(self, match: re.Match[str], luhn_ok: bool) -> Finding | None:
+        raw = match.group(1)
+        is_formatted = " " in raw or "-" in raw
 
-            findings.append(
-                Finding(
-                    pii_type=PiiType.CREDIT_CARD,
-                    start=match.start(),
-                    end=match.end(),
-                    text=raw,
-                    confidence=confidence,
-                    placeholder="",
-                )
-            )
+        if is_formatted:
+            confidence = 1.0 if luhn_ok else 0.6
+        else:
+            if not luhn_ok:
+                return None  # too many false positives for raw unvalidated strings
+            confidence = 0.9
 
-        return findings
+        return Finding(
+            pii_type=PiiType.CREDIT_CARD,
+            start=match.start(),
+            end=match.end(),
+            text=raw,
+            confidence=confidence,
+            placeholder="",
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # German Führerscheinnummer.
@@ -18,27 +18,24 @@ _CONTEXT_KEYWORDS = re.compile(
 _CONTEXT_WINDOW = 200
 
 
-class DriverLicenseDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        text_lower = text.lower()
-
-        for match in _DRIVER_LICENSE_PATTERN.finditer(text):
-            # Check for context keyword within ±_CONTEXT_WINDOW characters
-            window_start = max(0, match.start() - _CONTEXT_WINDOW)
-            window_end = min(len(text), match.end() + _CONTEXT_WINDOW)
-            window = text_lower[window_start:window_end]
-
-            if _CONTEXT_KEYWORDS.search(window):
-                findings.append(
-                    Finding(
-                        pii_type=PiiType.DRIVER_LICENSE,
-                        start=match.start(),
-                        end=match.end(),
-                        text=match.group(),
-                        confidence=0.75,
-                        placeholder="",
-                    )
-                )
-
-        return findings
+class DriverLicenseDetector(PatternDetector):
+    pii_type = PiiType.DRIVER_LICENSE
+    patterns = (_DRIVER_LICENSE_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        # Check for context keyword within ±_CONTEXT_WINDOW characters
+        # (_CONTEXT_KEYWORDS is case-insensitive, so the original text is searched)
+        text = match.string
+        window_start = max(0, match.start() - _CONTEXT_WINDOW)
+        window_end = min(len(text), match.end() + _CONTEXT_WINDOW)
+        if not _CONTEXT_KEYWORDS.search(text, window_start, window_end):
+            return None
+
+        return Finding(
+            pii_type=PiiType.DRIVER_LICENSE,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=0.75,
+            placeholder="",
+        )
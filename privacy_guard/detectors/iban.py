@@ -1,8 +1,14 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from .base import PatternDetector
+from ..checksums import validate_batch
 from ..models import Finding, PiiType
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Country code -> expected IBAN length (without spaces)
 IBAN_LENGTHS: dict[str, int] = {
     "AD": 24,
@@ -115,42 +121,80 @@ def _mod97(iban_digits: str) -> int:
     return remainder
 
 
+# Letters as the digits they stand for in MOD-97: A -> "10", …, Z -> "35"
+_LETTER_DIGITS = str.maketrans(
+    {chr(c): str(c - ord("A") + 10) for c in range(ord("A"), ord("Z") + 1)}
+)
+
+
+def _mod97_batch(values: Sequence[str]) -> list[int]:
+    """``_mod97`` for many strings at once."""
+
+    def vectorised(digits: np.ndarray) -> list[int]:
+        remainder = digits[:, 0] % 97
+        for column in digits.T[1:]:
+            remainder = (remainder * 10 + column) % 97
+        return remainder.tolist()
+
+    # A letter adds two digits, as in _mod97
+    digits = [value.translate(_LETTER_DIGITS) for value in values]
+    return validate_batch(digits, _mod97, vectorised)
+
+
+def _rearranged(raw: str) -> str | None:
+    """The IBAN rearranged for the MOD-97 check, or None if country code or
+    length are wrong."""
+    clean = raw.replace(" ", "").upper()
+    expected_len = IBAN_LENGTHS.get(clean[:2])
+    if expected_len is None or len(clean) != expected_len:
+        return None
+    # Move first 4 chars to end
+    return clean[4:] + clean[:4]
+
+
 def _validate_iban(raw: str) -> tuple[bool, float]:
     """Return (is_valid_format, confidence)."""
-    clean = raw.replace(" ", "").upper()
-    country = clean[:2]
-    expected_len = IBAN_LENGTHS.get(country)
-    if expected_len is None:
-        return False, 0.0
-    if len(clean) != expected_len:
+    rearranged = _rearranged(raw)
+    if rearranged is None:
         return False, 0.0
-    # Rearrange: move first 4 chars to end, then check MOD97
-    rearranged = clean[4:] + clean[:4]
-    if _mod97(rearranged) == 1:
-        return True, 1.0
     # Format matches but checksum fails → lower confidence
-    return True, 0.6
-
-
-class IbanDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-
-        for match in _IBAN_PATTERN.finditer(text):
-            raw = match.group(0)
-            valid_format, confidence = _validate_iban(raw)
-            if not valid_format:
-                continue
-
-            findings.append(
-                Finding(
-                    pii_type=PiiType.IBAN,
-                    start=match.start(),
-                    end=match.end(),
-                    text=raw,
-                    confidence=confidence,
-                    placeholder="",
-                )
-            )
-
-        return findings
+    return True, 1.0 if _mod97(rearranged) == 1 else 0.6
+
+
+def _validate_iban_batch(raws: Sequence[str]) -> list[tuple[bool, float]]:
+    """``_validate_iban`` for many candidates at once."""
+    rearranged = [_rearranged(raw) for raw in raws]
+    remainders = iter(_mod97_batch([r for r in rearranged if r is not None]))
+    return [
+        (False, 0.0) if r is None else (True, 1.0 if next(remainders) == 1 else 0.6)
+        for r in rearranged
+    ]
+
+
+class IbanDetector(PatternDetector):
+    pii_type = PiiType.IBAN
+    patterns = (_IBAN_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return self._finding(match, *_validate_iban(match.group(0)))
+
+    def from_matches(
+        self, matches: list[re.Match[str]], index: int
+    ) -> list[Finding | None]:
+        validated = _validate_iban_batch([m.group(0) for m in matches])
+        return [self._finding(m, *result) for m, result in zip(matches, validated)]
+
+    def _finding(
+        self, match: re.Match[str], valid_format: bool, confidence: float
+    ) -> Finding | None:
+        if not valid_format:
+            return None
+
+        return Finding(
+            pii_type=PiiType.IBAN,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(0),
+            confidence=confidence,
+            placeholder="",
+        )
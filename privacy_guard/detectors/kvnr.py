@@ -1,8 +1,14 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from .base import PatternDetector
+from ..checksums import validate_batch
 from ..models import Finding, PiiType
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Krankenversichertennummer (KVNR) — § 290 SGB V.
 # Format: 1 uppercase letter (insurer identifier) + 9 digits = 10 chars total.
 # The letter encodes a number A=01 … Z=26; digits 1-8 are the insured person's data;
@@ -10,39 +16,66 @@ from ..models import Finding, PiiType
 _KVNR_PATTERN = re.compile(r"\b[A-Z][0-9]{9}\b")
 
 
-def _kvnr_checksum_valid(raw: str) -> bool:
-    """Return True if the KVNR passes the § 290 SGB V modified-Luhn check."""
-    letter = raw[0]
-    letter_value = ord(letter) - ord("A") + 1  # A=1 … Z=26
+# Weights [1,2,1,2,...] over the first 10 of the 11 digits
+_WEIGHTS = [1, 2] * 5
+
+
+def _kvnr_digits(raw: str) -> str:
+    letter_value = ord(raw[0]) - ord("A") + 1  # A=1 … Z=26
     # Represent as two digits (A=01, J=10, Z=26)
-    digits_str = f"{letter_value:02d}" + raw[1:]
-    # digits_str is now 11 characters; apply weights [1,2,1,2,...] over first 10
-    weights = [1, 2] * 5  # 10 positions
+    return f"{letter_value:02d}" + raw[1:]
+
+
+def _digits_valid(digits_str: str) -> bool:
     total = 0
-    for ch, w in zip(digits_str[:10], weights):
+    for ch, w in zip(digits_str[:10], _WEIGHTS):
         product = int(ch) * w
         # Cross-sum: if product >= 10 sum its digits
         total += product // 10 + product % 10
     expected_check = total % 10
-    actual_check = int(raw[9])
+    # The last digit is the check digit
+    actual_check = int(digits_str[10])
     return expected_check == actual_check
 
 
-class KvnrDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _KVNR_PATTERN.finditer(text):
-            raw = match.group()
-            valid = _kvnr_checksum_valid(raw)
-            confidence = 0.95 if valid else 0.6
-            findings.append(
-                Finding(
-                    pii_type=PiiType.KVNR,
-                    start=match.start(),
-                    end=match.end(),
-                    text=raw,
-                    confidence=confidence,
-                    placeholder="",
-                )
-            )
-        return findings
+def _kvnr_checksum_valid(raw: str) -> bool:
+    """Return True if the KVNR passes the § 290 SGB V modified-Luhn check."""
+    return _digits_valid(_kvnr_digits(raw))
+
+
+def _kvnr_checksums_valid(raws: Sequence[str]) -> list[bool]:
+    """``_kvnr_checksum_valid`` for many KVNRs at once."""
+
+    def vectorised(digits: np.ndarray) -> list[bool]:
+        product = digits[:, :10] * _WEIGHTS
+        total = (product // 10 + product % 10).sum(axis=1)
+        return (total % 10 == digits[:, 10]).tolist()
+
+    digits = [_kvnr_digits(raw) for raw in raws]
+    return validate_batch(digits, _digits_valid, vectorised)
+
+
+class KvnrDetector(PatternDetector):
+    pii_type = PiiType.KVNR
+    patterns = (_KVNR_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return self._finding(match, _kvnr_checksum_valid(match.group()))
+
+    def from_matches(
+        self, matches: list[re.Match[str]], index: int
+    ) -> list[Finding | None]:
+        valid = _kvnr_checksums_valid([m.group() for m in matches])
+        return list(map(self._finding, matches, valid))
+
+    def _finding(self, match: re.Match[str], valid: bool) -> Finding | None:
+        raw = match.group()
+        confidence = 0.95 if valid else 0.6
+        return Finding(
+            pii_type=PiiType.KVNR,
+            start=match.start(),
+            end=match.end(),
+            text=raw,
+            confidence=confidence,
+            placeholder="",
+        )
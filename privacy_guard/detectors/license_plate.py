@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # German Kfz-Kennzeichen (vehicle registration plates).
@@ -24,39 +24,31 @@ def _valid_plate(district: str, letters: str, digits: str) -> bool:
     return 4 <= total <= 8
 
 
-class LicensePlateDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
+class LicensePlateDetector(PatternDetector):
+    pii_type = PiiType.LICENSE_PLATE
+    patterns = (_HYPHEN_PATTERN, _SPACE_PATTERN)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        district, letters, digits = match.group(1), match.group(2), match.group(3)
+        if not _valid_plate(district, letters, digits):
+            return None
 
-        for match in _HYPHEN_PATTERN.finditer(text):
-            district, letters, digits = match.group(1), match.group(2), match.group(3)
-            if _valid_plate(district, letters, digits):
-                findings.append(
-                    Finding(
-                        pii_type=PiiType.LICENSE_PLATE,
-                        start=match.start(),
-                        end=match.end(),
-                        text=match.group(),
-                        confidence=0.75,
-                        placeholder="",
-                    )
-                )
-
-        for match in _SPACE_PATTERN.finditer(text):
-            district, letters, digits = match.group(1), match.group(2), match.group(3)
-            if _valid_plate(district, letters, digits):
-                # Avoid double-reporting if already covered by hyphen pattern
-                start, end = match.start(), match.end()
-                if not any(f.start == start and f.end == end for f in findings):
-                    findings.append(
-                        Finding(
-                            pii_type=PiiType.LICENSE_PLATE,
-                            start=start,
-                            end=end,
-                            text=match.group(),
-                            confidence=0.65,
-                            placeholder="",
-                        )
-                    )
+        return Finding(
+            pii_type=PiiType.LICENSE_PLATE,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=0.75 if index == 0 else 0.65,
+            placeholder="",
+        )
 
+    def detect(self, text: str) -> list[Finding]:
+        findings: list[Finding] = []
+        seen: set[tuple[int, int]] = set()
+        # Avoid double-reporting if a space match is already covered by the
+        # hyphen pattern (in a full scan, _resolve_overlaps drops the duplicate)
+        for finding in super().detect(text):
+            if (finding.start, finding.end) not in seen:
+                seen.add((finding.start, finding.end))
+                findings.append(finding)
         return findings
@@ -1,24 +1,49 @@
 from __future__ import annotations
 import re
-import spacy
+from typing import TYPE_CHECKING
 from .base import BaseDetector
 from ..models import Finding, PiiType
 from ..whitelist import WhitelistManager
 
-# Titles that may appear before a name — matched greedily right before the entity span
-_TITLE_BEFORE = re.compile(
-    r"(?:(?:Herr|Frau|Dr\.?|Prof\.?|Mag\.?|DI|Ing\.?|Dipl\.?-?Ing\.?|"
+if TYPE_CHECKING:
+    import spacy
+    from spacy.tokens import Doc
+
+_TITLES = (
+    r"(?:Herr|Frau|Dr\.?|Prof\.?|Mag\.?|DI|Ing\.?|Dipl\.?-?Ing\.?|"
     r"ao\.?\s*Univ\.?-?Prof\.?|Univ\.?-?Prof\.?|Priv\.?-?Doz\.?|"
-    r"MSc|MBA|BSc|LL\.M)\.?\s+)+\Z",
-    re.IGNORECASE,
+    r"MSc|MBA|BSc|LL\.M)\.?\s+"
 )
 
+# Titles that may appear before a name — matched greedily right before the entity span
+_TITLE_BEFORE = re.compile(rf"(?:{_TITLES})+\Z", re.IGNORECASE)
+# Longest run of titles considered, e.g. "ao. Univ.-Prof. Dipl.-Ing. Dr. "
+_TITLE_LOOKBEHIND = 120
+
+# ── Candidate windows ─────────────────────────────────────────────────────────
+# NER only runs on sentences that could contain a name: a capitalised word
+# (any Unicode capital followed by a lowercase letter, also at the start of the
+# sentence), or a title cue. Code, JSON, numbers and lowercase-only passages
+# are skipped. Each selected sentence is widened by its
+# neighbours so abbreviations split off by the sentence heuristic ("Dr. | Weber
+# …") keep their context.
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\s*\n\s*")
+# Start of a word; str.istitle() decides whether it is capitalised, since re
+# has no Unicode uppercase class
+_WORD_START = re.compile(r"\b[^\W\d_]{2}")
+_TITLE_CUE = re.compile(rf"\b{_TITLES}", re.IGNORECASE)
+# Windows closer than this are merged into one document
+_MERGE_GAP = 64
+
 _nlp: spacy.language.Language | None = None
 
 
 def _get_nlp() -> spacy.language.Language:
     global _nlp
     if _nlp is None:
+        # Imported here so the gazetteer backend works without spaCy
+        import spacy
+
         try:
             # Disable pipeline components not needed for NER.
             # tok2vec must stay active because ner depends on its vectors.
@@ -44,34 +69,139 @@ def _get_nlp() -> spacy.language.Language:
     return _nlp
 
 
-def _expand_title(text: str, start: int) -> tuple[int, bool]:
+def _expand_title(
+    text: str, start: int, before: re.Pattern[str] = _TITLE_BEFORE
+) -> tuple[int, bool]:
     """Look backwards from start for an inline title (Dr., Prof., Herr, …).
     Returns (new_start, has_title)."""
-    prefix = text[:start]
-    m = _TITLE_BEFORE.search(prefix)
+    # Only the text right before the entity can hold titles; searching the
+    # whole prefix would make every entity cost O(len(text))
+    window_start = max(0, start - _TITLE_LOOKBEHIND)
+    m = before.search(text[window_start:start])
     if m:
-        return m.start(), True
+        return window_start + m.start(), True
     return start, False
 
 
+def _sentences(text: str) -> list[tuple[int, int]]:
+    spans: list[tuple[int, int]] = []
+    pos = 0
+    for m in _SENTENCE_BREAK.finditer(text):
+        if m.start() > pos:
+            spans.append((pos, m.start()))
+        pos = m.end()
+    if pos < len(text):
+        spans.append((pos, len(text)))
+    return spans
+
+
+def _has_candidate(text: str, start: int, end: int) -> bool:
+    sentence = text[start:end]
+    if sentence != sentence.lower():
+        for m in _WORD_START.finditer(sentence):
+            if m.group().istitle():
+                return True
+    return _TITLE_CUE.search(text, start, end) is not None
+
+
+def _candidate_windows(text: str) -> list[tuple[int, int]]:
+    """Return the (start, end) spans of text that NER has to look at."""
+    sentences = _sentences(text)
+    last = len(sentences) - 1
+    windows: list[tuple[int, int]] = []
+    for i, (start, end) in enumerate(sentences):
+        if not _has_candidate(text, start, end):
+            continue
+        start = sentences[max(i - 1, 0)][0]
+        end = sentences[min(i + 1, last)][1]
+        if windows and start - windows[-1][1] <= _MERGE_GAP:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    if len(windows) == 1:
+        start, end = windows[0]
+        if not text[:start].strip() and not text[end:].strip():
+            # Everything is a candidate — scan the text exactly as given
+            return [(0, len(text))]
+    return windows
+
+
 class NameDetector(BaseDetector):
-    def __init__(self, whitelist: WhitelistManager | None = None) -> None:
+    def __init__(
+        self,
+        whitelist: WhitelistManager | None = None,
+        candidate_windows: bool = True,
+    ) -> None:
+        """``candidate_windows=False`` runs NER over the whole text instead of
+        only the sentences that can contain a name."""
         self._whitelist = whitelist or WhitelistManager()
+        self._candidate_windows = candidate_windows
+
+    def load(self) -> None:
+        _get_nlp()
+
+    def _windows(self, text: str) -> list[tuple[int, int]]:
+        if not self._candidate_windows:
+            return [(0, len(text))]
+        return _candidate_windows(text)
+
+    def detect(
+        self, text: str, whitelist: WhitelistManager | None = None
+    ) -> list[Finding]:
+        """Detect names; ``whitelist`` replaces the detector's own for this call."""
+        if whitelist is None:
+            whitelist = self._whitelist
+        windows = self._windows(text)
+        if not windows:
+            return []
+        if windows == [(0, len(text))]:
+            return self._findings(text, _get_nlp()(text), whitelist)
+        docs = _get_nlp().pipe(text[start:end] for start, end in windows)
+        findings: list[Finding] = []
+        for (start, _), doc in zip(windows, docs):
+            findings.extend(self._findings(text, doc, whitelist, offset=start))
+        return findings
+
+    def detect_batch(
+        self,
+        texts: list[str],
+        batch_size: int = 64,
+        n_process: int = 1,
+        whitelist: WhitelistManager | None = None,
+    ) -> list[list[Finding]]:
+        # All candidate windows of all texts go through one nlp.pipe call
+        if whitelist is None:
+            whitelist = self._whitelist
+        windows = [
+            (i, start, end)
+            for i, t in enumerate(texts)
+            for start, end in self._windows(t)
+        ]
+        docs = _get_nlp().pipe(
+            (texts[i][start:end] for i, start, end in windows),
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+        results: list[list[Finding]] = [[] for _ in texts]
+        for (i, start, _), doc in zip(windows, docs):
+            results[i].extend(self._findings(texts[i], doc, whitelist, offset=start))
+        return results
 
-    def detect(self, text: str) -> list[Finding]:
-        nlp = _get_nlp()
-        doc = nlp(text)
+    def _findings(
+        self, text: str, doc: Doc, whitelist: WhitelistManager, offset: int = 0
+    ) -> list[Finding]:
+        """Name findings of doc, which covers text[offset:…]."""
         findings: list[Finding] = []
 
         for ent in doc.ents:
             if ent.label_ != "PER":
                 continue
 
-            start, has_title = _expand_title(text, ent.start_char)
-            end = ent.end_char
+            start, has_title = _expand_title(text, ent.start_char + offset)
+            end = ent.end_char + offset
             full_text = text[start:end]
 
-            if self._whitelist.is_whitelisted(full_text):
+            if whitelist.is_whitelisted(full_text):
                 continue
 
             findings.append(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # German document numbers: Personalausweis and Reisepass share the same format.
@@ -10,18 +10,16 @@ from ..models import Finding, PiiType
 _PERSONAL_ID_PATTERN = re.compile(r"\b[A-Z][A-Z0-9]{8}\b")
 
 
-class PersonalIdDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _PERSONAL_ID_PATTERN.finditer(text):
-            findings.append(
-                Finding(
-                    pii_type=PiiType.PERSONAL_ID,
-                    start=match.start(),
-                    end=match.end(),
-                    text=match.group(),
-                    confidence=0.75,
-                    placeholder="",
-                )
-            )
-        return findings
+class PersonalIdDetector(PatternDetector):
+    pii_type = PiiType.PERSONAL_ID
+    patterns = (_PERSONAL_ID_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return Finding(
+            pii_type=PiiType.PERSONAL_ID,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=0.75,
+            placeholder="",
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # Matches DACH phone numbers in international and national format.
@@ -33,24 +33,20 @@ def _digit_count(s: str) -> int:
     return sum(1 for c in s if c.isdigit())
 
 
-class PhoneDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
+class PhoneDetector(PatternDetector):
+    pii_type = PiiType.PHONE
+    patterns = (_PHONE_RE,)
 
-        for match in _PHONE_RE.finditer(text):
-            raw = match.group(0).rstrip()
-            if _digit_count(raw) < _MIN_DIGITS:
-                continue
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        raw = match.group(0).rstrip()
+        if _digit_count(raw) < _MIN_DIGITS:
+            return None
 
-            findings.append(
-                Finding(
-                    pii_type=PiiType.PHONE,
-                    start=match.start(),
-                    end=match.start() + len(raw),
-                    text=raw,
-                    confidence=1.0,
-                    placeholder="",
-                )
-            )
-
-        return findings
+        return Finding(
+            pii_type=PiiType.PHONE,
+            start=match.start(),
+            end=match.start() + len(raw),
+            text=raw,
+            confidence=1.0,
+            placeholder="",
+        )
@@ -1,20 +1,34 @@
 """Detect secrets (API keys, tokens, credentials) using regex rules.
 
 Rules are loaded from privacy_guard/data/secret_rules.toml, converted from
-the leakguard Rust scanner (/Users/adrian/Git/pyl/src/rules.rs).
+the leakguard Rust scanner (/Users/adrian/Git/pyl/src/rules.rs). They are
+compiled the first time a ``SecretDetector`` runs, not at import.
 
 Each rule specifies a secret_group: 0 means the full match is redacted;
 N > 0 means only that capture group is redacted (preserving surrounding context).
+
+Rules carry keywords — literals of which every match contains one. They are
+either declared in the TOML file or extracted from the pattern; a rule only
+runs when one of its keywords occurs in the text (see ``keywords.py``).
+
+Patterns with constructs that can backtrack catastrophically always run on
+bounded slices (see ``regex_audit.py``); the bundled rules are measured by the
+audit CLI and the tests, not at load time.
 """
 
 from __future__ import annotations
 
 import re
 import tomllib
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .base import BaseDetector
+from .base import PatternDetector
+from ..engine import PatternEngine
+from ..keywords import extract_keywords
 from ..models import Finding, PiiType
 
 _DATA_DIR = Path(__file__).parent.parent / "data"
@@ -27,6 +41,9 @@ _SEVERITY_CONFIDENCE: dict[str, float] = {
     "WARNING": 0.5,
 }
 
+# Most severe first
+SEVERITIES: tuple[str, ...] = tuple(_SEVERITY_CONFIDENCE)
+
 
 @dataclass(frozen=True)
 class _Rule:
@@ -36,6 +53,7 @@ class _Rule:
     secret_group: int
     severity: str
     tags: tuple[str, ...]
+    keywords: tuple[str, ...]  # case-folded; empty = always run
 
 
 def _load_rules() -> list[_Rule]:
@@ -47,51 +65,139 @@ def _load_rules() -> list[_Rule]:
         flags = re.UNICODE
         if r.get("multiline"):
             flags |= re.MULTILINE
+        pattern = re.compile(r["pattern"], flags)
+        declared = r.get("keywords")
         rules.append(
             _Rule(
                 id=r["id"],
                 description=r["description"],
-                pattern=re.compile(r["pattern"], flags),
+                pattern=pattern,
                 secret_group=r["secret_group"],
                 severity=r["severity"],
                 tags=tuple(r.get("tags", [])),
+                keywords=(
+                    tuple(k.casefold() for k in declared)
+                    if declared is not None
+                    else extract_keywords(pattern)
+                ),
             )
         )
     return rules
 
 
-_RULES: list[_Rule] = _load_rules()
+@lru_cache(maxsize=1)
+def _rules() -> list[_Rule]:
+    """The rules, loaded and compiled on first use."""
+    return _load_rules()
 
 
-class SecretDetector(BaseDetector):
-    """Detect secrets, credentials, and API keys using pattern-based rules."""
+_RuleSelection = tuple[tuple[str, ...] | None, str | None]
 
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-
-        for rule in _RULES:
-            for match in rule.pattern.finditer(text):
-                g = rule.secret_group
-                try:
-                    secret_text = match.group(g)
-                    start = match.start(g)
-                    end = match.end(g)
-                except IndexError:
-                    continue
-
-                if not secret_text:
-                    continue
-
-                findings.append(
-                    Finding(
-                        pii_type=PiiType.SECRET,
-                        start=start,
-                        end=end,
-                        text=secret_text,
-                        confidence=_SEVERITY_CONFIDENCE.get(rule.severity, 0.8),
-                        placeholder="",
-                        rule_id=rule.id,
-                    )
+
+@lru_cache(maxsize=None)
+def _select(selection: _RuleSelection) -> tuple[_Rule, ...]:
+    """Rules with one of the tags (None: any) and at least the severity."""
+    tags, min_severity = selection
+    severities = (
+        SEVERITIES[: SEVERITIES.index(min_severity) + 1] if min_severity else None
+    )
+    return tuple(
+        rule
+        for rule in _rules()
+        if (tags is None or any(tag in tags for tag in rule.tags))
+        and (severities is None or rule.severity in severities)
+    )
+
+
+@lru_cache(maxsize=None)
+def _matcher(selection: _RuleSelection) -> PatternEngine:
+    """Engine over the rules of one selection, shared by all its detectors."""
+    tags, min_severity = selection
+    return PatternEngine([SecretDetector(tags, min_severity)])
+
+
+if TYPE_CHECKING:
+    _RULES: list[_Rule]
+
+
+def __getattr__(name: str) -> object:
+    # ``_RULES`` used to be built at import time
+    if name == "_RULES":
+        return _rules()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SecretDetector(PatternDetector):
+    """Detect secrets, credentials, and API keys using pattern-based rules.
+
+    ``tags`` restricts the detector to rules carrying at least one of them
+    (e.g. ``["cloud", "token"]``) and ``min_severity`` to rules of that
+    severity or above (see ``SEVERITIES``); by default all rules run. Rules
+    outside the selection are never matched, so a narrow selection scans
+    faster.
+    """
+
+    pii_type = PiiType.SECRET
+
+    def __init__(
+        self, tags: Iterable[str] | None = None, min_severity: str | None = None
+    ) -> None:
+        selected_tags = None
+        if tags is not None:
+            selected_tags = tuple(sorted({t.strip().lower() for t in tags}))
+            unknown = set(selected_tags).difference(*(r.tags for r in _rules()))
+            if unknown:
+                raise ValueError(f"unknown secret rule tags: {sorted(unknown)}")
+        if min_severity is not None:
+            min_severity = min_severity.strip().upper()
+            if min_severity not in SEVERITIES:
+                raise ValueError(
+                    f"min_severity must be one of {SEVERITIES}, got {min_severity!r}"
                 )
+        self._selection: _RuleSelection = (selected_tags, min_severity)
+
+    @property
+    def selection(self) -> _RuleSelection:
+        """Selected tags (None: all) and minimum severity (None: all)."""
+        return self._selection
+
+    @property
+    def rule_ids(self) -> tuple[str, ...]:
+        """Ids of the rules this detector runs."""
+        return tuple(rule.id for rule in _select(self._selection))
 
-        return findings
+    @property
+    def patterns(self) -> tuple[re.Pattern[str], ...]:  # type: ignore[override]
+        return tuple(rule.pattern for rule in _select(self._selection))
+
+    def route_keywords(self, index: int) -> tuple[str, ...]:
+        return _select(self._selection)[index].keywords
+
+    def route_id(self, index: int) -> str | None:
+        return _select(self._selection)[index].id
+
+    def detect(self, text: str) -> list[Finding]:
+        return _matcher(self._selection).scan(text)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        rule = _select(self._selection)[index]
+        g = rule.secret_group
+        try:
+            secret_text = match.group(g)
+            start = match.start(g)
+            end = match.end(g)
+        except IndexError:
+            return None
+
+        if not secret_text:
+            return None
+
+        return Finding(
+            pii_type=PiiType.SECRET,
+            start=start,
+            end=end,
+            text=secret_text,
+            confidence=_SEVERITY_CONFIDENCE.get(rule.severity, 0.8),
+            placeholder="",
+            rule_id=rule.id,
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # German Rentenversicherungsnummer (Sozialversicherungsnummer / RVNR).
@@ -13,18 +13,16 @@ from ..models import Finding, PiiType
 _SVN_PATTERN = re.compile(r"\b\d{2}[ ]?\d{6}[ ]?[A-Z][ ]?\d{3}\b")
 
 
-class SocialSecurityDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _SVN_PATTERN.finditer(text):
-            findings.append(
-                Finding(
-                    pii_type=PiiType.SOCIAL_SECURITY,
-                    start=match.start(),
-                    end=match.end(),
-                    text=match.group(),
-                    confidence=0.9,
-                    placeholder="",
-                )
-            )
-        return findings
+class SocialSecurityDetector(PatternDetector):
+    pii_type = PiiType.SOCIAL_SECURITY
+    patterns = (_SVN_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return Finding(
+            pii_type=PiiType.SOCIAL_SECURITY,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=0.9,
+            placeholder="",
+        )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from .base import PatternDetector
+from ..checksums import validate_batch
 from ..models import Finding, PiiType
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # German Steueridentifikationsnummer (IdNr): 11 digits.
 # Rules: first digit 1–9; grouped as 2-3-3-3 (with optional single space between groups).
 # Examples: "12 345 678 903" (formatted), "12345678903" (raw)
@@ -28,32 +34,71 @@ def _tax_id_check_digit(digits: str) -> int | None:
     return check
 
 
+def _tax_id_check_digits(values: Sequence[str]) -> list[int | None]:
+    """``_tax_id_check_digit`` for many 11-digit strings at once."""
+
+    def vectorised(digits: np.ndarray) -> list[int | None]:
+        product = digits[:, 0] * 0 + 10
+        for column in digits.T[:10]:
+            total = (product + column) % 10
+            total += 10 * (total == 0)
+            product = total * 2 % 11
+        # product 1 means check digit 10 (invalid); 11 becomes 0
+        invalid = (product == 1) | (digits[:, 0] == 0)
+        checks = ((11 - product) % 11).tolist()
+        return [None if bad else check for check, bad in zip(checks, invalid.tolist())]
+
+    return validate_batch(values, _tax_id_check_digit, vectorised)
+
+
+def _well_formed(digits: str) -> bool:
+    return len(digits) == 11 and digits[0] != "0"
+
+
+def _confidence(digits: str, expected: int | None) -> float | None:
+    if expected is None:
+        return None  # structurally invalid number → skip
+    return 1.0 if int(digits[10]) == expected else 0.6
+
+
 def _validate_tax_id(raw: str) -> float | None:
     """Return confidence (1.0 or 0.6), or None if the format is wrong."""
     digits = raw.replace(" ", "")
-    if len(digits) != 11 or digits[0] == "0":
+    if not _well_formed(digits):
         return None
-    expected = _tax_id_check_digit(digits)
-    if expected is None:
-        return None  # structurally invalid number → skip
-    return 1.0 if int(digits[10]) == expected else 0.6
+    return _confidence(digits, _tax_id_check_digit(digits))
+
+
+def _validate_tax_id_batch(raws: Sequence[str]) -> list[float | None]:
+    """``_validate_tax_id`` for many candidates at once."""
+    digits = [raw.replace(" ", "") for raw in raws]
+    expected = iter(_tax_id_check_digits([d for d in digits if _well_formed(d)]))
+    return [_confidence(d, next(expected)) if _well_formed(d) else None for d in digits]
+
+
+class TaxIdDetector(PatternDetector):
+    pii_type = PiiType.TAX_ID
+    patterns = (_TAX_ID_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return self._finding(match, _validate_tax_id(match.group()))
 
+    def from_matches(
+        self, matches: list[re.Match[str]], index: int
+    ) -> list[Finding | None]:
+        confidences = _validate_tax_id_batch([m.group() for m in matches])
+        return list(map(self._finding, matches, confidences))
 
-class TaxIdDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _TAX_ID_PATTERN.finditer(text):
-            confidence = _validate_tax_id(match.group())
-            if confidence is None:
-                continue
-            findings.append(
-                Finding(
-                    pii_type=PiiType.TAX_ID,
-                    start=match.start(),
-                    end=match.end(),
-                    text=match.group(),
-                    confidence=confidence,
-                    placeholder="",
-                )
-            )
-        return findings
+    def _finding(
+        self, match: re.Match[str], confidence: float | None
+    ) -> Finding | None:
+        if confidence is None:
+            return None
+        return Finding(
+            pii_type=PiiType.TAX_ID,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=confidence,
+            placeholder="",
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # URL query-parameter secrets: detect key=value pairs where the key is a known
@@ -20,21 +20,16 @@ _URL_SECRET_PATTERN = re.compile(
 )
 
 
-class UrlSecretDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _URL_SECRET_PATTERN.finditer(text):
-            value = match.group(1)
-            start = match.start(1)
-            end = match.end(1)
-            findings.append(
-                Finding(
-                    pii_type=PiiType.URL_SECRET,
-                    start=start,
-                    end=end,
-                    text=value,
-                    confidence=0.85,
-                    placeholder="",
-                )
-            )
-        return findings
+class UrlSecretDetector(PatternDetector):
+    pii_type = PiiType.URL_SECRET
+    patterns = (_URL_SECRET_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        return Finding(
+            pii_type=PiiType.URL_SECRET,
+            start=match.start(1),
+            end=match.end(1),
+            text=match.group(1),
+            confidence=0.85,
+            placeholder="",
+        )
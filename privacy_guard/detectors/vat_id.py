@@ -1,6 +1,6 @@
 from __future__ import annotations
 import re
-from .base import BaseDetector
+from .base import PatternDetector
 from ..models import Finding, PiiType
 
 # German Umsatzsteuer-Identifikationsnummer (USt-IdNr).
@@ -15,19 +15,18 @@ def _validate_vat_id(raw: str) -> bool:
     return len(digits) == 11 and digits[:2] == "DE" and digits[2:].isdigit()
 
 
-class VatIdDetector(BaseDetector):
-    def detect(self, text: str) -> list[Finding]:
-        findings: list[Finding] = []
-        for match in _VAT_ID_PATTERN.finditer(text):
-            if _validate_vat_id(match.group()):
-                findings.append(
-                    Finding(
-                        pii_type=PiiType.VAT_ID,
-                        start=match.start(),
-                        end=match.end(),
-                        text=match.group(),
-                        confidence=0.85,
-                        placeholder="",
-                    )
-                )
-        return findings
+class VatIdDetector(PatternDetector):
+    pii_type = PiiType.VAT_ID
+    patterns = (_VAT_ID_PATTERN,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        if not _validate_vat_id(match.group()):
+            return None
+        return Finding(
+            pii_type=PiiType.VAT_ID,
+            start=match.start(),
+            end=match.end(),
+            text=match.group(),
+            confidence=0.85,
+            placeholder="",
+        )
@@ -0,0 +1,634 @@
+"""Shared multi-pattern engine for the regex-based detectors.
+
+Every ``PatternDetector`` contributes its compiled patterns as *routes*. The
+engine runs all routes of all registered detectors for one text and hands each
+raw match back to the owning detector for validation (checksums, context
+windows, capture-group selection, …).
+
+Python's ``re`` cannot report the matches of several independent patterns in a
+single pass: an alternation only yields the leftmost alternative at each
+position and is measurably slower than running its members one by one. The
+engine therefore makes the pass over the input shared instead:
+
+* the text's alphabet (its set of distinct characters) is computed once;
+* every pattern is analysed once for the character classes that *any* match
+  must contain (``@`` for e-mails, a digit for IBANs, ``=`` for key/value
+  rules, …);
+* a route only runs when all of its required classes occur in the alphabet.
+  Gates are shared between routes, so each distinct class is tested once per
+  scan regardless of how many rules depend on it;
+* routes with literal keywords (see ``keywords.py``) additionally require one
+  of them to occur. All keywords of all routes are found in a single pass;
+* routes whose matches can only consist of digits, capital letters and
+  separators (IBANs, tax ids, phone numbers, …) search just the runs of such
+  characters, found once per scan, instead of the whole text (when several
+  routes share them; a single detector's engine searches the whole text).
+
+All prefilters are exact: a skipped route or text region could not have
+matched.
+
+With a ``RegexGuard`` the routes run on bounded slices of the text under a
+time budget, so a crafted input cannot hold a worker indefinitely (see there).
+Patterns that ``regex_audit`` finds suspicious always run on bounded slices.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import string
+import time
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from re import _constants as _sre  # type: ignore[attr-defined]
+from re import _parser as _sre_parse  # type: ignore[attr-defined]
+from typing import TYPE_CHECKING
+
+from .checksums import MIN_BATCH
+from .keywords import KeywordIndex
+from .models import Finding, PiiType
+from .profiling import ScanProfile, TimingStats
+
+if TYPE_CHECKING:
+    from .detectors.base import PatternDetector
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT, _sre.POSSESSIVE_REPEAT)
+
+_CATEGORIES: dict[object, str] = {
+    _sre.CATEGORY_DIGIT: r"\d",
+    _sre.CATEGORY_NOT_DIGIT: r"\D",
+    _sre.CATEGORY_SPACE: r"\s",
+    _sre.CATEGORY_NOT_SPACE: r"\S",
+    _sre.CATEGORY_WORD: r"\w",
+    _sre.CATEGORY_NOT_WORD: r"\W",
+}
+
+# Characters used to rate how selective a gate is, with letters weighted as the
+# most common characters in prose. A class scoring more than _MAX_GATE_SPREAD
+# (e.g. \w, \S, letter ranges) is present in virtually every text and not
+# worth testing.
+_SAMPLE_CHARS = (
+    "".join(chr(c) for c in range(32, 127))
+    + "äöüÄÖÜß\t\n"
+    + (string.ascii_letters + "äöüß ") * 3
+)
+_MAX_GATE_SPREAD = 40
+
+
+def _class_source(items: list[tuple[object, object]]) -> str | None:
+    """Return the inner source of a ``[...]`` class, or None if unsupported."""
+    parts: list[str] = []
+    for op, av in items:
+        if op is _sre.LITERAL:
+            parts.append(re.escape(chr(av)))  # type: ignore[arg-type]
+        elif op is _sre.RANGE:
+            lo, hi = av  # type: ignore[misc]
+            parts.append(f"{re.escape(chr(lo))}-{re.escape(chr(hi))}")
+        elif op is _sre.CATEGORY and av in _CATEGORIES:
+            parts.append(_CATEGORIES[av])
+        else:
+            # NEGATE and exotic members cannot be unioned safely
+            return None
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _compile_gate(source: str, flags: int) -> re.Pattern[str]:
+    return re.compile(f"[{source}]", flags)
+
+
+def _spread(source: str, flags: int) -> int:
+    return len(_compile_gate(source, flags).findall(_SAMPLE_CHARS))
+
+
+def _required(items: list[tuple[object, object]], flags: int) -> list[str]:
+    """Character classes that every match of the item sequence must contain."""
+    out: list[str] = []
+    for op, av in items:
+        if op is _sre.LITERAL:
+            out.append(re.escape(chr(av)))  # type: ignore[arg-type]
+        elif op is _sre.IN:
+            source = _class_source(av)  # type: ignore[arg-type]
+            if source:
+                out.append(source)
+        elif op in _REPEATS:
+            lo, _hi, sub = av  # type: ignore[misc]
+            if lo >= 1:
+                out.extend(_required(sub, flags))
+        elif op is _sre.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av  # type: ignore[misc]
+            # Scoped flag changes would alter the class semantics — skip them
+            if not add_flags and not del_flags:
+                out.extend(_required(sub, flags))
+        elif op is _sre.ATOMIC_GROUP:
+            out.extend(_required(av, flags))  # type: ignore[arg-type]
+        elif op is _sre.BRANCH:
+            # Each alternative must contribute; the gate is the union of the
+            # most selective class of every alternative.
+            alternatives = [_required(alt, flags) for alt in av[1]]  # type: ignore[index]
+            if alternatives and all(alternatives):
+                out.append(
+                    "".join(
+                        min(alt, key=lambda src: _spread(src, flags))
+                        for alt in alternatives
+                    )
+                )
+    return out
+
+
+@lru_cache(maxsize=None)
+def required_gates(pattern: re.Pattern[str]) -> tuple[re.Pattern[str], ...]:
+    """Return single-character gates that must all occur in any matching text.
+
+    The most selective gates come first. An empty tuple means the pattern
+    cannot be gated and always runs.
+    """
+    parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    # Inline global flags such as (?i) end up in the parser state
+    flags = parsed.state.flags & (re.IGNORECASE | re.ASCII)
+
+    scored: dict[str, tuple[int, re.Pattern[str]]] = {}
+    for source in _required(parsed.data, flags):
+        if source in scored:
+            continue
+        spread = _spread(source, flags)
+        if spread <= _MAX_GATE_SPREAD:
+            scored[source] = (spread, _compile_gate(source, flags))
+    return tuple(gate for _, gate in sorted(scored.values(), key=lambda s: s[0]))
+
+
+# ── Candidate windows ─────────────────────────────────────────────────────────
+# Most identifiers (IBANs, tax ids, phone and card numbers, …) consist only of
+# digits, capital letters and the separators of their spaced groupings. One
+# pass per text finds the runs of these characters that contain a digit or a
+# capital letter; routes that can only match such characters search those runs
+# instead of the whole text.
+_TOKEN = r"\dA-Z\s()/+\-"
+_TOKEN_ANCHOR = r"\dA-Z"
+_TOKEN_SEPARATOR = r"\s()/+\-"
+# Lookaheads of windowed routes may read this far past the end of a run
+_WINDOW_LOOKAHEAD = 16
+# Runs closer than this are searched as one window
+_WINDOW_GAP = 64
+
+
+def _is_token_anchor(char: str) -> bool:
+    return char.isdecimal() or "A" <= char <= "Z"
+
+
+def _is_token(char: str) -> bool:
+    return _is_token_anchor(char) or char.isspace() or char in "()/+-"
+
+
+def _class_within(
+    items: list[tuple[object, object]],
+    predicate: Callable[[str], bool],
+    categories: tuple[object, ...],
+) -> bool:
+    """True if every character of a ``[...]`` class satisfies predicate."""
+    for op, av in items:
+        if op is _sre.LITERAL:
+            if not predicate(chr(av)):  # type: ignore[arg-type]
+                return False
+        elif op is _sre.RANGE:
+            lo, hi = av  # type: ignore[misc]
+            if hi - lo > 256 or not all(map(predicate, map(chr, range(lo, hi + 1)))):
+                return False
+        elif op is not _sre.CATEGORY or av not in categories:
+            return False
+    return True
+
+
+def _within_tokens(items: list[tuple[object, object]]) -> bool:
+    """True if every character any match consumes is a token character and no
+    lookahead reads further than ``_WINDOW_LOOKAHEAD``."""
+    for op, av in items:
+        if op is _sre.LITERAL:
+            if not _is_token(chr(av)):  # type: ignore[arg-type]
+                return False
+        elif op is _sre.IN:
+            categories = (_sre.CATEGORY_DIGIT, _sre.CATEGORY_SPACE)
+            if not _class_within(av, _is_token, categories):  # type: ignore[arg-type]
+                return False
+        elif op in _REPEATS:
+            if not _within_tokens(av[2]):  # type: ignore[index]
+                return False
+        elif op is _sre.SUBPATTERN:
+            _group, add_flags, _del_flags, sub = av  # type: ignore[misc]
+            if add_flags & re.IGNORECASE or not _within_tokens(sub):
+                return False
+        elif op is _sre.ATOMIC_GROUP:
+            if not _within_tokens(av):  # type: ignore[arg-type]
+                return False
+        elif op is _sre.BRANCH:
+            if not all(_within_tokens(alt) for alt in av[1]):  # type: ignore[index]
+                return False
+        elif op in (_sre.ASSERT, _sre.ASSERT_NOT):
+            direction, sub = av  # type: ignore[misc]
+            # Look-behinds see the real text before a window's start
+            if direction > 0 and sub.getwidth()[1] >= _WINDOW_LOOKAHEAD:
+                return False
+        elif op is not _sre.AT:
+            return False
+    return True
+
+
+def _needs_anchor(items: list[tuple[object, object]]) -> bool:
+    """True if every match contains a digit or a capital letter."""
+    for op, av in items:
+        if op is _sre.LITERAL and _is_token_anchor(chr(av)):  # type: ignore[arg-type]
+            return True
+        if op is _sre.IN and _class_within(
+            av,  # type: ignore[arg-type]
+            _is_token_anchor,
+            (_sre.CATEGORY_DIGIT,),
+        ):
+            return True
+        if op in _REPEATS and av[0] >= 1 and _needs_anchor(av[2]):  # type: ignore[index]
+            return True
+        if op is _sre.SUBPATTERN and _needs_anchor(av[3]):  # type: ignore[index]
+            return True
+        if op is _sre.ATOMIC_GROUP and _needs_anchor(av):  # type: ignore[arg-type]
+            return True
+        if op is _sre.BRANCH and all(_needs_anchor(alt) for alt in av[1]):  # type: ignore[index]
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def token_window_width(pattern: re.Pattern[str]) -> int | None:
+    """Shortest match if every match lies inside a run of token characters
+    containing a digit or capital letter, else None (the route searches the
+    whole text)."""
+    parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    if not _within_tokens(parsed.data) or not _needs_anchor(parsed.data):
+        return None
+    return parsed.getwidth()[0]
+
+
+@lru_cache(maxsize=None)
+def _token_runs(min_width: int) -> re.Pattern[str]:
+    # Only tried where a run starts, so long separator runs stay linear
+    return re.compile(
+        rf"(?<![{_TOKEN}])(?=[{_TOKEN}]{{{min_width}}})"
+        rf"(?:[{_TOKEN_SEPARATOR}]*[{_TOKEN_ANCHOR}])+[{_TOKEN_SEPARATOR}]*"
+    )
+
+
+def token_windows(text: str, min_width: int = 1) -> list[tuple[int, int]]:
+    """Spans of text containing every run of at least min_width token
+    characters with a digit or capital letter; close runs are merged."""
+    windows: list[tuple[int, int]] = []
+    for match in _token_runs(min_width).finditer(text):
+        start, end = match.span()
+        if windows and start - windows[-1][1] <= _WINDOW_GAP:
+            windows[-1] = (windows[-1][0], end)
+        else:
+            windows.append((start, end))
+    return windows
+
+
+@dataclass(frozen=True)
+class RegexGuard:
+    """Limits for running the patterns on untrusted text.
+
+    Python's ``re`` cannot be interrupted, so a pattern that backtracks badly
+    can hold a worker for minutes on a crafted input. Under a guard each route
+    runs slice by slice: a regex call never sees more than ``slice_chars``
+    plus ``overlap`` characters, which bounds its worst case, and matches that
+    cross a cut are still found whole as long as they are shorter than
+    ``overlap`` (longer ones may be cut short at the end of a slice, or
+    missed). Between slices and matches the route's time is compared with its
+    budget: ``budget`` seconds per text plus ``budget_per_char`` seconds per
+    character, so long benign texts are not cut off. A route over budget is
+    stopped for that text, keeps the findings it already has and is reported
+    in ``ScanResult.budget_exceeded``; the rest of the text is not scanned
+    for it, so callers must treat such a result as incomplete.
+    """
+
+    budget: float = 0.1
+    slice_chars: int = 4096
+    overlap: int = 1024
+    budget_per_char: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.slice_chars < 1 or self.overlap < 0:
+            raise ValueError("slice_chars must be positive and overlap >= 0")
+        if self.budget_per_char < 0:
+            raise ValueError("budget_per_char must be >= 0")
+
+    def budget_for(self, chars: int) -> float:
+        """Seconds a route may spend on a text of ``chars`` characters."""
+        return self.budget + self.budget_per_char * chars
+
+
+# Slicing without a time limit, for suspicious patterns when no guard is set
+_SLICED = RegexGuard(budget=math.inf)
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+def _sliced_finditer(
+    pattern: re.Pattern[str],
+    text: str,
+    guard: RegexGuard,
+    deadline: float,
+    pos: int = 0,
+    endpos: int | None = None,
+) -> Iterator[re.Match[str]]:
+    """``pattern.finditer(text, pos, endpos)`` on bounded slices, raising
+    ``_BudgetExceeded`` once ``deadline`` has passed."""
+    n = len(text) if endpos is None else endpos
+    while pos < n:
+        end = min(pos + guard.slice_chars + guard.overlap, n)
+        # Matches starting in the overlap are left to the next slice
+        limit = pos + guard.slice_chars if end < n else n
+        next_pos = limit
+        # pos/endpos keep look-behinds and ^ working on the whole text
+        for match in pattern.finditer(text, pos, end):
+            if match.start() >= limit:
+                break
+            if match.end() == end < n and match.start() > pos:
+                # Might extend past the slice: scan it again from its start
+                next_pos = match.start()
+                break
+            # A match filling the whole slice is cut off here
+            next_pos = max(limit, match.end())
+            yield match
+            if time.perf_counter() > deadline:
+                raise _BudgetExceeded
+        if time.perf_counter() > deadline:
+            raise _BudgetExceeded
+        pos = max(next_pos, pos + 1)
+
+
+def _window_finditer(
+    pattern: re.Pattern[str],
+    text: str,
+    windows: Iterable[tuple[int, int]],
+    guard: RegexGuard | None,
+    deadline: float,
+) -> Iterator[re.Match[str]]:
+    """Matches of pattern inside the windows, in order."""
+    n = len(text)
+    for start, end in windows:
+        # Past the end of the window for lookaheads; a match cannot reach
+        # there, one starting there belongs to the next window
+        endpos = min(end + _WINDOW_LOOKAHEAD, n)
+        if guard is None:
+            matches = pattern.finditer(text, start, endpos)
+        else:
+            matches = _sliced_finditer(pattern, text, guard, deadline, start, endpos)
+        for match in matches:
+            if match.start() >= end:
+                break
+            yield match
+
+
+@dataclass(frozen=True)
+class _Route:
+    detector: PatternDetector
+    index: int
+    pattern: re.Pattern[str]
+    gates: tuple[re.Pattern[str], ...]
+    keywords: tuple[str, ...]
+    rule_id: str | None
+    sliced: bool  # always run on bounded slices
+    window_width: int | None  # shortest match; None: search the whole text
+
+    @property
+    def name(self) -> str:
+        return self.rule_id or self.detector.pii_type.value
+
+
+def _validate(route: _Route, matches: list[re.Match[str]]) -> list[Finding | None]:
+    """Findings (or None) for the matches of route; batch validation only
+    pays off for many matches."""
+    if len(matches) < MIN_BATCH:
+        return [route.detector.from_match(match, route.index) for match in matches]
+    return route.detector.from_matches(matches, route.index)
+
+
+# Engines with at most this many distinct gates test them on the text directly
+_FEW_GATES = 4
+# Token windows are only used when at least this many routes share them
+_MIN_WINDOWED_ROUTES = 2
+
+
+class PatternEngine:
+    """Run the patterns of several ``PatternDetector`` instances over one text."""
+
+    def __init__(
+        self, detectors: Iterable[PatternDetector], guard: RegexGuard | None = None
+    ) -> None:
+        # Imported here so the package does not load the audit module, which
+        # also runs as a script (python -m privacy_guard.regex_audit)
+        from .regex_audit import static_issues
+
+        self._guard = guard
+        self._routes: list[_Route] = [
+            _Route(
+                detector=detector,
+                index=index,
+                pattern=pattern,
+                gates=required_gates(pattern),
+                keywords=detector.route_keywords(index),
+                rule_id=detector.route_id(index),
+                sliced=bool(static_issues(pattern)),
+                window_width=token_window_width(pattern),
+            )
+            for detector in detectors
+            for index, pattern in enumerate(detector.patterns)
+        ]
+        self._keywords = KeywordIndex(k for r in self._routes for k in r.keywords)
+        widths = [r.window_width for r in self._routes if r.window_width is not None]
+        if len(widths) < _MIN_WINDOWED_ROUTES:
+            # Finding the windows costs a pass over the text of its own
+            self._routes = [replace(r, window_width=None) for r in self._routes]
+            widths = []
+        self._window_width = min(widths, default=0)
+        # With a handful of gates, searching the text itself is cheaper than
+        # building its alphabet first (a single detector's engine)
+        gates = {gate for route in self._routes for gate in route.gates}
+        self._gates_on_text = len(gates) <= _FEW_GATES
+
+    @property
+    def pii_types(self) -> set[PiiType]:
+        return {route.detector.pii_type for route in self._routes}
+
+    def _matches(
+        self,
+        text: str,
+        enabled: Container[PiiType] | None,
+        profile: ScanProfile | None,
+        exceeded: set[str] | None,
+    ) -> Iterator[tuple[int, list[re.Match[str]], float]]:
+        """Raw matches of every route that runs on text, in route order, as
+        (route number, matches, seconds spent matching). Without a profile,
+        routes may be left out when they have no matches."""
+        alphabet = text if self._gates_on_text else "".join(set(text))
+        gate_hits: dict[re.Pattern[str], bool] = {}
+        present: set[str] | None = None  # keywords found, computed on first use
+        windows: list[tuple[int, int]] | None = None  # likewise
+        prefilter_hits: dict[int, bool] = {}
+
+        for number, route in enumerate(self._routes):
+            detector = route.detector
+            if enabled is not None and detector.pii_type not in enabled:
+                continue
+            if profile is not None:
+                profile.detectors.setdefault(detector.pii_type, TimingStats())
+
+            passed = True
+            for gate in route.gates:
+                hit = gate_hits.get(gate)
+                if hit is None:
+                    hit = gate_hits[gate] = gate.search(alphabet) is not None
+                if not hit:
+                    passed = False
+                    break
+            if not passed:
+                continue
+
+            if route.keywords:
+                if present is None:
+                    present = self._keywords.find(text)
+                if present.isdisjoint(route.keywords):
+                    continue
+
+            if detector.prefilter is not None:
+                key = id(detector)
+                hit = prefilter_hits.get(key)
+                if hit is None:
+                    hit = prefilter_hits[key] = (
+                        detector.prefilter.search(text) is not None
+                    )
+                if not hit:
+                    continue
+
+            route_windows: list[tuple[int, int]] | None = None
+            if route.window_width is not None:
+                if windows is None:
+                    windows = token_windows(text, self._window_width)
+                route_windows = [
+                    (start, end)
+                    for start, end in windows
+                    if end - start >= route.window_width
+                ]
+                if not route_windows:
+                    continue
+
+            guard = self._guard or (_SLICED if route.sliced else None)
+            if guard is None and profile is None:
+                if route_windows is None:
+                    matches = list(route.pattern.finditer(text))
+                else:
+                    matches = list(
+                        _window_finditer(route.pattern, text, route_windows, None, 0.0)
+                    )
+                if matches:
+                    yield number, matches, 0.0
+                continue
+
+            route_started = time.perf_counter()
+            deadline = route_started + (guard.budget_for(len(text)) if guard else 0.0)
+            if route_windows is not None:
+                iterator = _window_finditer(
+                    route.pattern, text, route_windows, guard, deadline
+                )
+            elif guard is None:
+                iterator = route.pattern.finditer(text)
+            else:
+                iterator = _sliced_finditer(route.pattern, text, guard, deadline)
+            matches = []
+            try:
+                for match in iterator:
+                    matches.append(match)
+            except _BudgetExceeded:
+                if exceeded is not None:
+                    exceeded.add(route.name)
+            yield number, matches, time.perf_counter() - route_started
+
+    def scan(
+        self,
+        text: str,
+        enabled: Container[PiiType] | None = None,
+        profile: ScanProfile | None = None,
+        exceeded: set[str] | None = None,
+    ) -> list[Finding]:
+        """Return the validated findings of all (enabled) routes, in route order.
+
+        With ``profile`` given, time and match counts of every route that runs
+        are recorded there; the remaining time is booked as ``prefilter``.
+        Under a guard, routes stopped for exceeding their budget are added to
+        ``exceeded`` by rule id (or PII type).
+        """
+        started = time.perf_counter()
+        findings: list[Finding] = []
+        in_routes = 0.0  # profiling only
+
+        for number, matches, seconds in self._matches(text, enabled, profile, exceeded):
+            route = self._routes[number]
+            validation_started = time.perf_counter()
+            found = [
+                finding for finding in _validate(route, matches) if finding is not None
+            ]
+            findings.extend(found)
+            if profile is None:
+                continue
+            seconds += time.perf_counter() - validation_started
+            in_routes += seconds
+            profile.record(
+                route.detector.pii_type,
+                seconds,
+                len(matches),
+                len(found),
+                rule_id=route.rule_id,
+            )
+
+        if profile is not None:
+            elapsed = time.perf_counter() - started
+            profile.phases["prefilter"] = (
+                profile.phases.get("prefilter", 0.0) + elapsed - in_routes
+            )
+        return findings
+
+    def scan_batch(
+        self,
+        texts: Sequence[str],
+        enabled: Container[PiiType] | None = None,
+        exceeded: Sequence[set[str]] | None = None,
+    ) -> list[list[Finding]]:
+        """``scan`` for several texts at once.
+
+        The matches of each route in all texts are validated in one call
+        (see ``PatternDetector.from_matches``), so checksum validators see
+        whole batches. ``exceeded`` holds one set per text.
+        """
+        pending: dict[int, list[tuple[int, list[re.Match[str]]]]] = {}
+        for i, text in enumerate(texts):
+            stopped = exceeded[i] if exceeded is not None else None
+            for number, matches, _ in self._matches(text, enabled, None, stopped):
+                if matches:
+                    pending.setdefault(number, []).append((i, matches))
+
+        results: list[list[Finding]] = [[] for _ in texts]
+        for number in sorted(pending):
+            route = self._routes[number]
+            batch = pending[number]
+            found = iter(
+                _validate(route, [match for _, matches in batch for match in matches])
+            )
+            for i, matches in batch:
+                results[i].extend(
+                    finding
+                    for finding in islice(found, len(matches))
+                    if finding is not None
+                )
+        return results
@@ -0,0 +1,235 @@
+"""Literal-keyword prefilter for pattern routes.
+
+Most secret rules have a fixed literal anchor (``ghp_``, ``AKIA``, ``xox``,
+``-----BEGIN``, …). ``extract_keywords`` derives such a set of literals from a
+compiled pattern: every match of the pattern contains at least one of them.
+``KeywordIndex`` finds all keywords present in a text in one pass, so the
+engine only runs the patterns whose keywords actually occur.
+
+Keywords and texts are compared case-folded, which keeps the prefilter exact
+for both case-sensitive and ``(?i)`` patterns.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import product
+from re import _constants as _sre  # type: ignore[attr-defined]
+from re import _parser as _sre_parse  # type: ignore[attr-defined]
+
+# Keywords shorter than this occur in almost every text
+_MIN_KEYWORD_LEN = 3
+# Upper bound for the number of literals a single keyword set may expand to
+_MAX_EXPANSION = 64
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT, _sre.POSSESSIVE_REPEAT)
+
+_Items = list[tuple[object, object]]
+
+
+def _finite(items: _Items) -> set[str] | None:
+    """All strings the item sequence can match, or None if unbounded or too many."""
+    strings: set[str] = {""}
+    for op, av in items:
+        options = _finite_item(op, av)
+        if options is None:
+            return None
+        strings = {a + b for a, b in product(strings, options)}
+        if len(strings) > _MAX_EXPANSION:
+            return None
+    return strings
+
+
+def _finite_item(op: object, av: object) -> set[str] | None:
+    if op is _sre.LITERAL:
+        return {chr(av)}  # type: ignore[arg-type]
+    if op is _sre.IN:
+        chars: set[str] = set()
+        for member_op, member_av in av:  # type: ignore[attr-defined]
+            if member_op is _sre.LITERAL:
+                chars.add(chr(member_av))
+            elif member_op is _sre.RANGE and member_av[1] - member_av[0] < 10:
+                chars.update(chr(c) for c in range(member_av[0], member_av[1] + 1))
+            else:
+                return None
+        return chars
+    if op is _sre.SUBPATTERN:
+        _group, add_flags, del_flags, sub = av  # type: ignore[misc]
+        return None if add_flags or del_flags else _finite(sub)
+    if op is _sre.BRANCH:
+        strings: set[str] = set()
+        for alternative in av[1]:  # type: ignore[index]
+            options = _finite(alternative)
+            if options is None:
+                return None
+            strings |= options
+        return strings if len(strings) <= _MAX_EXPANSION else None
+    if op in _REPEATS:
+        lo, hi, sub = av  # type: ignore[misc]
+        options = _finite(sub)
+        if lo != hi or options is None or len(options) ** lo > _MAX_EXPANSION:
+            return None
+        return {"".join(combo) for combo in product(options, repeat=lo)}
+    return None
+
+
+def _leading(op: object, av: object) -> set[str] | None:
+    """Fixed literal prefixes of a group or alternation (its finite leading items)."""
+    if op is _sre.SUBPATTERN:
+        _group, add_flags, del_flags, sub = av  # type: ignore[misc]
+        return None if add_flags or del_flags else _leading_seq(sub)
+    if op is _sre.BRANCH:
+        strings: set[str] = set()
+        for alternative in av[1]:  # type: ignore[index]
+            options = _leading_seq(alternative)
+            if options is None:
+                return None
+            strings |= options
+        return strings if len(strings) <= _MAX_EXPANSION else None
+    return None
+
+
+def _leading_seq(items: _Items) -> set[str] | None:
+    strings: set[str] = {""}
+    for op, av in items:
+        options = _finite_item(op, av)
+        if options is None:
+            leading = _leading(op, av)
+            if leading is not None:
+                joined = {a + b for a, b in product(strings, leading)}
+                if len(joined) <= _MAX_EXPANSION:
+                    return joined
+            return strings
+        joined = {a + b for a, b in product(strings, options)}
+        if len(joined) > _MAX_EXPANSION:
+            return strings
+        strings = joined
+    return strings
+
+
+def _score(keywords: frozenset[str]) -> tuple[int, int]:
+    return min(len(k) for k in keywords), -len(keywords)
+
+
+def _best(candidates: list[frozenset[str]]) -> frozenset[str] | None:
+    usable = [c for c in candidates if c and min(len(k) for k in c) >= _MIN_KEYWORD_LEN]
+    return max(usable, key=_score) if usable else None
+
+
+def _keyword_sets(items: _Items) -> list[frozenset[str]]:
+    """Candidate keyword sets: every match of the sequence contains one member of each."""
+    candidates: list[frozenset[str]] = []
+    run: set[str] = {""}
+
+    def close_run() -> None:
+        nonlocal run
+        if run != {""}:
+            candidates.append(frozenset(s.casefold() for s in run))
+        run = {""}
+
+    for op, av in items:
+        options = _finite_item(op, av)
+        if options is not None and "" not in options:
+            joined = {a + b for a, b in product(run, options)}
+            if len(joined) <= _MAX_EXPANSION:
+                run = joined
+                continue
+        if options is None:
+            # A group or alternation with fixed leading literals still extends
+            # the current run, e.g. AKIA|A3T[A-Z0-9] → {"akia", "a3t"}
+            leading = _leading(op, av)
+            if leading and "" not in leading:
+                joined = {a + b for a, b in product(run, leading)}
+                if len(joined) <= _MAX_EXPANSION:
+                    run = joined
+        close_run()
+        if options is not None and "" not in options:
+            run = options
+            continue
+        # Not a fixed literal — look for mandatory literals inside it
+        if op is _sre.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av  # type: ignore[misc]
+            if not add_flags and not del_flags:
+                candidates.extend(_keyword_sets(sub))
+        elif op is _sre.ATOMIC_GROUP:
+            candidates.extend(_keyword_sets(av))  # type: ignore[arg-type]
+        elif op in _REPEATS and av[0] >= 1:  # type: ignore[index]
+            candidates.extend(_keyword_sets(av[2]))  # type: ignore[index]
+        elif op is _sre.BRANCH:
+            per_alternative = [_best(_keyword_sets(alt)) for alt in av[1]]  # type: ignore[index]
+            if per_alternative and all(per_alternative):
+                candidates.append(frozenset().union(*per_alternative))  # type: ignore[arg-type]
+    close_run()
+    return candidates
+
+
+@lru_cache(maxsize=None)
+def extract_keywords(pattern: re.Pattern[str]) -> tuple[str, ...]:
+    """Return case-folded literals of which every match contains at least one.
+
+    An empty tuple means no usable anchor was found and the pattern must
+    always run.
+    """
+    parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    best = _best(_keyword_sets(parsed.data))
+    return tuple(sorted(best)) if best else ()
+
+
+def _trie_source(keywords: Iterable[str]) -> str:
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        alternatives = [
+            re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not alternatives:
+            return ""
+        body = (
+            alternatives[0]
+            if len(alternatives) == 1
+            else "(?:" + "|".join(alternatives) + ")"
+        )
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordIndex:
+    """Find which of a fixed set of keywords occur in a text, in one pass.
+
+    The keywords are compiled into a trie-shaped regex (one branch per
+    character, like an Aho-Corasick goto function) wrapped in a lookahead, so
+    every start position is visited once and overlapping keywords are not
+    lost. Each hit also implies all keywords that are prefixes of it.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._keywords = sorted({k.casefold() for k in keywords if k})
+        self._pattern = (
+            re.compile(f"(?=({_trie_source(self._keywords)}))")
+            if self._keywords
+            else None
+        )
+        self._prefixes: dict[str, tuple[str, ...]] = {
+            k: tuple(p for p in self._keywords if k.startswith(p))
+            for k in self._keywords
+        }
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    def find(self, text: str) -> set[str]:
+        """Return the keywords occurring in text (compared case-folded)."""
+        if self._pattern is None:
+            return set()
+        found: set[str] = set()
+        for hit in set(self._pattern.findall(text.casefold())):
+            found.update(self._prefixes[hit])
+        return found
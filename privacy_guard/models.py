@@ -1,6 +1,11 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING
+from .restore import StreamingRestorer, restore_placeholders
+
+if TYPE_CHECKING:
+    from .profiling import ScanProfile
 
 
 class PiiType(str, Enum):
@@ -21,7 +26,7 @@ class PiiType(str, Enum):
     DRIVER_LICENSE = "DRIVER_LICENSE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     pii_type: PiiType
     start: int
@@ -37,14 +42,99 @@ class Finding:
 
 @dataclass
 class ScanResult:
+    """Result of a scan.
+
+    Results built by the scanner keep the detector findings and their
+    placeholders side by side; ``anonymised_text`` and the numbered
+    ``findings`` are only assembled on first access (in one pass each). They
+    are still ordinary fields: assigning them, ``dataclasses.replace`` and
+    ``dataclasses.asdict`` work as on any dataclass.
+    """
+
     original_text: str
     anonymised_text: str
     findings: list[Finding]
     mapping: dict[str, str]  # placeholder -> original
+    # ScanProfile when the scanner profiles, else None
+    profile: ScanProfile | None = field(default=None, compare=False, repr=False)
+    # Rules stopped by the RegexGuard, sorted
+    budget_exceeded: list[str] = field(default_factory=list, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Only results built by from_spans assemble text and findings lazily
+        self._spans: list[Finding] = []
+        self._placeholders: list[str] = []
+
+    @classmethod
+    def from_spans(
+        cls,
+        original_text: str,
+        spans: list[Finding],
+        placeholders: list[str],
+        mapping: dict[str, str],
+    ) -> ScanResult:
+        """Build a lazy result from sorted, non-overlapping findings and the
+        placeholder assigned to each of them."""
+        result = cls.__new__(cls)
+        result.original_text = original_text
+        result.mapping = mapping
+        result.profile = None
+        result.budget_exceeded = []
+        result._anonymised_text = None
+        result._findings = None
+        result._spans = spans
+        result._placeholders = placeholders
+        return result
+
+    def _get_anonymised_text(self) -> str:
+        if self._anonymised_text is None:
+            text = self.original_text
+            parts: list[str] = []
+            pos = 0
+            for span, placeholder in zip(self._spans, self._placeholders):
+                parts.append(text[pos : span.start])
+                parts.append(placeholder)
+                pos = span.end
+            parts.append(text[pos:])
+            self._anonymised_text = "".join(parts)
+        return self._anonymised_text
+
+    def _set_anonymised_text(self, value: str) -> None:
+        self._anonymised_text: str | None = value
+
+    def _get_findings(self) -> list[Finding]:
+        if self._findings is None:
+            self._findings = [
+                Finding(
+                    pii_type=span.pii_type,
+                    start=span.start,
+                    end=span.end,
+                    text=span.text,
+                    confidence=span.confidence,
+                    placeholder=placeholder,
+                    rule_id=span.rule_id,
+                )
+                for span, placeholder in zip(self._spans, self._placeholders)
+            ]
+        return self._findings
+
+    def _set_findings(self, value: list[Finding]) -> None:
+        self._findings: list[Finding] | None = value
 
     def restore(self, text: str) -> str:
         """Replace placeholders in text with their original values."""
-        result = text
-        for placeholder, original in self.mapping.items():
-            result = result.replace(placeholder, original)
-        return result
+        return restore_placeholders(text, self.mapping)
+
+    def restorer(self) -> StreamingRestorer:
+        """Return a restorer for chunked (streamed) text, e.g. LLM output."""
+        return StreamingRestorer(self.mapping)
+
+
+# Installed after @dataclass has collected the fields, so both stay fields
+# (in __init__, fields(), asdict, replace) while being computed on first access
+ScanResult.anonymised_text = property(  # type: ignore[assignment]
+    ScanResult._get_anonymised_text, ScanResult._set_anonymised_text
+)
+ScanResult.findings = property(  # type: ignore[assignment]
+    ScanResult._get_findings, ScanResult._set_findings
+)
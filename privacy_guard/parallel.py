@@ -0,0 +1,182 @@
+"""Process-pool scanning for large corpora.
+
+A single ``PrivacyScanner`` is bound to one core by the GIL. ``ParallelScanner``
+spreads documents over a pool of worker processes. Every worker builds its own
+scanner once at start-up (loading the spaCy model and compiling the rules) and
+then scans chunks of documents with ``scan_batch``, so neither model loading
+nor per-task setup is paid per document.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from multiprocessing.context import BaseContext
+from types import TracebackType
+
+from .models import PiiType, ScanResult
+from .scanner import NameBackend, PrivacyScanner
+
+
+@dataclass(frozen=True)
+class _WorkerConfig:
+    extra_whitelist_names: list[str] = field(default_factory=list)
+    disabled: frozenset[PiiType] = frozenset()
+    batch_size: int = 64
+    name_backend: NameBackend = "spacy"
+    secret_tags: tuple[str, ...] | None = None
+    secret_min_severity: str | None = None
+
+
+_worker_scanner: PrivacyScanner | None = None
+_worker_batch_size = 64
+
+
+def _init_worker(config: _WorkerConfig) -> None:
+    """Build and warm up the per-process scanner."""
+    global _worker_scanner, _worker_batch_size
+    scanner = PrivacyScanner(
+        extra_whitelist_names=config.extra_whitelist_names,
+        name_backend=config.name_backend,
+        secret_tags=config.secret_tags,
+        secret_min_severity=config.secret_min_severity,
+    )
+    for pii_type in config.disabled:
+        scanner.disable_detector(pii_type)
+    # Load the spaCy model now rather than inside the first task
+    scanner.warm_up()
+    _worker_scanner = scanner
+    _worker_batch_size = config.batch_size
+
+
+def _scan_chunk(texts: list[str]) -> list[ScanResult]:
+    assert _worker_scanner is not None, "worker not initialised"
+    return _worker_scanner.scan_batch(texts, batch_size=_worker_batch_size)
+
+
+class ParallelScanner:
+    """Scan documents on a pool of pre-warmed worker processes.
+
+    Documents are sent in chunks of ``chunk_size``; at most ``max_in_flight``
+    chunks are queued or buffered at any time, so memory stays bounded even
+    for unbounded input iterators. Use as a context manager or call
+    ``close()`` to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        chunk_size: int = 64,
+        max_in_flight: int | None = None,
+        extra_whitelist_names: list[str] | None = None,
+        disabled: Iterable[PiiType] = (),
+        batch_size: int = 64,
+        mp_context: BaseContext | None = None,
+        name_backend: NameBackend = "spacy",
+        secret_tags: Iterable[str] | None = None,
+        secret_min_severity: str | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._processes = processes or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._max_in_flight = max(1, max_in_flight or 2 * self._processes)
+        self._config = _WorkerConfig(
+            extra_whitelist_names=list(extra_whitelist_names or []),
+            disabled=frozenset(disabled),
+            batch_size=batch_size,
+            name_backend=name_backend,
+            secret_tags=tuple(secret_tags) if secret_tags is not None else None,
+            secret_min_severity=secret_min_severity,
+        )
+        self._mp_context = mp_context
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._processes,
+                mp_context=self._mp_context,
+                initializer=_init_worker,
+                initargs=(self._config,),
+            )
+        return self._pool
+
+    def scan_many(
+        self, texts: Iterable[str], ordered: bool = True
+    ) -> Iterator[ScanResult]:
+        """Yield one ``ScanResult`` per text.
+
+        With ``ordered=True`` results come back in input order; otherwise
+        chunks are yielded as soon as they finish (texts within a chunk keep
+        their order).
+        """
+        pool = self._get_pool()
+        source = iter(texts)
+        pending: dict[Future[list[ScanResult]], int] = {}
+        finished: dict[int, list[ScanResult]] = {}  # ordered mode only
+        submitted = 0
+        next_to_yield = 0
+
+        def submit() -> bool:
+            nonlocal submitted
+            chunk = list(islice(source, self._chunk_size))
+            if not chunk:
+                return False
+            pending[pool.submit(_scan_chunk, chunk)] = submitted
+            submitted += 1
+            return True
+
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) + len(finished) < self._max_in_flight:
+                exhausted = not submit()
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number = pending.pop(future)
+                if ordered:
+                    finished[number] = future.result()
+                else:
+                    yield from future.result()
+
+            while next_to_yield in finished:
+                yield from finished.pop(next_to_yield)
+                next_to_yield += 1
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self) -> ParallelScanner:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def scan_many(
+    texts: Iterable[str],
+    processes: int | None = None,
+    ordered: bool = True,
+    chunk_size: int = 64,
+    **options: object,
+) -> Iterator[ScanResult]:
+    """Scan texts on a temporary ``ParallelScanner`` (see its arguments)."""
+    with ParallelScanner(
+        processes=processes,
+        chunk_size=chunk_size,
+        **options,  # type: ignore[arg-type]
+    ) as scanner:
+        yield from scanner.scan_many(texts, ordered=ordered)
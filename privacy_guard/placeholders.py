@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from .models import Finding
+
+
+class PlaceholderMap:
+    """Assigns ``[TYPE_n]`` placeholders to findings.
+
+    Numbering is per PII type in the order findings are assigned; the same
+    original text always gets the same placeholder. One map can be shared by
+    several scans (e.g. the windows of a stream) to keep numbering consistent.
+    """
+
+    def __init__(self) -> None:
+        self._by_text: dict[str, str] = {}
+        self._mapping: dict[str, str] = {}  # placeholder -> original
+        self._counters: dict[str, int] = {}
+
+    def placeholder_for(self, finding: Finding) -> str:
+        placeholder = self._by_text.get(finding.text)
+        if placeholder is None:
+            key = finding.pii_type.value
+            self._counters[key] = self._counters.get(key, 0) + 1
+            placeholder = f"[{key}_{self._counters[key]}]"
+            self._by_text[finding.text] = placeholder
+            self._mapping[placeholder] = finding.text
+        return placeholder
+
+    def assign(self, finding: Finding, offset: int = 0) -> Finding:
+        """Return a copy of finding with its placeholder set and positions shifted."""
+        return replace(
+            finding,
+            start=finding.start + offset,
+            end=finding.end + offset,
+            placeholder=self.placeholder_for(finding),
+        )
+
+    @property
+    def mapping(self) -> dict[str, str]:
+        """Placeholder → original text."""
+        return dict(self._mapping)
@@ -0,0 +1,63 @@
+"""Opt-in timing data for a single scan.
+
+Enable with ``PrivacyScanner(profile=True)`` (or by passing ``profile_hook``);
+every ``ScanResult`` then carries a ``ScanProfile`` in ``result.profile``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .models import PiiType
+
+
+@dataclass
+class TimingStats:
+    seconds: float = 0.0
+    matches: int = 0  # raw regex matches / model entities
+    findings: int = 0  # matches that passed validation
+
+    def add(self, seconds: float, matches: int, findings: int) -> None:
+        self.seconds += seconds
+        self.matches += matches
+        self.findings += findings
+
+
+@dataclass
+class ScanProfile:
+    """Where the time of one scan went.
+
+    ``detectors`` covers every enabled detector (zero if all its patterns
+    were skipped by the prefilters), ``rules`` the individual rules of the
+    SecretDetector by rule id. ``phases`` holds the shared work outside the
+    detectors: ``prefilter`` (alphabet gates and keyword pass), ``overlaps``
+    and ``render`` (building the anonymised text and numbered findings).
+    """
+
+    detectors: dict[PiiType, TimingStats] = field(default_factory=dict)
+    rules: dict[str, TimingStats] = field(default_factory=dict)
+    phases: dict[str, float] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    def record(
+        self,
+        pii_type: PiiType,
+        seconds: float,
+        matches: int,
+        findings: int,
+        rule_id: str | None = None,
+    ) -> None:
+        self.detectors.setdefault(pii_type, TimingStats()).add(
+            seconds, matches, findings
+        )
+        if rule_id is not None:
+            self.rules.setdefault(rule_id, TimingStats()).add(
+                seconds, matches, findings
+            )
+
+    def slowest_rules(self, n: int = 10) -> list[tuple[str, TimingStats]]:
+        return sorted(self.rules.items(), key=lambda r: r[1].seconds, reverse=True)[:n]
+
+
+ProfileHook = Callable[[ScanProfile], None]
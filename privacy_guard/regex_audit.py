@@ -0,0 +1,525 @@
+"""Find regex rules that can backtrack catastrophically.
+
+Two checks, both usable on any compiled pattern:
+
+* ``static_issues`` walks the parsed pattern for the constructs behind
+  exponential backtracking: a repetition inside an unbounded repetition that
+  can split the same input in several ways (``(a+)+``, ``(\\w+\\s?)+``),
+  alternatives inside an unbounded repetition that can start with the same
+  character (``(a|ab)*``), and unbounded wildcards inside a repetition
+  (``(.*,)+``). Such constructs are often harmless in practice, so they
+  are only a reason to look closer.
+* ``measure_growth`` runs the pattern against generated adversarial inputs of
+  growing length (pumped characters of its repetitions after a prefix that
+  reaches them) and estimates how the worst-case time grows: ~1 is linear,
+  ~2 quadratic, and a pass that blows up on a short input is exponential.
+
+Only the static check runs when rules are loaded: it is deterministic and
+cheap, and patterns with issues always run on bounded slices (see
+``RegexGuard``). Measuring takes time and depends on the machine, so it is
+left to ``python -m privacy_guard.regex_audit``, which measures every pattern
+of the bundled rules (or of a rule file given with ``--rules``) and exits with
+status 1 if a rule should be rejected, and to the test suite.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import re
+import string
+import sys
+import time
+import tomllib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from re import _constants as _sre  # type: ignore[attr-defined]
+from re import _parser as _sre_parse  # type: ignore[attr-defined]
+from typing import Literal
+
+_Items = list[tuple[object, object]]
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT)
+# Repetitions above this count behave like unbounded ones for backtracking
+_LARGE_REPEAT = 32
+
+# Characters the analysis reasons about: enough to tell classes apart
+_ALPHABET = string.printable + "\x00äöüßÄÖÜé"
+
+Verdict = Literal["ok", "downgrade", "reject"]
+
+
+@dataclass(frozen=True)
+class Issue:
+    kind: str  # "nested-quantifier", "overlapping-alternation", "wildcard-in-repeat"
+    detail: str
+
+
+# ── Static analysis ───────────────────────────────────────────────────────────
+
+
+def _category_chars(category: object) -> frozenset[str]:
+    source = {
+        _sre.CATEGORY_DIGIT: r"\d",
+        _sre.CATEGORY_NOT_DIGIT: r"\D",
+        _sre.CATEGORY_SPACE: r"\s",
+        _sre.CATEGORY_NOT_SPACE: r"\S",
+        _sre.CATEGORY_WORD: r"\w",
+        _sre.CATEGORY_NOT_WORD: r"\W",
+    }.get(category)
+    if source is None:
+        return frozenset(_ALPHABET)
+    return frozenset(re.findall(source, _ALPHABET))
+
+
+def _fold(chars: Iterable[str], flags: int) -> frozenset[str]:
+    if not flags & re.IGNORECASE:
+        return frozenset(chars)
+    return frozenset(c for ch in chars for c in (ch.lower(), ch.upper()))
+
+
+def _class_chars(op: object, av: object, flags: int) -> frozenset[str] | None:
+    """Characters a single-character node matches, or None for other nodes."""
+    if op is _sre.LITERAL:
+        return _fold(chr(av), flags)  # type: ignore[arg-type]
+    if op is _sre.NOT_LITERAL:
+        return frozenset(_ALPHABET) - _fold(chr(av), flags)  # type: ignore[arg-type]
+    if op is _sre.ANY:
+        return frozenset(
+            _ALPHABET if flags & re.DOTALL else _ALPHABET.replace("\n", "")
+        )
+    if op is _sre.IN:
+        chars: set[str] = set()
+        negate = False
+        for member_op, member_av in av:  # type: ignore[attr-defined]
+            if member_op is _sre.NEGATE:
+                negate = True
+            elif member_op is _sre.LITERAL:
+                chars.add(chr(member_av))
+            elif member_op is _sre.RANGE:
+                lo, hi = member_av
+                chars.update(c for c in _ALPHABET if lo <= ord(c) <= hi)
+            elif member_op is _sre.CATEGORY:
+                chars |= _category_chars(member_av)
+            else:
+                chars.update(_ALPHABET)
+        folded = _fold(chars, flags)
+        return frozenset(_ALPHABET) - folded if negate else folded
+    return None
+
+
+def _children(op: object, av: object) -> list[_Items]:
+    """Item sequences nested in a node (group bodies, branches, repeats)."""
+    if op is _sre.SUBPATTERN:
+        return [av[3]]  # type: ignore[index]
+    if op is _sre.ATOMIC_GROUP:
+        return [av]  # type: ignore[list-item]
+    if op is _sre.BRANCH:
+        return list(av[1])  # type: ignore[index]
+    if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+        return [av[2]]  # type: ignore[index]
+    if op in (_sre.ASSERT, _sre.ASSERT_NOT):
+        return [av[1]]  # type: ignore[index]
+    return []
+
+
+def _min_len(items: _Items) -> int:
+    total = 0
+    for op, av in items:
+        if _class_chars(op, av, 0) is not None:
+            total += 1
+        elif op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            total += av[0] * _min_len(av[2])  # type: ignore[index,operator]
+        elif op is _sre.BRANCH:
+            total += min(_min_len(alt) for alt in av[1])  # type: ignore[index]
+        elif op in (_sre.SUBPATTERN, _sre.ATOMIC_GROUP):
+            total += _min_len(_children(op, av)[0])
+    return total
+
+
+def _first(items: _Items, flags: int) -> frozenset[str]:
+    """Characters a match of the sequence can start with."""
+    out: set[str] = set()
+    for op, av in items:
+        chars = _class_chars(op, av, flags)
+        if chars is not None:
+            return frozenset(out | chars)
+        if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            out |= _first(av[2], flags)  # type: ignore[index]
+            if av[0]:  # type: ignore[index]
+                return frozenset(out)
+            continue
+        if op is _sre.BRANCH:
+            for alt in av[1]:  # type: ignore[index]
+                out |= _first(alt, flags)
+            if _min_len([(op, av)]):
+                return frozenset(out)
+            continue
+        if op in (_sre.SUBPATTERN, _sre.ATOMIC_GROUP):
+            sub = _children(op, av)[0]
+            out |= _first(sub, flags)
+            if _min_len(sub):
+                return frozenset(out)
+        # Assertions, anchors and back references consume nothing we track
+    return frozenset(out)
+
+
+def _chars(items: _Items, flags: int) -> frozenset[str]:
+    """Every character the sequence can consume."""
+    out: set[str] = set()
+    for op, av in items:
+        chars = _class_chars(op, av, flags)
+        if chars is not None:
+            out |= chars
+        elif op not in (_sre.ASSERT, _sre.ASSERT_NOT):
+            for child in _children(op, av):
+                out |= _chars(child, flags)
+    return frozenset(out)
+
+
+def _unbounded(av: object) -> bool:
+    hi = av[1]  # type: ignore[index]
+    return hi is _sre.MAXREPEAT or hi > _LARGE_REPEAT  # type: ignore[operator]
+
+
+def _flatten(items: _Items) -> _Items:
+    """Inline plain groups so siblings inside and outside them line up."""
+    out: _Items = []
+    for op, av in items:
+        if op is _sre.SUBPATTERN:
+            out.extend(_flatten(av[3]))  # type: ignore[index]
+        else:
+            out.append((op, av))
+    return out
+
+
+def _walk(items: _Items, flags: int, issues: list[Issue], in_repeat: bool) -> None:
+    for op, av in items:
+        if op is _sre.ATOMIC_GROUP or op is _sre.POSSESSIVE_REPEAT:
+            # Never backtracks into its body
+            for child in _children(op, av):
+                _walk(child, flags, issues, False)
+            continue
+        if op in _REPEATS and _unbounded(av):
+            body = av[2]  # type: ignore[index]
+            _check_repeat_body(body, flags, issues)
+            _walk(body, flags, issues, True)
+            continue
+        if op is _sre.BRANCH and in_repeat:
+            _check_alternatives(av[1], flags, issues)  # type: ignore[index]
+        child_flags = flags
+        if op is _sre.SUBPATTERN:
+            _, add_flags, del_flags, _sub = av  # type: ignore[misc]
+            child_flags = (flags | add_flags) & ~del_flags
+        for child in _children(op, av):
+            _walk(child, child_flags, issues, in_repeat)
+
+
+def _check_repeat_body(body: _Items, flags: int, issues: list[Issue]) -> None:
+    """Issues of an unbounded repetition's body."""
+    items = _flatten(body)
+    for index, (op, av) in enumerate(items):
+        if op not in _REPEATS or not _unbounded(av):
+            continue
+        inner = _chars(av[2], flags)  # type: ignore[index]
+        rest = items[index + 1 :]
+        # What may follow the inner repetition: the rest of the body, or the
+        # next iteration of the outer one if the rest can be empty
+        following = _first(rest, flags)
+        if not _min_len(rest):
+            following |= _first(items, flags)
+        if inner & following:
+            issues.append(
+                Issue(
+                    "nested-quantifier",
+                    "a repetition inside an unbounded repetition can split "
+                    "the same input in many ways",
+                )
+            )
+            return
+        if inner >= frozenset(_ALPHABET.replace("\n", "")):
+            issues.append(
+                Issue(
+                    "wildcard-in-repeat",
+                    "an unbounded wildcard inside a repetition",
+                )
+            )
+            return
+
+
+def _check_alternatives(
+    alternatives: list[_Items], flags: int, issues: list[Issue]
+) -> None:
+    seen: set[str] = set()
+    for alt in alternatives:
+        first = _first(alt, flags)
+        if seen & first:
+            issues.append(
+                Issue(
+                    "overlapping-alternation",
+                    "alternatives inside a repetition start with the same character",
+                )
+            )
+            return
+        seen |= first
+
+
+@lru_cache(maxsize=None)
+def static_issues(pattern: re.Pattern[str]) -> tuple[Issue, ...]:
+    """Constructs in pattern that can make backtracking explode."""
+    parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    issues: list[Issue] = []
+    _walk(parsed.data, parsed.state.flags, issues, False)
+    return tuple(dict.fromkeys(issues))
+
+
+# ── Measured growth ────────────────────────────────────────────────────────────
+
+
+def _sample(chars: frozenset[str]) -> str:
+    """A representative character, preferring letters over digits over the rest."""
+    for group in (string.ascii_lowercase, string.ascii_uppercase, string.digits):
+        for c in group:
+            if c in chars:
+                return c
+    return min(chars) if chars else ""
+
+
+def _witness(items: _Items, flags: int) -> str:
+    """A short string the sequence matches (best effort)."""
+    out: list[str] = []
+    for op, av in items:
+        chars = _class_chars(op, av, flags)
+        if chars is not None:
+            out.append(_sample(chars))
+        elif op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            out.append(_witness(av[2], flags) * av[0])  # type: ignore[index,operator]
+        elif op is _sre.BRANCH:
+            out.append(_witness(av[1][0], flags))  # type: ignore[index]
+        elif op in (_sre.SUBPATTERN, _sre.ATOMIC_GROUP):
+            out.append(_witness(_children(op, av)[0], flags))
+    return "".join(out)
+
+
+def _repeats(
+    items: _Items, flags: int, prefix: str = ""
+) -> Iterator[tuple[str, frozenset[str]]]:
+    """(prefix reaching it, characters it consumes) per unbounded repetition."""
+    for op, av in items:
+        if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+            if _unbounded(av):
+                yield prefix, _chars(av[2], flags)  # type: ignore[index]
+            yield from _repeats(av[2], flags, prefix)  # type: ignore[index]
+        elif op is _sre.BRANCH:
+            for alt in av[1]:  # type: ignore[index]
+                yield from _repeats(alt, flags, prefix)
+        elif op in (_sre.SUBPATTERN, _sre.ATOMIC_GROUP):
+            yield from _repeats(_children(op, av)[0], flags, prefix)
+        prefix += _witness([(op, av)], flags)
+
+
+def adversarial_inputs(
+    pattern: re.Pattern[str], max_pumps: int = 24
+) -> list[tuple[str, str]]:
+    """(prefix, pump) pairs: texts ``prefix + pump * k + "\\x00"`` stress the
+    repetitions of pattern. A pump is one or two characters the repetitions
+    accept — e.g. ``"a."`` for patterns whose word boundaries and dots
+    interleave."""
+    parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+    flags = parsed.state.flags
+    found = list(_repeats(parsed.data, flags))
+    samples: list[str] = []
+    for _, chars in found:
+        for group in (
+            string.ascii_lowercase,
+            string.ascii_uppercase,
+            string.digits,
+            string.punctuation,
+            " ",
+        ):
+            hits = sorted(c for c in group if c in chars)
+            # All punctuation (each one may interact), one of everything else
+            samples.extend(hits if group is string.punctuation else hits[:1])
+    samples = list(dict.fromkeys(samples))
+    pumps = samples + [a + b for a in samples for b in samples if a != b]
+
+    inputs: list[tuple[str, str]] = []
+    for prefix in dict.fromkeys(p for p, _ in found):
+        for pump in pumps:
+            inputs.append((prefix, pump))
+    # Spread the budget over the prefixes
+    step = max(1, len(inputs) // max_pumps)
+    return inputs[::step][:max_pumps]
+
+
+def _timed(pattern: re.Pattern[str], text: str) -> float:
+    """Seconds for a full finditer pass."""
+    started = time.perf_counter()
+    for _ in pattern.finditer(text):
+        pass
+    return time.perf_counter() - started
+
+
+@dataclass
+class Growth:
+    exponent: float  # time ~ length ** exponent on the worst input
+    seconds: float  # time on the longest worst input
+    length: int
+    sample: str  # prefix + pump of the worst input, for the report
+    # Over the limit on a short input: exponential
+    exploded: bool = False
+
+
+# Pump lengths: fine steps first, so exponential patterns are caught while a
+# pass still takes milliseconds, then doubling
+_SHORT_LENGTHS = tuple(range(8, 64, 4))
+_EXPLOSION_LENGTH = 256
+
+
+def _lengths(max_length: int) -> Iterator[int]:
+    yield from _SHORT_LENGTHS
+    length = 64
+    while length <= max_length:
+        yield length
+        length *= 2
+
+
+def measure_growth(
+    pattern: re.Pattern[str],
+    max_length: int = 4096,
+    limit: float = 0.05,
+) -> Growth:
+    """Estimate how the time of ``pattern`` grows with adversarial input length.
+
+    Every generated input is lengthened up to ``max_length`` characters or
+    until one pass takes longer than ``limit`` seconds. Hitting the limit
+    within a few hundred characters means exponential growth (``exploded``).
+    The fine steps at short lengths stop an exponential pattern soon after
+    it passes the limit, before a pass can run away.
+    """
+    worst = Growth(1.0, 0.0, 0, "")
+    for prefix, pump in adversarial_inputs(pattern):
+        times: list[tuple[int, float]] = []
+        for length in _lengths(max_length):
+            text = prefix + pump * (length // len(pump)) + "\x00"
+            seconds = min(_timed(pattern, text) for _ in range(2))
+            times.append((len(text), seconds))
+            if seconds > limit:
+                break
+        n2, t2 = times[-1]
+        if t2 > limit and n2 <= len(prefix) + _EXPLOSION_LENGTH:
+            return Growth(math.inf, t2, n2, prefix + pump, True)
+        # Compare with the last length at most half as long
+        n1, t1 = next((n, t) for n, t in reversed(times) if 2 * n <= n2 + 1)
+        # Below ~0.1 ms the timer noise dominates; treat it as linear
+        exponent = math.log(t2 / t1) / math.log(n2 / n1) if t2 > 1e-4 else 1.0
+        if (exponent, t2) > (worst.exponent, worst.seconds):
+            worst = Growth(exponent, t2, n2, prefix + pump)
+    return worst
+
+
+# ── Reports and CLI ────────────────────────────────────────────────────────────
+
+# Measured growth at or above this exponent counts as superlinear
+SUPERLINEAR = 1.6
+
+
+@dataclass
+class Report:
+    name: str
+    pattern: re.Pattern[str]
+    issues: tuple[Issue, ...]
+    growth: Growth | None = None
+
+    @property
+    def verdict(self) -> Verdict:
+        if self.growth is not None and self.growth.exploded:
+            return "reject"
+        if self.issues or (
+            self.growth is not None and self.growth.exponent >= SUPERLINEAR
+        ):
+            return "downgrade"
+        return "ok"
+
+
+def audit(name: str, pattern: re.Pattern[str], dynamic: bool = True) -> Report:
+    """Static issues and, with ``dynamic``, measured growth of pattern."""
+    report = Report(name, pattern, static_issues(pattern))
+    if dynamic:
+        report.growth = measure_growth(pattern)
+    return report
+
+
+def _rule_patterns(path: Path) -> Iterator[tuple[str, re.Pattern[str]]]:
+    with path.open("rb") as fh:
+        data = tomllib.load(fh)
+    for rule in data["rules"]:
+        flags = re.MULTILINE if rule.get("multiline") else 0
+        yield rule["id"], re.compile(rule["pattern"], flags)
+
+
+def _builtin_patterns() -> Iterator[tuple[str, re.Pattern[str]]]:
+    from .scanner import PrivacyScanner
+
+    from .detectors.base import PatternDetector
+
+    for detector in PrivacyScanner()._detectors.values():
+        if not isinstance(detector, PatternDetector):
+            continue
+        if detector.pii_type.value == "SECRET":
+            continue
+        for index, pattern in enumerate(detector.patterns):
+            suffix = f"[{index}]" if len(detector.patterns) > 1 else ""
+            yield f"{detector.pii_type.value}{suffix}", pattern
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m privacy_guard.regex_audit",
+        description="Check regex rules for catastrophic backtracking",
+    )
+    parser.add_argument(
+        "--rules",
+        type=Path,
+        help="Secret rule file to check (default: the bundled rules and detectors)",
+    )
+    parser.add_argument(
+        "--static-only", action="store_true", help="Skip the timing runs"
+    )
+    args = parser.parse_args(argv)
+
+    if args.rules is not None:
+        patterns = list(_rule_patterns(args.rules))
+    else:
+        from .detectors.secret import _DATA_DIR
+
+        patterns = list(_rule_patterns(_DATA_DIR / "secret_rules.toml"))
+        patterns += list(_builtin_patterns())
+
+    rejected = 0
+    for name, pattern in patterns:
+        report = audit(name, pattern, dynamic=not args.static_only)
+        if report.verdict == "reject":
+            rejected += 1
+        if report.verdict == "ok":
+            continue
+        line = f"{report.verdict.upper():9} {name}"
+        if report.growth is not None:
+            g = report.growth
+            line += (
+                f"  exponential on {g.sample!r}…"
+                if g.exploded
+                else f"  ~n^{g.exponent:.1f}, {g.seconds * 1000:.1f} ms at "
+                f"{g.length} chars of {g.sample!r}…"
+            )
+        print(line)
+        for issue in report.issues:
+            print(f"          {issue.kind}: {issue.detail}")
+    print(f"{len(patterns)} patterns checked, {rejected} rejected")
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Placeholder restoration.
+
+All placeholders have the form ``[TYPE_n]``. Instead of one ``str.replace``
+per mapping entry, a single regex pass finds every placeholder and looks it up
+in the mapping. Replaced text is never scanned again, so an original value that
+itself looks like a placeholder cannot be substituted a second time, and the
+cost does not grow with the size of the mapping.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+
+_PLACEHOLDER = re.compile(r"\[[A-Z][A-Z_]*_\d+\]")
+# What a placeholder cut off at the end of a chunk can look like
+_PARTIAL = re.compile(r"\[(?:[A-Z][A-Z_]*(?:_\d*)?)?")
+
+
+def restore_placeholders(text: str, mapping: Mapping[str, str]) -> str:
+    """Replace placeholders in text with their original values in one pass.
+
+    Placeholders not in the mapping are left untouched.
+    """
+    if not mapping or "[" not in text:
+        return text
+    return _PLACEHOLDER.sub(lambda m: mapping.get(m.group(0), m.group(0)), text)
+
+
+class StreamingRestorer:
+    """Restore placeholders in text that arrives in chunks (e.g. LLM tokens).
+
+    ``feed`` returns everything that can be restored already. Only a trailing
+    fragment that may be the beginning of a placeholder is held back until the
+    next chunk decides it; call ``flush`` once the stream has ended.
+    """
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        self._mapping = mapping
+        self._max_len = max(map(len, mapping), default=0)
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        text = self._pending + chunk
+        self._pending = ""
+        start = text.rfind("[")
+        if start != -1 and len(text) - start < self._max_len:
+            if _PARTIAL.fullmatch(text, start):
+                self._pending = text[start:]
+                text = text[:start]
+        return restore_placeholders(text, self._mapping)
+
+    def flush(self) -> str:
+        text, self._pending = self._pending, ""
+        return restore_placeholders(text, self._mapping)
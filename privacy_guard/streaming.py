@@ -0,0 +1,164 @@
+"""Window-by-window scanning of texts that do not fit in memory.
+
+``StreamScan`` reads its source in chunks and scans overlapping windows of
+about ``window_size`` characters. Every window is scanned together with
+``overlap`` characters of context on both sides, but only its middle part is
+*committed*: findings there are numbered and the anonymised text up to the
+commit point is yielded. The right-hand context is scanned again as part of
+the next window.
+
+A finding that crosses the commit point is committed whole and the point moves
+to its end, so matches spanning chunk boundaries are never split. A finding
+that touches the end of the window may still continue in the unread input; the
+commit point moves before it and it is re-detected in the next window.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, TextIO
+
+from .models import Finding
+from .placeholders import PlaceholderMap
+from .restore import restore_placeholders
+
+if TYPE_CHECKING:
+    from .scanner import PrivacyScanner
+
+
+def _chunks(source: str | TextIO | Iterable[str], size: int) -> Iterator[str]:
+    if isinstance(source, str):
+        yield source
+        return
+    read = getattr(source, "read", None)
+    if read is not None:
+        while chunk := read(size):
+            yield chunk
+        return
+    yield from source
+
+
+class StreamScan:
+    """Incremental scan of one stream, created by ``PrivacyScanner.scan_stream``.
+
+    Iterating yields the anonymised text in pieces; their concatenation equals
+    the anonymised text of the whole stream. ``findings`` (absolute offsets)
+    and ``mapping`` grow as the stream is consumed. A stream can be iterated
+    only once.
+
+    With a ``RegexGuard`` on the scanner, rules stopped in a window are added
+    to ``budget_exceeded`` before that window's piece is yielded. Such a piece
+    may still contain data the rule did not get to; check ``budget_exceeded``
+    after every piece and discard the output once it is set.
+    """
+
+    def __init__(
+        self,
+        scanner: PrivacyScanner,
+        source: str | TextIO | Iterable[str],
+        window_size: int = 100_000,
+        overlap: int = 2_000,
+        keep_findings: bool = True,
+    ) -> None:
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        if overlap < 0:
+            raise ValueError("overlap must not be negative")
+        self._scanner = scanner
+        self._source = source
+        self._window_size = window_size
+        self._overlap = overlap
+        self._keep_findings = keep_findings
+        self._placeholders = PlaceholderMap()
+        self._pieces: Iterator[str] | None = None
+        self.findings: list[Finding] = []
+        self.budget_exceeded: list[str] = []
+
+    @property
+    def mapping(self) -> dict[str, str]:
+        """Placeholder → original for everything committed so far."""
+        return self._placeholders.mapping
+
+    def restore(self, text: str) -> str:
+        """Replace placeholders in text with their original values."""
+        return restore_placeholders(text, self.mapping)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._pieces is not None:
+            raise RuntimeError("a StreamScan can only be iterated once")
+        self._pieces = self._run()
+        return self._pieces
+
+    def read(self) -> str:
+        """Consume the whole stream and return the anonymised text."""
+        return "".join(self)
+
+    def _run(self) -> Iterator[str]:
+        chunks = _chunks(self._source, self._window_size)
+        buffer = ""
+        base = 0  # absolute offset of buffer[0]
+        done = 0  # buffer[:done] is left context that was already emitted
+        exhausted = False
+
+        while True:
+            limit = done + self._window_size + self._overlap
+            if not exhausted and len(buffer) < limit:
+                parts = [buffer]
+                size = len(buffer)
+                while size < limit:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    parts.append(chunk)
+                    size += len(chunk)
+                buffer = "".join(parts)
+
+            window = buffer[:limit]
+            final = exhausted and len(window) == len(buffer)
+            if final and done == len(window):
+                return
+
+            cut = len(window) if final else len(window) - self._overlap
+            committed: list[Finding] = []
+            exceeded: set[str] = set()
+            findings = self._scanner._detect(window, exceeded=exceeded)
+            if exceeded:
+                self.budget_exceeded = sorted(exceeded.union(self.budget_exceeded))
+            for finding in findings:
+                if finding.start < done:
+                    # Starts in text the previous window has already decided on
+                    continue
+                if finding.start >= cut:
+                    break
+                if not final and finding.end == len(window) and finding.start > done:
+                    # May continue beyond the window — leave it to the next one
+                    cut = finding.start
+                    break
+                if finding.end > cut:
+                    cut = finding.end
+                committed.append(finding)
+
+            yield self._render(window, done, cut, committed, base)
+
+            if final:
+                return
+            keep = max(0, cut - self._overlap)
+            buffer = buffer[keep:]
+            base += keep
+            done = cut - keep
+
+    def _render(
+        self, window: str, done: int, cut: int, committed: list[Finding], base: int
+    ) -> str:
+        parts: list[str] = []
+        pos = done
+        for finding in committed:
+            numbered = self._placeholders.assign(finding, offset=base)
+            if self._keep_findings:
+                self.findings.append(numbered)
+            parts.append(window[pos : finding.start])
+            parts.append(numbered.placeholder)
+            pos = finding.end
+        parts.append(window[pos:cut])
+        return "".join(parts)
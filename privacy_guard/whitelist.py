@@ -1,21 +1,135 @@
 from __future__ import annotations
+import re
+from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .whitelist_store import MappedWhitelist
 
 _DATA_DIR = Path(__file__).parent / "data"
 
+# Name tokens: runs of letters/digits; dots, hyphens and apostrophes separate
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def _tokens(name: str) -> tuple[str, ...]:
+    return tuple(_TOKEN.findall(name.lower()))
+
+
+def _is_subsequence(query: tuple[str, ...], tokens: tuple[str, ...]) -> bool:
+    remaining = iter(tokens)
+    return all(token in remaining for token in query)
+
+
+class _NameIndex:
+    """Inverted index from name token to the names containing it.
+
+    Answers "do these tokens occur, in order, in any indexed name?" by
+    intersecting the postings of the query tokens (rarest first) and checking
+    the order on the few candidates left — independent of the number of
+    names. Names are added and removed in O(number of tokens).
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}  # normalised name -> id
+        self._tokens: dict[int, tuple[str, ...]] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._next_id = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, name: str) -> None:
+        if name in self._ids:
+            return
+        name_id = self._next_id
+        self._next_id += 1
+        tokens = _tokens(name)
+        self._ids[name] = name_id
+        self._tokens[name_id] = tokens
+        for token in set(tokens):
+            self._postings.setdefault(token, set()).add(name_id)
+
+    def discard(self, name: str) -> None:
+        name_id = self._ids.pop(name, None)
+        if name_id is None:
+            return
+        for token in set(self._tokens.pop(name_id)):
+            posting = self._postings[token]
+            posting.discard(name_id)
+            if not posting:
+                del self._postings[token]
+
+    def contains_tokens(self, query: tuple[str, ...]) -> bool:
+        postings = []
+        for token in set(query):
+            posting = self._postings.get(token)
+            if posting is None:
+                return False
+            postings.append(posting)
+        postings.sort(key=len)
+        rarest, others = postings[0], postings[1:]
+        for name_id in rarest:
+            if all(name_id in other for other in others) and _is_subsequence(
+                query, self._tokens[name_id]
+            ):
+                return True
+        return False
+
 
 class WhitelistManager:
     """Manages the public-figures whitelist.
 
     Names in this list are NOT masked even if they match the name detector.
+    With a ``store`` (see ``privacy_guard.whitelist_store``) the names come
+    from that memory-mapped file instead of the bundled list; ``add`` and
+    ``remove`` then only affect names kept in memory on top of it.
     """
 
-    def __init__(self, extra_names: list[str] | None = None) -> None:
-        self._names: set[str] = set()
-        self._load_file(_DATA_DIR / "public_figures.txt")
+    def __init__(
+        self,
+        extra_names: list[str] | None = None,
+        store: MappedWhitelist | None = None,
+    ) -> None:
+        self._names = _NameIndex()
+        self._parent: WhitelistManager | None = None
+        self._store = store
+        self._version = 0
+        if store is None:
+            self._load_file(_DATA_DIR / "public_figures.txt")
         for name in extra_names or []:
             self._names.add(name.strip().lower())
 
+    def overlay(self, names: Iterable[str]) -> WhitelistManager:
+        """Return a whitelist that also accepts names, layered on top of this one.
+
+        The base list is neither copied nor re-read; changes to it remain
+        visible through the overlay.
+        """
+        layer = WhitelistManager.__new__(WhitelistManager)
+        layer._names = _NameIndex()
+        for name in names:
+            layer._names.add(name.strip().lower())
+        layer._parent = self
+        layer._store = None
+        layer._version = 0
+        return layer
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change (including changes to the base list
+        and reloads of the store)."""
+        version = self._version
+        if self._store is not None:
+            version += self._store.generation
+        if self._parent is not None:
+            version += self._parent.version
+        return version
+
     def _load_file(self, path: Path) -> None:
         if not path.exists():
             return
@@ -26,20 +140,29 @@ class WhitelistManager:
                     self._names.add(name.lower())
 
     def is_whitelisted(self, name: str) -> bool:
-        """Return True if this name (or a containing public figure name) is whitelisted."""
+        """Return True if this name (or a containing public figure name) is whitelisted.
+
+        A name is contained in a known one if its words occur there in the
+        same order: "Merz" and "Friedrich Merz" both match "Friedrich Merz",
+        "Angela Merkel" matches "Angela Dorothea Merkel".
+        """
         name_lower = name.lower()
         # Exact match
         if name_lower in self._names:
             return True
-        # Check if the detected name is a substring of a known public figure
-        # e.g. "Merz" alone → not whitelisted, but "Friedrich Merz" → yes
-        for known in self._names:
-            if name_lower in known:
-                return True
+        query = _tokens(name_lower)
+        if query and self._names.contains_tokens(query):
+            return True
+        if self._store is not None and self._store.is_whitelisted(name):
+            return True
+        if self._parent is not None:
+            return self._parent.is_whitelisted(name)
         return False
 
     def add(self, name: str) -> None:
         self._names.add(name.strip().lower())
+        self._version += 1
 
     def remove(self, name: str) -> None:
         self._names.discard(name.strip().lower())
+        self._version += 1
@@ -0,0 +1,287 @@
+"""Pre-built whitelist files, memory-mapped and shared between processes.
+
+``WhitelistManager`` keeps its names in Python objects, so every process
+(every uvicorn worker) holds its own copy. A store file built once with
+``build_whitelist_store`` (or ``python -m privacy_guard.whitelist_store``) is
+opened with ``mmap`` instead: the pages live in the OS page cache and are
+shared by all processes that map the file, so a large list costs next to no
+memory per worker.
+
+Layout (all integers little-endian uint32)::
+
+    header      magic "PGWL", format version, #names, #tokens, #postings
+    name_offs   #names + 1 offsets into the name blob
+    token_offs  #tokens + 1 offsets into the token blob
+    post_offs   #tokens + 1 offsets into the postings
+    postings    name ids per token, ascending
+    names       normalised names, UTF-8, sorted bytewise
+    tokens      name tokens, UTF-8, sorted bytewise
+
+Both tables are searched by bisection, so lookups never load the file into
+Python objects. ``MappedWhitelist`` notices when the file is replaced and maps
+the new version; write a new file next to it and ``os.replace`` it over the
+old one (``build_whitelist_store`` does this), so readers see either the old
+or the new list, never a partial one. Never rewrite a mapped file in place.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from .whitelist import _DATA_DIR, _is_subsequence, _tokens
+
+_MAGIC = b"PGWL"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4s4I")
+
+
+def _u32(values: Iterable[int]) -> bytes:
+    data = array("I", values)
+    if data.itemsize != 4:  # pragma: no cover - no such platform in practice
+        raise RuntimeError("array('I') is not 32 bits wide on this platform")
+    if sys.byteorder == "big":  # pragma: no cover
+        data.byteswap()
+    return data.tobytes()
+
+
+def build_whitelist_store(names: Iterable[str], path: str | Path) -> int:
+    """Write names as a store file at path and return the number of names.
+
+    Names are normalised like ``WhitelistManager`` does (stripped, lower
+    case); blank lines and ``#`` comments are skipped. The file is written
+    to a temporary name and moved into place atomically.
+    """
+    stripped = (n.strip() for n in names)
+    normalised = {n.lower() for n in stripped if n and not n.startswith("#")}
+    encoded = sorted(n.encode("utf-8") for n in normalised)
+    postings: dict[bytes, list[int]] = {}
+    for name_id, name in enumerate(encoded):
+        for token in dict.fromkeys(_tokens(name.decode("utf-8"))):
+            postings.setdefault(token.encode("utf-8"), []).append(name_id)
+    tokens = sorted(postings)
+
+    def offsets(lengths: Iterable[int]) -> list[int]:
+        result = [0]
+        for length in lengths:
+            result.append(result[-1] + length)
+        return result
+
+    post_offs = offsets(len(postings[t]) for t in tokens)
+    sections = [
+        _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(encoded), len(tokens), post_offs[-1]),
+        _u32(offsets(map(len, encoded))),
+        _u32(offsets(map(len, tokens))),
+        _u32(post_offs),
+        _u32(i for t in tokens for i in postings[t]),
+        b"".join(encoded),
+        b"".join(tokens),
+    ]
+
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as fh:
+            fh.writelines(sections)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return len(encoded)
+
+
+class _Table:
+    """Sorted byte strings in a blob, addressed by an offset array."""
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int]) -> None:
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._blob[self._offsets[index] : self._offsets[index + 1]].tobytes()
+
+    def find(self, key: bytes) -> int:
+        """Index of key, or -1."""
+        index = bisect_left(self, key)
+        return index if index < len(self) and self[index] == key else -1
+
+
+class _Snapshot:
+    """One mapped version of a store file."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as fh:
+            stat = os.fstat(fh.fileno())
+            if stat.st_size < _HEADER.size:
+                raise ValueError(f"{path} is not a whitelist store")
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self.key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        view = memoryview(mm)
+        magic, version, n_names, n_tokens, n_postings = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {_FORMAT_VERSION} store")
+
+        pos = _HEADER.size
+
+        def u32(count: int) -> Sequence[int]:
+            nonlocal pos
+            raw = view[pos : pos + 4 * count]
+            pos += 4 * count
+            if sys.byteorder == "little":
+                return raw.cast("I")
+            data = array("I", raw)  # pragma: no cover
+            data.byteswap()  # pragma: no cover
+            return data  # pragma: no cover
+
+        name_offs = u32(n_names + 1)
+        token_offs = u32(n_tokens + 1)
+        self._post_offs = u32(n_tokens + 1)
+        self._postings = u32(n_postings)
+        names_end = pos + name_offs[-1]
+        if names_end + token_offs[-1] > len(view):
+            raise ValueError(f"{path} is truncated")
+        self.names = _Table(view[pos:names_end], name_offs)
+        self.tokens = _Table(view[names_end:], token_offs)
+
+    def contains(self, name: str) -> bool:
+        return self.names.find(name.encode("utf-8")) >= 0
+
+    def contains_tokens(self, query: tuple[str, ...]) -> bool:
+        """Same semantics as the in-memory index of ``WhitelistManager``."""
+        postings: list[Sequence[int]] = []
+        for token in set(query):
+            index = self.tokens.find(token.encode("utf-8"))
+            if index < 0:
+                return False
+            start, end = self._post_offs[index], self._post_offs[index + 1]
+            postings.append(self._postings[start:end])
+        postings.sort(key=len)
+        rarest, others = postings[0], postings[1:]
+        for name_id in rarest:
+            if all(_contains_sorted(other, name_id) for other in others):
+                name = self.names[name_id].decode("utf-8")
+                if _is_subsequence(query, _tokens(name)):
+                    return True
+        return False
+
+
+def _contains_sorted(values: Sequence[int], value: int) -> bool:
+    index = bisect_left(values, value)
+    return index < len(values) and values[index] == value
+
+
+class MappedWhitelist:
+    """Read-only whitelist backed by a memory-mapped store file.
+
+    At most every ``check_interval`` seconds a lookup checks whether the file
+    was replaced and, if so, maps the new one; ``check_interval=None`` turns
+    that off (call ``reload()`` yourself). A replacement that cannot be read
+    is ignored and the previous version stays in use.
+    """
+
+    def __init__(self, path: str | Path, check_interval: float | None = 1.0) -> None:
+        self._path = Path(path)
+        self._check_interval = check_interval
+        self._snapshot = _Snapshot(self._path)
+        self._generation = 0
+        self._checked_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def generation(self) -> int:
+        """Incremented every time a new version of the file is mapped."""
+        self._maybe_reload()
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._snapshot.names)
+
+    def __contains__(self, name: str) -> bool:
+        self._maybe_reload()
+        return self._snapshot.contains(name.strip().lower())
+
+    def is_whitelisted(self, name: str) -> bool:
+        """Exact or word-subsequence match, as in ``WhitelistManager``."""
+        self._maybe_reload()
+        snapshot = self._snapshot  # one version for the whole lookup
+        name_lower = name.lower()
+        if snapshot.contains(name_lower):
+            return True
+        query = _tokens(name_lower)
+        return bool(query) and snapshot.contains_tokens(query)
+
+    def reload(self) -> bool:
+        """Map the file again if it changed; return True if it did.
+
+        Raises ``OSError`` / ``ValueError`` if the new file cannot be read.
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            stat = self._path.stat()
+            if (stat.st_ino, stat.st_size, stat.st_mtime_ns) == self._snapshot.key:
+                return False
+            # Readers still holding the old snapshot keep their mapping; it is
+            # unmapped once the last of them drops it
+            self._snapshot = _Snapshot(self._path)
+            self._generation += 1
+            return True
+
+    def _maybe_reload(self) -> None:
+        if self._check_interval is None:
+            return
+        if time.monotonic() - self._checked_at < self._check_interval:
+            return
+        try:
+            self.reload()
+        except (OSError, ValueError):
+            pass  # keep serving the version we have
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m privacy_guard.whitelist_store",
+        description="Build a memory-mappable whitelist store from name lists",
+    )
+    parser.add_argument("output", type=Path, help="Store file to write")
+    parser.add_argument(
+        "inputs", nargs="*", type=Path, help="Text files with one name per line"
+    )
+    parser.add_argument(
+        "--no-defaults",
+        action="store_true",
+        help="Do not include the bundled public figures list",
+    )
+    args = parser.parse_args(argv)
+
+    paths = list(args.inputs)
+    if not args.no_defaults:
+        paths.insert(0, _DATA_DIR / "public_figures.txt")
+
+    def names() -> Iterable[str]:
+        for path in paths:
+            with path.open(encoding="utf-8") as fh:
+                yield from fh
+
+    count = build_whitelist_store(names(), args.output)
+    print(f"Wrote {count} names to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
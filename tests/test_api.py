@@ -23,6 +23,26 @@ def test_health(client: TestClient) -> None:
     assert r.json() == {"status": "ok"}
 
 
+def test_ready_after_warm_up(client: TestClient) -> None:
+    import api.main as api_main
+
+    assert api_main._ready.wait(timeout=30)
+    r = client.get("/ready")
+    assert r.status_code == 200
+    assert r.json() == {"status": "ready"}
+
+
+def test_not_ready_while_warming_up(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_ready", threading.Event())
+    assert client.get("/ready").status_code == 503
+
+
 # ---------------------------------------------------------------------------
 # /scan – basic detection
 # ---------------------------------------------------------------------------
@@ -55,6 +75,53 @@ def test_scan_returns_findings_structure(client: TestClient) -> None:
     } <= finding.keys()
 
 
+# Backtracks quadratically in the e-mail pattern, far beyond the budget
+_SLOW = {"text": "a." * 50_000 + "@", "detectors": ["EMAIL"]}
+
+
+@pytest.fixture
+def fixed_budget(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    # A budget that does not grow with the text, so _SLOW exceeds it anywhere
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_REGEX_BUDGET_MS_PER_KCHARS", 0.0)
+    monkeypatch.setattr(api_main, "_scanner", api_main._build_scanner())
+
+
+def test_text_over_budget_is_rejected(client: TestClient, fixed_budget) -> None:
+    for url in ("/scan", "/anonymize"):
+        r = client.post(url, json=_SLOW)
+        assert r.status_code == 422
+        assert "EMAIL" in r.json()["detail"]
+
+
+def test_scan_reports_rules_over_budget(
+    client: TestClient, fixed_budget, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_REGEX_BUDGET_EXCEEDED", "report")
+    r = client.post("/scan", json=_SLOW)
+    assert r.status_code == 200
+    assert r.json()["budget_exceeded"] == ["EMAIL"]
+    r = client.post("/anonymize", json=_SLOW)
+    assert r.json()["budget_exceeded"] == ["EMAIL"]
+    r = client.post("/scan", json={"text": "IBAN DE89370400440532013000"})
+    assert r.json()["budget_exceeded"] == []
+
+
+def test_large_benign_text_is_masked_or_rejected(client: TestClient) -> None:
+    rows = [
+        f"{i};Kunde {i};user{i}.{i % 997}@example-{i % 89}.de;{i % 9999} EUR;ok"
+        for i in range(12_000)
+    ]
+    r = client.post("/anonymize", json={"text": "\n".join(rows)})
+    assert r.status_code in (200, 422)
+    if r.status_code == 200:
+        assert r.json()["budget_exceeded"] == []
+        assert "@" not in r.json()["anonymised_text"]
+
+
 # ---------------------------------------------------------------------------
 # /scan – detector filter
 # ---------------------------------------------------------------------------
@@ -109,7 +176,7 @@ def test_anonymize_returns_only_text(client: TestClient) -> None:
     r = client.post("/anonymize", json={"text": "IBAN DE89370400440532013000"})
     assert r.status_code == 200
     data = r.json()
-    assert set(data.keys()) == {"anonymised_text"}
+    assert set(data.keys()) == {"anonymised_text", "budget_exceeded"}
     assert "[IBAN_1]" in data["anonymised_text"]
 
 
@@ -127,6 +194,133 @@ def test_anonymize_detector_filter(client: TestClient) -> None:
     assert "DE89370400440532013000" in text  # IBAN not masked
 
 
+def test_scan_name_backend_per_request(client: TestClient) -> None:
+    body = {"text": "Herr Krzyżanowski ruft an.", "name_backend": "gazetteer"}
+    r = client.post("/anonymize", json=body)
+    assert r.status_code == 200
+    assert r.json()["anonymised_text"] == "[NAME_1] ruft an."
+
+    body["name_backend"] = "regex"
+    assert client.post("/anonymize", json=body).status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# /conversations – delta scanning
+# ---------------------------------------------------------------------------
+
+
+def test_conversation_returns_only_new_messages(client: TestClient) -> None:
+    url = "/conversations/c1/scan"
+    first = [{"id": "m1", "text": "IBAN DE89370400440532013000"}]
+    r = client.post(url, json={"messages": first})
+    assert r.status_code == 200
+    data = r.json()
+    assert [m["id"] for m in data["messages"]] == ["m1"]
+    assert data["mapping"] == {"[IBAN_1]": "DE89370400440532013000"}
+
+    history = first + [{"id": "m2", "text": "Nochmal DE89370400440532013000"}]
+    data = client.post(url, json={"messages": history}).json()
+    assert [m["id"] for m in data["messages"]] == ["m2"]
+    assert data["messages"][0]["anonymised_text"] == "Nochmal [IBAN_1]"
+
+
+def test_conversation_over_budget_is_rejected_and_rescanned(
+    client: TestClient, fixed_budget
+) -> None:
+    url = "/conversations/c3/scan"
+    messages = [
+        {"id": "m1", "text": "Mail an max@example.de"},
+        {"id": "m2", "text": _SLOW["text"]},
+    ]
+    r = client.post(url, json={"messages": messages, "detectors": ["EMAIL"]})
+    assert r.status_code == 422
+    # Nothing was returned, so both messages are scanned again
+    r = client.post(url, json={"messages": messages[:1], "detectors": ["EMAIL"]})
+    assert [m["id"] for m in r.json()["messages"]] == ["m1"]
+    assert r.json()["budget_exceeded"] == []
+
+
+def test_conversation_delete_resets_numbering(client: TestClient) -> None:
+    url = "/conversations/c2/scan"
+    client.post(url, json={"messages": [{"id": "m1", "text": "a@example.de"}]})
+    assert client.delete("/conversations/c2").status_code == 204
+    r = client.post(url, json={"messages": [{"id": "m1", "text": "b@example.de"}]})
+    assert r.json()["messages"][0]["anonymised_text"] == "[EMAIL_1]"
+
+
+# ---------------------------------------------------------------------------
+# Admission control
+# ---------------------------------------------------------------------------
+
+
+def test_scan_rejects_oversized_text(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_MAX_TEXT_CHARS", 10)
+    r = client.post("/scan", json={"text": "x" * 11})
+    assert r.status_code == 413
+    r = client.post(
+        "/conversations/big/scan", json={"messages": [{"id": "m1", "text": "x" * 11}]}
+    )
+    assert r.status_code == 413
+
+
+def test_scan_returns_503_when_saturated(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_slots", threading.BoundedSemaphore(1))
+    api_main._slots.acquire()  # every slot taken
+    r = client.post("/anonymize", json={"text": "test"})
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+
+
+def test_scan_times_out(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    import time
+
+    import api.main as api_main
+
+    def slow_scan(*args):
+        time.sleep(0.3)
+
+    monkeypatch.setattr(api_main, "_SCAN_TIMEOUT", 0.05)
+    monkeypatch.setattr(api_main, "_scan_sync", slow_scan)
+    r = client.post("/scan", json={"text": "test"})
+    assert r.status_code == 503
+    assert "did not finish" in r.json()["detail"]
+
+
+def test_scan_with_micro_batching(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import api.main as api_main
+    from privacy_guard import MicroBatcher
+
+    assert api_main._scanner is not None
+    with MicroBatcher(api_main._scanner, max_wait_ms=1) as batcher:
+        monkeypatch.setattr(api_main, "_batcher", batcher)
+        r = client.post("/scan", json={"text": "IBAN DE89370400440532013000"})
+    assert r.status_code == 200
+    assert r.json()["anonymised_text"] == "IBAN [IBAN_1]"
+
+
+def test_secret_rule_selection_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_SECRET_TAGS", ["github"])
+    monkeypatch.setattr(api_main, "_SECRET_MIN_SEVERITY", "critical")
+    scanner = api_main._build_scanner()
+    token = "ghp_" + "a1B2" * 9
+    result = scanner.scan(f"token {token} key sk_live_{'a1B2' * 6}")
+    assert [f.text for f in result.findings] == [token]
+
+
 # ---------------------------------------------------------------------------
 # API key protection
 # ---------------------------------------------------------------------------
@@ -148,3 +342,16 @@ def test_api_key_enforced_when_set(monkeypatch: pytest.MonkeyPatch) -> None:
 
         r = c.post("/scan", json={"text": "test"}, headers={"X-API-Key": "secret123"})
         assert r.status_code == 200
+
+
+def test_preloaded_scanner_is_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    import api.main as api_main
+
+    monkeypatch.setattr(api_main, "_preloaded", None)
+    api_main.preload()
+    preloaded = api_main._preloaded
+    assert preloaded is not None
+    with TestClient(api_main.app) as c:
+        assert api_main._scanner is preloaded
+        # Warmed up before the app started, so ready at once
+        assert c.get("/ready").status_code == 200
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from privacy_guard import MicroBatcher, PiiType, PrivacyScanner
+
+_TEXTS = [
+    "Hans Müller, DE89 3704 0044 0532 0130 00",
+    "Kein PII hier.",
+    "Schreib an kontakt@example.de oder +49 171 1234567",
+    "Maria Weber antwortet morgen.",
+]
+
+
+@pytest.fixture(scope="module")
+def scanner() -> PrivacyScanner:
+    return PrivacyScanner()
+
+
+def _record_batches(
+    scanner: PrivacyScanner, monkeypatch: pytest.MonkeyPatch
+) -> list[int]:
+    sizes: list[int] = []
+    scan_batch = scanner.scan_batch
+
+    def recording(texts, **kwargs):
+        sizes.append(len(texts))
+        return scan_batch(texts, **kwargs)
+
+    monkeypatch.setattr(scanner, "scan_batch", recording)
+    return sizes
+
+
+def test_results_match_scan(scanner: PrivacyScanner) -> None:
+    with MicroBatcher(scanner, max_wait_ms=20) as batcher:
+        futures = [batcher.submit(text) for text in _TEXTS]
+        results = [f.result(timeout=10) for f in futures]
+    assert results == [scanner.scan(text) for text in _TEXTS]
+
+
+def test_concurrent_requests_share_a_batch(
+    scanner: PrivacyScanner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sizes = _record_batches(scanner, monkeypatch)
+    results = {}
+
+    def call(i: int, batcher: MicroBatcher) -> None:
+        results[i] = batcher.submit(_TEXTS[i]).result(timeout=10)
+
+    with MicroBatcher(scanner, max_wait_ms=500, max_batch=len(_TEXTS)) as batcher:
+        threads = [
+            threading.Thread(target=call, args=(i, batcher)) for i in range(len(_TEXTS))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    # max_batch closes the batch before the window expires
+    assert sizes == [len(_TEXTS)]
+    assert [results[i].original_text for i in range(len(_TEXTS))] == _TEXTS
+
+
+def test_configs_are_scanned_separately(
+    scanner: PrivacyScanner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sizes = _record_batches(scanner, monkeypatch)
+    text = "Mail an max@example.de, DE89370400440532013000"
+    with MicroBatcher(scanner, max_wait_ms=200, max_batch=3) as batcher:
+        plain = batcher.submit(text)
+        email = batcher.submit(text, detectors=[PiiType.EMAIL])
+        again = batcher.submit(text)
+        assert email.result(timeout=10).anonymised_text == (
+            "Mail an [EMAIL_1], DE89370400440532013000"
+        )
+        assert plain.result(timeout=10) == again.result(timeout=10)
+    assert sorted(sizes) == [1, 2]
+
+
+def test_cancelled_request_is_skipped(
+    scanner: PrivacyScanner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sizes = _record_batches(scanner, monkeypatch)
+    with MicroBatcher(scanner, max_wait_ms=200, max_batch=2) as batcher:
+        dropped = batcher.submit("Hans Müller")
+        dropped.cancel()
+        kept = batcher.submit("Maria Weber")
+        assert kept.result(timeout=10).anonymised_text == "[NAME_1]"
+    assert sizes == [1]
+
+
+def test_submit_after_close_fails(scanner: PrivacyScanner) -> None:
+    batcher = MicroBatcher(scanner)
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit("text")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from privacy_guard import PiiType, PrivacyScanner, SegmentCache
+from privacy_guard.cache import segments
+
+_SIGNATURE = "Mit freundlichen Grüßen\nHans Müller\nhans@example.de"
+_SYSTEM = "Du bist ein hilfreicher Assistent. Antworte immer auf Deutsch."
+
+
+def _prompt(question: str) -> str:
+    return f"{_SYSTEM}\n\n{question}\n\n{_SIGNATURE}"
+
+
+def test_segments() -> None:
+    text = "eins\n\nzwei\n \ndrei"
+    assert [text[s:e] for s, e in segments(text)] == ["eins", "zwei", "drei"]
+
+
+def test_cached_scan_matches_uncached() -> None:
+    cache = SegmentCache()
+    cached = PrivacyScanner(cache=cache)
+    plain = PrivacyScanner()
+    for question in (
+        "Bitte überweise an DE89 3704 0044 0532 0130 00.",
+        "Rückfragen an Maria Weber, maria@example.de.",
+        "Wann ist der Termin?",
+    ):
+        text = _prompt(question)
+        assert cached.scan(text) == plain.scan(text)
+    stats = cache.stats()
+    # System prompt and signature are scanned once, then served from the cache
+    assert stats.misses == 2 + 3
+    assert stats.hits == 2 * 2
+
+
+def test_scan_batch_uses_cache() -> None:
+    cache = SegmentCache()
+    scanner = PrivacyScanner(cache=cache)
+    texts = [_prompt("Mail an maria@example.de."), _prompt("Wann ist der Termin?")]
+    assert scanner.scan_batch(texts) == [PrivacyScanner().scan(t) for t in texts]
+    # Within one batch every segment is still a miss; the next batch hits
+    assert cache.stats().misses == 6
+    scanner.scan_batch(texts)
+    assert cache.stats().hits == 6
+
+
+def test_numbering_is_per_document() -> None:
+    scanner = PrivacyScanner(cache=SegmentCache())
+    scanner.scan("max@example.de")
+    result = scanner.scan("anna@example.de\n\nmax@example.de")
+    assert result.anonymised_text == "[EMAIL_1]\n\n[EMAIL_2]"
+    assert result.mapping == {
+        "[EMAIL_1]": "anna@example.de",
+        "[EMAIL_2]": "max@example.de",
+    }
+
+
+def test_config_is_part_of_the_key() -> None:
+    cache = SegmentCache()
+    scanner = PrivacyScanner(cache=cache)
+    text = "Hans Müller, max@example.de"
+    assert len(scanner.scan(text).findings) == 2
+    only_email = scanner.scan(text, detectors=[PiiType.EMAIL])
+    assert {f.pii_type for f in only_email.findings} == {PiiType.EMAIL}
+    whitelisted = scanner.scan(text, extra_whitelist=["Hans Müller"])
+    assert "Hans Müller" in whitelisted.anonymised_text
+    assert cache.stats().hits == 0
+
+
+def test_whitelist_change_invalidates() -> None:
+    scanner = PrivacyScanner(cache=SegmentCache())
+    text = "Hans Müller hat angerufen."
+    assert "[NAME_1]" in scanner.scan(text).anonymised_text
+    scanner._whitelist.add("Hans Müller")
+    assert "Hans Müller" in scanner.scan(text).anonymised_text
+
+
+def test_hash_keys_retain_no_plaintext() -> None:
+    cache = SegmentCache()
+    PrivacyScanner(cache=cache).scan("Mail an max@example.de")
+    assert all(isinstance(key, bytes) for key in cache._entries)
+    assert "max@example.de" not in repr(cache._entries)
+
+
+def test_lru_eviction_and_ttl() -> None:
+    cache = SegmentCache(max_entries=2)
+    scanner = PrivacyScanner(cache=cache)
+    scanner.scan("a@example.de\n\nb@example.de\n\nc@example.de")
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+
+    expired = SegmentCache(ttl=0.0)
+    scanner = PrivacyScanner(cache=expired)
+    scanner.scan("a@example.de")
+    scanner.scan("a@example.de")
+    assert expired.stats().hits == 0
+
+
+def test_memory_limit() -> None:
+    cache = SegmentCache(max_bytes=1_000)
+    scanner = PrivacyScanner(cache=cache)
+    scanner.scan("\n\n".join(f"user{i}@example.de" for i in range(50)))
+    assert cache.stats().bytes <= 1_000
+    assert len(cache) < 50
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+from privacy_guard import checksums
+from privacy_guard.checksums import MIN_BATCH, digit_matrix, validate_batch
+from privacy_guard.detectors.credit_card import (
+    CreditCardDetector,
+    _luhn_valid,
+    _luhn_valid_batch,
+)
+from privacy_guard.detectors.iban import (
+    IbanDetector,
+    _mod97,
+    _mod97_batch,
+    _validate_iban,
+    _validate_iban_batch,
+)
+from privacy_guard.detectors.kvnr import (
+    KvnrDetector,
+    _kvnr_checksum_valid,
+    _kvnr_checksums_valid,
+)
+from privacy_guard.detectors.tax_id import (
+    TaxIdDetector,
+    _validate_tax_id,
+    _validate_tax_id_batch,
+)
+
+_DIGITS = "0123456789"
+
+
+def _numbers(rng: random.Random, alphabet: str, lengths: tuple[int, int]) -> list[str]:
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(*lengths)))
+        for _ in range(4 * MIN_BATCH)
+    ]
+
+
+@pytest.fixture
+def without_numpy(monkeypatch) -> None:
+    monkeypatch.setattr(checksums, "_numpy", None)
+    monkeypatch.setattr(checksums, "_numpy_checked", True)
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def test_digit_matrix_pads_on_the_left() -> None:
+    pytest.importorskip("numpy")
+    assert digit_matrix(["12", "345"]).tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_small_batches_stay_scalar() -> None:
+    def vectorised(matrix):
+        raise AssertionError("not expected")
+
+    assert validate_batch(["1", "2"], int, vectorised) == [1, 2]
+
+
+def test_without_numpy_everything_is_scalar(without_numpy) -> None:
+    def vectorised(matrix):
+        raise AssertionError("not expected")
+
+    values = [str(i) for i in range(2 * MIN_BATCH)]
+    assert validate_batch(values, int, vectorised) == list(range(2 * MIN_BATCH))
+
+
+def test_non_ascii_digits_take_the_scalar_path() -> None:
+    pytest.importorskip("numpy")
+    values = ["٣" * 3] + ["123"] * MIN_BATCH
+    seen: list[list[int]] = []
+
+    def vectorised(matrix):
+        seen.extend(matrix.tolist())
+        return [0] * len(matrix)
+
+    results = validate_batch(values, lambda v: -1, vectorised)
+    assert results == [-1] + [0] * MIN_BATCH
+    assert seen == [[1, 2, 3]] * MIN_BATCH
+
+
+# ── Batch validators equal the scalar ones ─────────────────────────────────────
+
+
+def test_batch_validators_match_scalar() -> None:
+    rng = random.Random(0)
+    for _ in range(5):
+        cards = _numbers(rng, _DIGITS, (13, 19))
+        assert _luhn_valid_batch(cards) == [_luhn_valid(c) for c in cards]
+        rearranged = _numbers(rng, _DIGITS + "ABXZ", (5, 34))
+        assert _mod97_batch(rearranged) == [_mod97(r) for r in rearranged]
+        ibans = [
+            rng.choice(["DE", "AT", "XX"]) + rest
+            for rest in _numbers(rng, _DIGITS + "AB ", (14, 30))
+        ] + ["DE89 3704 0044 0532 0130 00"]
+        assert _validate_iban_batch(ibans) == [_validate_iban(i) for i in ibans]
+        tax_ids = _numbers(rng, _DIGITS + " ٣", (10, 14))
+        assert _validate_tax_id_batch(tax_ids) == [_validate_tax_id(t) for t in tax_ids]
+        kvnrs = [rng.choice("ABJZ") + n for n in _numbers(rng, _DIGITS, (9, 9))]
+        assert _kvnr_checksums_valid(kvnrs) == [_kvnr_checksum_valid(k) for k in kvnrs]
+
+
+@pytest.mark.parametrize("numpy_missing", [False, True])
+def test_from_matches_equals_from_match(request, numpy_missing: bool) -> None:
+    if numpy_missing:
+        request.getfixturevalue("without_numpy")
+    text = " | ".join(
+        [
+            "4111 1111 1111 1111",
+            "4111 1111 1111 1112",
+            "DE89 3704 0044 0532 0130 00",
+            "DE89 3704 0044 0532 0130 01",
+            "12 345 678 903",
+            "12 345 678 904",
+            "T123456780",
+            "T123456781",
+        ]
+        * MIN_BATCH
+    )
+    for detector in (
+        CreditCardDetector(),
+        IbanDetector(),
+        TaxIdDetector(),
+        KvnrDetector(),
+    ):
+        for index, pattern in enumerate(detector.patterns):
+            matches = list(pattern.finditer(text))
+            assert len(matches) >= MIN_BATCH
+            assert detector.from_matches(matches, index) == [
+                detector.from_match(match, index) for match in matches
+            ]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+from privacy_guard import PiiType, PrivacyScanner, RegexGuard
+
+_IBAN = "DE89370400440532013000"
+
+
+@pytest.fixture(scope="module")
+def scanner() -> PrivacyScanner:
+    return PrivacyScanner()
+
+
+def test_only_new_messages_are_scanned(scanner: PrivacyScanner) -> None:
+    conversation = scanner.conversation()
+    first = conversation.scan({"m1": f"Bitte auf {_IBAN} überweisen."})
+    assert list(first) == ["m1"]
+
+    history = {
+        "m1": f"Bitte auf {_IBAN} überweisen.",
+        "m2": "Erledigt.",
+        "m3": "Mail an max@example.de",
+    }
+    second = conversation.scan(history)
+    assert list(second) == ["m2", "m3"]
+    assert second["m3"].anonymised_text == "Mail an [EMAIL_1]"
+    assert len(conversation) == 3
+    assert "m1" in conversation
+
+
+def test_placeholders_stable_across_turns(scanner: PrivacyScanner) -> None:
+    conversation = scanner.conversation()
+    first = conversation.scan([("a", f"IBAN {_IBAN}")])
+    second = conversation.scan(
+        [("b", "Andere IBAN: DE44500105175407324931"), ("c", f"Nochmal {_IBAN}")]
+    )
+    assert first["a"].anonymised_text == "IBAN [IBAN_1]"
+    assert second["b"].anonymised_text == "Andere IBAN: [IBAN_2]"
+    assert second["c"].anonymised_text == "Nochmal [IBAN_1]"
+    # Per-message mappings only hold their own placeholders
+    assert second["b"].mapping == {"[IBAN_2]": "DE44500105175407324931"}
+    assert conversation.mapping == {
+        "[IBAN_1]": _IBAN,
+        "[IBAN_2]": "DE44500105175407324931",
+    }
+    assert conversation.restore("[IBAN_2] und [IBAN_1]") == (
+        f"DE44500105175407324931 und {_IBAN}"
+    )
+
+
+def test_edited_message_is_rescanned(scanner: PrivacyScanner) -> None:
+    conversation = scanner.conversation()
+    conversation.scan({"m1": "Mail an max@example.de"})
+    assert conversation.scan({"m1": "Mail an max@example.de"}) == {}
+    edited = conversation.scan({"m1": "Mail an erika@example.de"})
+    assert edited["m1"].anonymised_text == "Mail an [EMAIL_2]"
+
+
+def test_matches_scan_of_single_message(scanner: PrivacyScanner) -> None:
+    text = f"Hans Müller, {_IBAN}, max@example.de"
+    result = scanner.conversation().scan({"m1": text})["m1"]
+    assert result == scanner.scan(text)
+
+
+def test_detector_selection_per_turn(scanner: PrivacyScanner) -> None:
+    conversation = scanner.conversation()
+    result = conversation.scan(
+        {"m1": f"{_IBAN} an max@example.de"}, detectors=[PiiType.EMAIL]
+    )
+    assert result["m1"].anonymised_text == f"{_IBAN} an [EMAIL_1]"
+
+
+def test_message_over_budget_is_scanned_again() -> None:
+    guarded = PrivacyScanner(guard=RegexGuard(budget=0.001), name_backend="gazetteer")
+    conversation = guarded.conversation()
+    slow = "a." * 20_000 + "@"  # backtracks quadratically in the e-mail pattern
+    first = conversation.scan({"m1": slow, "m2": "Erledigt."}, [PiiType.EMAIL])
+    assert first["m1"].budget_exceeded == ["EMAIL"]
+    assert "m1" not in conversation and "m2" in conversation
+    again = conversation.scan({"m1": slow, "m2": "Erledigt."}, [PiiType.EMAIL])
+    assert list(again) == ["m1"]
+    conversation.forget(["m2"])
+    assert "m2" not in conversation
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from benchmarks.corpus import PII_KINDS, generate
+from privacy_guard import PiiType, PrivacyScanner
+
+
+def test_deterministic_and_exact_size() -> None:
+    for size in (100, 1_000, 25_000):
+        text = generate(size, seed=7)
+        assert len(text) == size
+        assert text == generate(size, seed=7)
+    assert generate(5_000, seed=1) != generate(5_000, seed=2)
+
+
+def test_density_zero_has_no_pii() -> None:
+    result = PrivacyScanner().scan(generate(5_000, density=0.0))
+    assert result.findings == []
+
+
+@pytest.mark.parametrize(
+    ("kind", "pii_type"),
+    [
+        ("iban", PiiType.IBAN),
+        ("kvnr", PiiType.KVNR),
+        ("tax_id", PiiType.TAX_ID),
+        ("credit_card", PiiType.CREDIT_CARD),
+        ("address", PiiType.ADDRESS),
+        ("email", PiiType.EMAIL),
+        ("secret", PiiType.SECRET),
+    ],
+)
+def test_generated_values_are_detected(kind: str, pii_type: PiiType) -> None:
+    result = PrivacyScanner().scan(generate(2_000, density=1.0, mix={kind: 1.0}))
+    assert pii_type in {f.pii_type for f in result.findings}
+
+
+@pytest.mark.parametrize("kind", ["iban", "kvnr", "tax_id", "credit_card"])
+def test_generated_checksums_are_valid(kind: str) -> None:
+    result = PrivacyScanner().scan(generate(2_000, density=1.0, mix={kind: 1.0}))
+    assert result.findings
+    assert all(f.confidence >= 0.95 for f in result.findings)
+
+
+def test_unknown_kind_rejected() -> None:
+    assert "iban" in PII_KINDS
+    with pytest.raises(ValueError):
+        generate(100, mix={"passport": 1.0})
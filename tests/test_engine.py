@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+from privacy_guard.detectors.base import PatternDetector
+from privacy_guard.detectors.email import EmailDetector
+from privacy_guard.detectors.iban import IbanDetector
+from privacy_guard.detectors.phone import PhoneDetector
+from privacy_guard.detectors.secret import SecretDetector
+from privacy_guard.detectors.tax_id import TaxIdDetector
+from privacy_guard.engine import (
+    PatternEngine,
+    RegexGuard,
+    required_gates,
+    token_window_width,
+    token_windows,
+)
+from privacy_guard.models import Finding, PiiType
+
+
+class _Single(PatternDetector):
+    """Reports every raw match of one pattern."""
+
+    pii_type = PiiType.PHONE
+
+    def __init__(self, pattern: re.Pattern[str]) -> None:
+        self.patterns = (pattern,)
+
+    def from_match(self, match: re.Match[str], index: int) -> Finding | None:
+        start, end = match.span()
+        return Finding(self.pii_type, start, end, match.group(), 1.0, "")
+
+
+@pytest.fixture(scope="module")
+def engine() -> PatternEngine:
+    return PatternEngine(
+        [SecretDetector(), IbanDetector(), EmailDetector(), TaxIdDetector()]
+    )
+
+
+# ── Gate extraction ────────────────────────────────────────────────────────────
+
+
+def test_literal_gate() -> None:
+    gates = required_gates(re.compile(r"[a-z]+@[a-z]+\.de"))
+    assert gates[0].pattern in ("[@]", r"[\.]")
+    assert any(g.pattern == "[@]" for g in gates)
+
+
+def test_digit_gate() -> None:
+    gates = required_gates(re.compile(r"\b[A-Z][0-9]{9}\b"))
+    assert any(g.search("7") for g in gates)
+    assert not all(g.search("ABC") for g in gates)
+
+
+def test_optional_items_are_not_gates() -> None:
+    assert required_gates(re.compile(r"x?@?\w+")) == ()
+
+
+def test_branch_gate_is_union() -> None:
+    gates = required_gates(re.compile(r"(?:key=|token:)\w+"))
+    assert gates
+    assert all(g.search("=:") for g in gates)
+
+
+def test_inline_ignorecase_respected() -> None:
+    gates = required_gates(re.compile(r"(?i)zq"))
+    assert all(g.search("ZQ") for g in gates)
+
+
+# ── Candidate windows ──────────────────────────────────────────────────────────
+
+
+def test_identifier_patterns_are_windowed() -> None:
+    from privacy_guard.scanner import PrivacyScanner
+
+    windowed = {
+        pii_type
+        for pii_type, detector in PrivacyScanner()._detectors.items()
+        if isinstance(detector, PatternDetector)
+        and all(token_window_width(p) is not None for p in detector.patterns)
+    }
+    assert windowed == {
+        PiiType.CREDIT_CARD,
+        PiiType.TAX_ID,
+        PiiType.KVNR,
+        PiiType.SOCIAL_SECURITY,
+        PiiType.PHONE,
+        PiiType.IBAN,
+        PiiType.VAT_ID,
+        PiiType.PERSONAL_ID,
+        PiiType.DRIVER_LICENSE,
+    }
+
+
+def test_patterns_that_are_not_windowed() -> None:
+    assert token_window_width(re.compile(r"[A-Z]\d+", re.IGNORECASE)) is None
+    assert token_window_width(re.compile(r"\d+(?=[ ]*(?:EUR|USD){4})")) is None
+    assert token_window_width(re.compile(r"[ ]+")) is None
+    assert token_window_width(re.compile(r"\d{3}\.\d{3}")) is None
+    assert token_window_width(re.compile(r"(?<![a-z.])\d{3} \d+")) == 5
+
+
+def test_token_windows() -> None:
+    text = "Tel. 030 1234567, sonst" + "x" * 100 + " IBAN DE89 3704"
+    # Close runs are merged, distant ones are not
+    assert token_windows(text) == [(0, 16), (123, 138)]
+    assert token_windows(text, 13) == [(123, 138)]
+    assert token_windows("nur kleinbuchstaben und leerzeichen") == []
+
+
+def test_windowed_matches_equal_whole_text_matches() -> None:
+    patterns = [
+        p
+        for d in (IbanDetector(), TaxIdDetector(), PhoneDetector())
+        for p in d.patterns
+    ]
+    alphabet = "0123456789" * 4 + "ABCDEZ" * 2 + "abcxyz" + "  \n\t-/()+.,:_٣"
+    rng = random.Random(0)
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+        for pattern in patterns:
+            # Windows are shared, so only used with several windowed routes
+            engine = PatternEngine([_Single(pattern), _Single(pattern)])
+            assert engine._routes[0].window_width is not None
+            expected = [m.span() for m in pattern.finditer(text)] * 2
+            assert [(f.start, f.end) for f in engine.scan(text)] == expected
+
+
+def test_single_windowed_route_searches_whole_text() -> None:
+    engine = PatternEngine([IbanDetector()])
+    assert engine._routes[0].window_width is None
+    assert len(engine.scan("IBAN DE89 3704 0044 0532 0130 00")) == 1
+
+
+# ── Scanning ───────────────────────────────────────────────────────────────────
+
+
+def test_results_match_individual_detectors(engine: PatternEngine) -> None:
+    text = (
+        "IBAN DE89 3704 0044 0532 0130 00, Mail an max@example.de, "
+        "Steuer-ID 12 345 678 903, token ghp_" + "A" * 36
+    )
+    expected = (
+        SecretDetector().detect(text)
+        + IbanDetector().detect(text)
+        + EmailDetector().detect(text)
+        + TaxIdDetector().detect(text)
+    )
+    assert engine.scan(text) == expected
+
+
+def test_detect_reuses_its_engine() -> None:
+    detector = IbanDetector()
+    text = "IBAN DE89 3704 0044 0532 0130 00"
+    assert detector.detect(text) == detector.detect(text)
+    assert detector._engine is detector._engine
+
+
+def test_validation_is_dispatched(engine: PatternEngine) -> None:
+    # Wrong length for DE → rejected by the IBAN validator
+    findings = engine.scan("DE89 3704 0044 0532 0130")
+    assert not any(f.pii_type == PiiType.IBAN for f in findings)
+
+
+def test_enabled_filter(engine: PatternEngine) -> None:
+    text = "Mail an max@example.de, IBAN DE89370400440532013000"
+    findings = engine.scan(text, enabled={PiiType.EMAIL})
+    assert {f.pii_type for f in findings} == {PiiType.EMAIL}
+
+
+def test_no_findings_in_plain_text(engine: PatternEngine) -> None:
+    assert engine.scan("Ein ganz normaler Satz ohne Daten.") == []
+
+
+def test_scan_batch_matches_scan(engine: PatternEngine) -> None:
+    # Enough IBANs and tax ids across the texts for batch validation
+    texts = [
+        f"IBAN DE89 3704 0044 0532 0130 0{i % 10}, Steuer-ID 12 345 678 90{i % 10}"
+        for i in range(60)
+    ] + ["Ein ganz normaler Satz ohne Daten.", "Mail an max@example.de"]
+    assert engine.scan_batch(texts) == [engine.scan(text) for text in texts]
+
+
+# ── Guarded execution ──────────────────────────────────────────────────────────
+
+
+def _guarded(guard: RegexGuard) -> PatternEngine:
+    return PatternEngine(
+        [SecretDetector(), IbanDetector(), EmailDetector(), TaxIdDetector()],
+        guard=guard,
+    )
+
+
+def test_guard_finds_matches_across_slices(engine: PatternEngine) -> None:
+    parts = ["Mail an max@example.de", "IBAN DE89 3704 0044 0532 0130 00"]
+    text = ("Fülltext ohne Daten. " * 7).join(parts * 20)
+    guarded = _guarded(RegexGuard(budget=10, slice_chars=64, overlap=48))
+    assert guarded.scan(text) == engine.scan(text)
+
+
+def test_guard_cuts_overlong_tokens() -> None:
+    guarded = _guarded(RegexGuard(budget=10, slice_chars=64, overlap=16))
+    findings = guarded.scan("token ghp_" + "A" * 300)
+    assert [(f.start, f.end) for f in findings] == [(6, 86)]
+
+
+def test_guard_reports_rules_over_budget() -> None:
+    # Backtracks quadratically in the e-mail pattern
+    text = "a." * 20_000 + "@"
+    exceeded: set[str] = set()
+    guarded = _guarded(RegexGuard(budget=0.001))
+    assert guarded.scan(text, enabled={PiiType.EMAIL}, exceeded=exceeded) == []
+    assert exceeded == {"EMAIL"}
+
+
+def test_guard_budget_grows_with_text_length() -> None:
+    guard = RegexGuard(budget=0.1, budget_per_char=1e-6)
+    assert guard.budget_for(0) == 0.1
+    assert guard.budget_for(1_000_000) == pytest.approx(1.1)
+
+
+def test_guard_rejects_bad_limits() -> None:
+    with pytest.raises(ValueError):
+        RegexGuard(slice_chars=0)
+    with pytest.raises(ValueError):
+        RegexGuard(budget_per_char=-1)
+
+
+def test_suspicious_patterns_always_run_sliced() -> None:
+    routes = PatternEngine([SecretDetector(), EmailDetector()])._routes
+    sliced = {route.name for route in routes if route.sliced}
+    assert sliced == {"azure-sas-token"}
@@ -0,0 +1,101 @@
+import subprocess
+import sys
+
+import pytest
+from privacy_guard import PiiType, PrivacyScanner
+from privacy_guard.detectors.gazetteer import GazetteerNameDetector
+from privacy_guard.whitelist import WhitelistManager
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return GazetteerNameDetector()
+
+
+def _names(detector, text):
+    return [(f.text, f.confidence) for f in detector.detect(text)]
+
+
+def test_first_name_and_surname(detector):
+    assert _names(detector, "Hallo, ich bin Mia Müller.") == [("Mia Müller", 0.85)]
+
+
+def test_several_first_names_and_hyphens(detector):
+    text = "Anna Maria Schmidt und Hans-Peter Müller-Lüdenscheidt kommen."
+    assert [n for n, _ in _names(detector, text)] == [
+        "Anna Maria Schmidt",
+        "Hans-Peter Müller-Lüdenscheidt",
+    ]
+
+
+def test_title_expands_span(detector):
+    text = "Sehr geehrte Frau Dr. Weber, danke."
+    assert _names(detector, text) == [("Frau Dr. Weber", 0.95)]
+
+
+def test_title_with_unknown_surname(detector):
+    assert _names(detector, "Herr Krzyżanowski ruft an.") == [
+        ("Herr Krzyżanowski", 0.95)
+    ]
+
+
+def test_titles_are_case_sensitive(detector):
+    # Lowercase "di"/"ing" are ordinary words, not DI/Ing. titles
+    assert detector.detect("Das geht auf di Maio Ristorante.") == []
+    assert detector.detect("Kapitel zu ing Berlin.") == []
+    assert _names(detector, "Ein Treffen mit DI Weber.") == [("DI Weber", 0.95)]
+
+
+def test_particles(detector):
+    assert _names(detector, "Termin mit Karl von der Heide.") == [
+        ("Karl von der Heide", 0.85)
+    ]
+
+
+def test_lone_names_are_ignored(detector):
+    # A first name or a surname alone is too ambiguous without a title
+    assert detector.detect("Maria kocht. Die Bäckerei Koch hat zu.") == []
+
+
+def test_whitelist(detector):
+    wl = WhitelistManager(extra_names=["Mia Müller"])
+    text = "Hallo, ich bin Mia Müller."
+    assert GazetteerNameDetector(whitelist=wl).detect(text) == []
+    assert detector.detect(text, whitelist=wl) == []
+
+
+def test_scanner_backend_per_scanner_and_per_call():
+    text = "Herr Krzyżanowski und Mia Müller"
+    gazetteer = PrivacyScanner(name_backend="gazetteer")
+    assert gazetteer.scan(text).anonymised_text == "[NAME_1] und [NAME_2]"
+
+    scanner = PrivacyScanner()
+    per_call = scanner.scan(text, name_backend="gazetteer")
+    assert per_call == gazetteer.scan(text)
+    batch = scanner.scan_batch([text], name_backend="gazetteer")
+    assert batch == [per_call]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        PrivacyScanner(name_backend="regex")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        PrivacyScanner().scan("text", name_backend="regex")  # type: ignore[arg-type]
+
+
+def test_gazetteer_scanner_does_not_import_spacy():
+    code = (
+        "import sys\n"
+        "from privacy_guard import PrivacyScanner\n"
+        "scanner = PrivacyScanner(name_backend='gazetteer')\n"
+        "scanner.warm_up()\n"
+        "assert scanner.scan('Mia Müller').findings[0].pii_type.value == 'NAME'\n"
+        "assert 'spacy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_detector_selection_still_applies():
+    scanner = PrivacyScanner(name_backend="gazetteer")
+    result = scanner.scan("Mia Müller", detectors=[PiiType.EMAIL])
+    assert result.findings == []
@@ -1,4 +1,5 @@
 import pytest
+import privacy_guard.detectors.name as name_module
 from privacy_guard.detectors.name import NameDetector
 from privacy_guard.whitelist import WhitelistManager
 
@@ -95,3 +96,63 @@ def test_no_false_positive_location(detector):
     text = "Er fährt nach Frankfurt am Main."
     findings = detector.detect(text)
     assert len(findings) == 0
+
+
+def test_detect_batch_matches_detect(detector):
+    texts = ["Hallo, ich bin Mia Müller.", "Kein Name hier.", "Dr. Thomas Schmidt"]
+    assert detector.detect_batch(texts, batch_size=2) == [
+        detector.detect(t) for t in texts
+    ]
+
+
+def test_code_only_text_skips_ner(detector, monkeypatch):
+    def fail():
+        raise AssertionError("NER must not run")
+
+    monkeypatch.setattr(name_module, "_get_nlp", fail)
+    code = 'def main():\n    return {"id": 42, "items": [1, 2, 3]}\n'
+    assert detector.detect(code) == []
+
+
+def test_name_in_mostly_code_text(detector):
+    code = "x = compute(1, 2)\n" * 40
+    text = code + "# Rückfragen an Thomas Schmidt.\n" + code
+    findings = detector.detect(text)
+    assert [f.text for f in findings] == ["Thomas Schmidt"]
+    assert text[findings[0].start : findings[0].end] == "Thomas Schmidt"
+
+
+def test_title_split_from_name_by_sentence_heuristic(detector):
+    text = "x = 1\n" * 30 + "Termin mit Dr. Maria Weber vereinbart.\n" + "y = 2\n" * 30
+    findings = detector.detect(text)
+    assert len(findings) == 1
+    assert findings[0].text == "Dr. Maria Weber"
+    assert findings[0].confidence == 0.95
+
+
+def test_candidate_windows_can_be_disabled():
+    text = "x = 1\n" * 30 + "Ich bin Mia Müller.\n"
+    full = NameDetector(candidate_windows=False).detect(text)
+    assert full == NameDetector().detect(text)
+
+
+@pytest.mark.parametrize(
+    "sentence, name",
+    [
+        ("Zbigniew kommt morgen.", "Zbigniew"),
+        ("Danke!\nZbigniew", "Zbigniew"),
+        ("Kowalski hat angerufen. Bis später.", "Kowalski"),
+        ("Bitte Émile anrufen.", "Émile"),
+        ("ok, Łukasz ruft an", "Łukasz"),
+    ],
+)
+def test_candidate_windows_keep_leading_and_non_ascii_names(sentence, name):
+    code = "x = compute(1, 2)\n" * 30
+    for text in (sentence, code + sentence + "\n" + code):
+        start = text.index(name)
+        end = start + len(name)
+        windows = name_module._candidate_windows(text)
+        assert any(s <= start and end <= e for s, e in windows)
+        assert NameDetector().detect(text) == NameDetector(
+            candidate_windows=False
+        ).detect(text)
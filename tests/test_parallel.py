@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from privacy_guard import ParallelScanner, PiiType, PrivacyScanner, scan_many
+
+_TEXTS = [
+    f"Ticket {i}: Hans Müller, IBAN DE89 3704 0044 0532 0130 00, Mail hans{i}@example.de"
+    if i % 3 == 0
+    else f"Ticket {i}: keine personenbezogenen Daten."
+    for i in range(25)
+]
+
+
+@pytest.fixture(scope="module")
+def parallel() -> Iterator[ParallelScanner]:
+    with ParallelScanner(processes=2, chunk_size=4, max_in_flight=3) as scanner:
+        yield scanner
+
+
+def test_ordered_results_match_scan(parallel: ParallelScanner) -> None:
+    scanner = PrivacyScanner()
+    results = list(parallel.scan_many(_TEXTS))
+    assert [r.original_text for r in results] == _TEXTS
+    assert [r.anonymised_text for r in results] == [
+        scanner.scan(t).anonymised_text for t in _TEXTS
+    ]
+
+
+def test_unordered_results_complete(parallel: ParallelScanner) -> None:
+    results = list(parallel.scan_many(iter(_TEXTS), ordered=False))
+    assert sorted(r.original_text for r in results) == sorted(_TEXTS)
+
+
+def test_empty_input(parallel: ParallelScanner) -> None:
+    assert list(parallel.scan_many([])) == []
+
+
+def test_disabled_detector_applies_in_workers() -> None:
+    results = list(
+        scan_many(["Mail an hans@example.de"], processes=1, disabled=[PiiType.EMAIL])
+    )
+    assert results[0].anonymised_text == "Mail an hans@example.de"
+
+
+def test_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        ParallelScanner(chunk_size=0)
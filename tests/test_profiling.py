@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from privacy_guard import PiiType, PrivacyScanner
+from privacy_guard.profiling import ScanProfile
+
+_TEXT = (
+    "Hans Müller, IBAN DE89 3704 0044 0532 0130 00, Mail max@example.de, "
+    "token ghp_" + "A" * 36
+)
+
+
+def test_profile_off_by_default() -> None:
+    assert PrivacyScanner().scan(_TEXT).profile is None
+
+
+def test_profile_per_detector() -> None:
+    result = PrivacyScanner(profile=True).scan(_TEXT)
+    profile = result.profile
+    assert profile is not None
+    assert set(profile.detectors) == set(PiiType)
+    assert profile.detectors[PiiType.IBAN].findings == 1
+    assert profile.detectors[PiiType.EMAIL].matches == 1
+    assert profile.detectors[PiiType.NAME].findings == 1
+    assert all(stats.seconds >= 0 for stats in profile.detectors.values())
+    assert {"prefilter", "overlaps", "render"} <= set(profile.phases)
+    assert profile.total_seconds >= sum(profile.phases.values())
+
+
+def test_profile_per_secret_rule() -> None:
+    profile = PrivacyScanner(profile=True).scan(_TEXT).profile
+    assert profile is not None
+    assert profile.rules["github-pat"].findings == 1
+    assert sum(s.findings for s in profile.rules.values()) == (
+        profile.detectors[PiiType.SECRET].findings
+    )
+    assert profile.slowest_rules(1)[0][0] in profile.rules
+
+
+def test_profile_hook() -> None:
+    seen: list[ScanProfile] = []
+    scanner = PrivacyScanner(profile_hook=seen.append)
+    result = scanner.scan(_TEXT, detectors=[PiiType.EMAIL])
+    assert seen == [result.profile]
+    assert set(seen[0].detectors) == {PiiType.EMAIL}
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import re
+import signal
+import subprocess
+import sys
+import tomllib
+
+from privacy_guard import regex_audit
+from privacy_guard.detectors import secret
+from privacy_guard.detectors.address import _address_pattern
+from privacy_guard.regex_audit import (
+    SUPERLINEAR,
+    audit,
+    main,
+    measure_growth,
+    static_issues,
+)
+
+
+def _kinds(pattern: str) -> set[str]:
+    return {issue.kind for issue in static_issues(re.compile(pattern))}
+
+
+# ── Static analysis ────────────────────────────────────────────────────────────
+
+
+def test_nested_quantifiers_are_flagged() -> None:
+    assert _kinds(r"(a+)+$") == {"nested-quantifier"}
+    assert _kinds(r"^(\w+\s?)+$") == {"nested-quantifier"}
+    assert _kinds(r"(.*,)+x") == {"nested-quantifier"}
+
+
+def test_unambiguous_repetitions_are_not_flagged() -> None:
+    assert _kinds(r"(\w+\s)+$") == set()
+    assert _kinds(r"ghp_[A-Za-z0-9_]{36,255}") == set()
+    assert _kinds(r"(?>a+)+$") == set()
+
+
+def test_overlapping_alternation_is_flagged() -> None:
+    assert "overlapping-alternation" in _kinds(r"(?:ab|\wc)+$")
+
+
+# ── Measured growth ────────────────────────────────────────────────────────────
+
+
+def test_exponential_pattern_explodes() -> None:
+    growth = measure_growth(re.compile(r"(a+)+$"))
+    assert growth.exploded
+    assert audit("exp", re.compile(r"(a+)+$")).verdict == "reject"
+
+
+def test_quadratic_pattern_is_measured() -> None:
+    # Every '.'-separated word start rescans up to the end
+    growth = measure_growth(re.compile(r"\b[a-z.]+@[a-z]+\.de"))
+    assert not growth.exploded
+    assert growth.exponent >= SUPERLINEAR
+    assert audit("q", re.compile(r"\b[a-z.]+@[a-z]+\.de")).verdict == "downgrade"
+
+
+def test_linear_pattern_is_ok() -> None:
+    report = audit("pat", re.compile(r"ghp_[A-Za-z0-9_]{36,255}"))
+    assert report.verdict == "ok"
+
+
+def test_address_pattern_is_not_quadratic() -> None:
+    growth = measure_growth(_address_pattern())
+    assert growth.exponent < SUPERLINEAR
+
+
+# ── Rule loading and CLI ───────────────────────────────────────────────────────
+
+
+def test_no_bundled_rule_is_rejected() -> None:
+    with (secret._DATA_DIR / "secret_rules.toml").open("rb") as fh:
+        assert len(secret._RULES) == len(tomllib.load(fh)["rules"])
+    flagged = [rule.pattern for rule in secret._RULES if static_issues(rule.pattern)]
+    assert not any(
+        measure_growth(pattern, max_length=256, limit=0.01).exploded
+        for pattern in flagged
+    )
+
+
+def test_loading_rules_is_static_only(tmp_path, monkeypatch) -> None:
+    (tmp_path / "secret_rules.toml").write_text(
+        """
+[[rules]]
+id = "bad"
+description = "bad"
+pattern = '''key=(a+)+$'''
+secret_group = 0
+severity = "LOW"
+
+[[rules]]
+id = "good"
+description = "good"
+pattern = '''key=[a-z]{8}'''
+secret_group = 0
+severity = "LOW"
+""",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(secret, "_DATA_DIR", tmp_path)
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("rules must load without timing runs or signals")
+
+    monkeypatch.setattr(regex_audit, "measure_growth", forbidden)
+    monkeypatch.setattr(signal, "setitimer", forbidden)
+    monkeypatch.setattr(signal, "signal", forbidden)
+    rules = secret._load_rules()
+    assert [rule.id for rule in rules] == ["bad", "good"]
+    # The engine runs the flagged pattern on bounded slices instead
+    assert [bool(static_issues(rule.pattern)) for rule in rules] == [True, False]
+
+
+def test_cli_exit_status(tmp_path, capsys) -> None:
+    rules = tmp_path / "rules.toml"
+    rules.write_text(
+        "[[rules]]\nid = 'bad'\npattern = '''(a+)+$'''\n"
+        "[[rules]]\nid = 'good'\npattern = '''ghp_[A-Za-z0-9]{36}'''\n",
+        encoding="utf-8",
+    )
+    assert main(["--rules", str(rules)]) == 1
+    out = capsys.readouterr().out
+    assert "REJECT    bad" in out
+    assert "good" not in out
+    assert "2 patterns checked, 1 rejected" in out
+
+
+def test_cli_runs_as_module_without_warnings(tmp_path) -> None:
+    rules = tmp_path / "rules.toml"
+    rules.write_text(
+        "[[rules]]\nid = 'good'\npattern = '''ghp_[0-9]{36}'''\n", encoding="utf-8"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-m", "privacy_guard.regex_audit", "--rules", str(rules)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # The package must not import the module before it runs as __main__
+    assert proc.stderr == ""
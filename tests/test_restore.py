@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from privacy_guard import PrivacyScanner, StreamingRestorer
+from privacy_guard.restore import restore_placeholders
+
+_MAPPING = {f"[NAME_{i}]": f"Person {i}" for i in range(1, 12)}
+
+
+def test_single_pass_restore() -> None:
+    text = "[NAME_1] trifft [NAME_10] und [NAME_11]."
+    assert (
+        restore_placeholders(text, _MAPPING)
+        == "Person 1 trifft Person 10 und Person 11."
+    )
+
+
+def test_restored_values_are_not_substituted_again() -> None:
+    mapping = {"[NAME_1]": "[EMAIL_1]", "[EMAIL_1]": "max@example.de"}
+    assert restore_placeholders("[NAME_1]", mapping) == "[EMAIL_1]"
+
+
+def test_unknown_placeholders_kept() -> None:
+    assert (
+        restore_placeholders("[NAME_99] und [foo]", _MAPPING) == "[NAME_99] und [foo]"
+    )
+
+
+def test_streaming_restorer_split_placeholders() -> None:
+    text = "Hallo [NAME_10], bitte [NAME_2] anrufen. [Hinweis] [NAME_1]"
+    for size in range(1, 12):
+        restorer = StreamingRestorer(_MAPPING)
+        chunks = [text[i : i + size] for i in range(0, len(text), size)]
+        out = "".join(restorer.feed(c) for c in chunks) + restorer.flush()
+        assert out == restore_placeholders(text, _MAPPING)
+
+
+def test_streaming_restorer_holds_only_partial_placeholder() -> None:
+    restorer = StreamingRestorer(_MAPPING)
+    assert restorer.feed("Sehr geehrte [NA") == "Sehr geehrte "
+    assert restorer.feed("ME_3]!") == "Person 3!"
+    assert restorer.feed("Liste [x] ") == "Liste [x] "
+    assert restorer.flush() == ""
+
+
+def test_flush_emits_unfinished_fragment() -> None:
+    restorer = StreamingRestorer(_MAPPING)
+    assert restorer.feed("Ende [NAME_") == "Ende "
+    assert restorer.flush() == "[NAME_"
+
+
+def test_scan_result_restorer() -> None:
+    result = PrivacyScanner().scan("Mail an max@example.de")
+    restorer = result.restorer()
+    answer = ["Ich schreibe an [EM", "AIL_1] noch heute."]
+    out = "".join(restorer.feed(c) for c in answer) + restorer.flush()
+    assert out == "Ich schreibe an max@example.de noch heute."
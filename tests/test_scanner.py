@@ -1,5 +1,10 @@
+import dataclasses
+import pickle
+import subprocess
+import sys
+
 import pytest
-from privacy_guard import PrivacyScanner, PiiType
+from privacy_guard import PrivacyScanner, PiiType, RegexGuard, SegmentCache
 
 
 @pytest.fixture(scope="module")
@@ -120,3 +125,177 @@ def test_scan_result_findings_sorted(scanner):
     result = scanner.scan(text)
     starts = [f.start for f in result.findings]
     assert starts == sorted(starts)
+
+
+def test_scan_batch_matches_scan():
+    scanner = PrivacyScanner()
+    texts = [
+        "Hans Müller, DE89 3704 0044 0532 0130 00",
+        "Kein PII hier.",
+        "Schreib an kontakt@example.de oder +49 171 1234567",
+    ]
+    batch = scanner.scan_batch(texts, batch_size=2)
+    assert len(batch) == len(texts)
+    for text, result in zip(texts, batch):
+        single = scanner.scan(text)
+        assert result.anonymised_text == single.anonymised_text
+        assert result.findings == single.findings
+        assert result.mapping == single.mapping
+
+
+def test_scan_batch_numbering_per_document():
+    scanner = PrivacyScanner()
+    first, second = scanner.scan_batch(
+        ["Hans Müller schrieb.", "Peter Schmidt antwortete."]
+    )
+    assert first.mapping == {"[NAME_1]": "Hans Müller"}
+    assert second.mapping == {"[NAME_1]": "Peter Schmidt"}
+
+
+def test_scan_batch_empty():
+    assert PrivacyScanner().scan_batch([]) == []
+
+
+def test_scan_batch_selection_and_whitelist():
+    scanner = PrivacyScanner()
+    texts = ["Hans Müller, hans@example.de", "Peter Schmidt, DE89370400440532013000"]
+    batch = scanner.scan_batch(
+        texts, detectors=[PiiType.NAME, PiiType.EMAIL], extra_whitelist=["Hans Müller"]
+    )
+    assert [r.anonymised_text for r in batch] == [
+        "Hans Müller, [EMAIL_1]",
+        "[NAME_1], DE89370400440532013000",
+    ]
+
+
+def test_many_findings_rendered_in_order(scanner):
+    text = "\n".join(f"{i};kunde{i}@example.de;aktiv" for i in range(300))
+    result = scanner.scan(text)
+    assert result.anonymised_text == "\n".join(
+        f"{i};[EMAIL_{i + 1}];aktiv" for i in range(300)
+    )
+    assert [f.placeholder for f in result.findings][-1] == "[EMAIL_300]"
+    assert result.restore(result.anonymised_text) == text
+
+
+def test_scan_result_pickles(scanner):
+    result = scanner.scan("Mail an max@example.de")
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_scan_result_is_a_dataclass(scanner):
+    result = scanner.scan("Mail an max@example.de")
+    assert dataclasses.asdict(result)["anonymised_text"] == "Mail an [EMAIL_1]"
+    assert [f.name for f in dataclasses.fields(result)][:4] == [
+        "original_text",
+        "anonymised_text",
+        "findings",
+        "mapping",
+    ]
+    assert dataclasses.replace(result) == result
+    result.anonymised_text = "Mail an [E-Mail]"
+    result.findings = []
+    assert (result.anonymised_text, result.findings) == ("Mail an [E-Mail]", [])
+
+
+def test_per_call_detector_selection():
+    # Fresh instance: the module fixture has NAME disabled by now
+    scanner = PrivacyScanner()
+    text = "Hans Müller, DE89 3704 0044 0532 0130 00, max@example.de"
+    result = scanner.scan(text, detectors=[PiiType.IBAN])
+    assert {f.pii_type for f in result.findings} == {PiiType.IBAN}
+    # The shared scanner itself is unchanged
+    assert len(scanner.scan(text).findings) == 3
+
+
+def test_per_call_extra_whitelist():
+    scanner = PrivacyScanner()
+    text = "Hans Müller schrieb an Maria Weber."
+    result = scanner.scan(text, extra_whitelist=["Hans Müller"])
+    assert "Hans Müller" in result.anonymised_text
+    assert "Maria Weber" not in result.anonymised_text
+    assert "Hans Müller" not in scanner.scan(text).anonymised_text
+
+
+def test_warm_up_does_not_reach_profile_hook():
+    profiles = []
+    scanner = PrivacyScanner(profile_hook=profiles.append)
+    scanner.warm_up(["Hans Müller, hans@example.de"])
+    assert profiles == []
+    scanner.scan("Hans Müller")
+    assert len(profiles) == 1
+
+
+def test_guard_reports_rules_over_budget():
+    scanner = PrivacyScanner(guard=RegexGuard(budget=0.001))
+    text = "a." * 20_000 + "@ und max@example.de"
+    result = scanner.scan(text, detectors=[PiiType.EMAIL])
+    assert result.budget_exceeded == ["EMAIL"]
+    assert scanner.scan("max@example.de").budget_exceeded == []
+    [batched] = scanner.scan_batch([text], detectors=[PiiType.EMAIL])
+    assert batched.budget_exceeded == ["EMAIL"]
+
+
+def test_guard_does_not_cache_incomplete_segments():
+    cache = SegmentCache(max_entries=16)
+    scanner = PrivacyScanner(guard=RegexGuard(budget=0.001), cache=cache)
+    text = "a." * 20_000 + "@"
+    assert scanner.scan(text, detectors=[PiiType.EMAIL]).budget_exceeded
+    assert scanner.scan(text, detectors=[PiiType.EMAIL]).budget_exceeded
+    assert len(cache) == 0
+
+
+# ── Lazy loading ──────────────────────────────────────────────────────────────
+
+# Generous: the package imports in well under 0.1 s, importing spaCy or
+# compiling the secret rules at import time would take far longer
+_IMPORT_BUDGET_US = 500_000
+
+
+def test_import_time_budget():
+    code = (
+        "import sys\n"
+        "import privacy_guard\n"
+        "from privacy_guard.detectors import address, secret\n"
+        "assert 'spacy' not in sys.modules\n"
+        "assert 'multiprocessing' not in sys.modules\n"
+        "assert secret._rules.cache_info().currsize == 0\n"
+        "assert address._address_pattern.cache_info().currsize == 0\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    cumulative = {
+        parts[2].strip(): int(parts[1])
+        for line in proc.stderr.splitlines()
+        if (parts := line.split("|"))[0].startswith("import time:")
+        and parts[1].strip().isdigit()
+    }
+    assert cumulative["privacy_guard"] < _IMPORT_BUDGET_US
+
+
+def test_disabled_detectors_are_never_compiled():
+    code = (
+        "from privacy_guard import PiiType, PrivacyScanner\n"
+        "from privacy_guard.detectors import address, secret\n"
+        "scanner = PrivacyScanner(name_backend='gazetteer')\n"
+        "scanner.disable_detector(PiiType.SECRET)\n"
+        "scanner.disable_detector(PiiType.ADDRESS)\n"
+        "text = 'IBAN DE89 3704 0044 0532 0130 00, Hauptstraße 5, 10115 Berlin'\n"
+        "assert scanner.scan(text).findings[0].pii_type == PiiType.IBAN\n"
+        "assert secret._rules.cache_info().currsize == 0\n"
+        "assert address._address_pattern.cache_info().currsize == 0\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_enabling_a_detector_after_first_scan():
+    scanner = PrivacyScanner(name_backend="gazetteer")
+    scanner.disable_detector(PiiType.SECRET)
+    text = "token ghp_" + "a1B2" * 9
+    assert scanner.scan(text).findings == []
+    scanner.enable_detector(PiiType.SECRET)
+    assert [f.pii_type for f in scanner.scan(text).findings] == [PiiType.SECRET]
@@ -142,6 +142,51 @@ def test_no_findings_on_clean_text(detector: SecretDetector) -> None:
     assert findings == []
 
 
+# ── Rule selection ─────────────────────────────────────────────────────────────
+
+_GITHUB = "ghp_" + "a1B2" * 9
+_STRIPE = "sk_live_" + "a1B2" * 6
+
+
+def test_select_by_tags() -> None:
+    selected = SecretDetector(tags=["GitHub", "stripe"])
+    assert selected.rule_ids
+    for rule in _RULES:
+        assert (rule.id in selected.rule_ids) == bool(
+            {"github", "stripe"} & set(rule.tags)
+        )
+    assert [f.text for f in selected.detect(f"{_GITHUB} {_STRIPE}")] == [
+        _GITHUB,
+        _STRIPE,
+    ]
+    assert SecretDetector(tags=["stripe"]).detect(_GITHUB) == []
+
+
+def test_select_by_min_severity() -> None:
+    high = SecretDetector(min_severity="high").rule_ids
+    assert {r.id for r in _RULES if r.severity in ("CRITICAL", "HIGH")} == set(high)
+    assert len(SecretDetector(min_severity="WARNING").rule_ids) == len(_RULES)
+
+
+def test_selection_rejects_unknown_values() -> None:
+    with pytest.raises(ValueError, match="clowd"):
+        SecretDetector(tags=["cloud", "clowd"])
+    with pytest.raises(ValueError, match="min_severity"):
+        SecretDetector(min_severity="urgent")
+
+
+def test_selection_matcher_is_shared() -> None:
+    from privacy_guard.detectors.secret import _matcher
+
+    a = SecretDetector(tags=["token", "cloud"], min_severity="HIGH")
+    b = SecretDetector(tags=["cloud", "token"], min_severity="high")
+    assert a.selection == b.selection
+    a.detect(_GITHUB)
+    hits = _matcher.cache_info().hits
+    b.detect(_GITHUB)
+    assert _matcher.cache_info().hits == hits + 1
+
+
 # ── Scanner integration ────────────────────────────────────────────────────────
 
 
@@ -164,3 +209,11 @@ def test_secret_wins_over_email() -> None:
     )
     types = {f.pii_type for f in result.findings}
     assert PiiType.SECRET in types
+
+
+def test_scanner_secret_selection() -> None:
+    from privacy_guard import PrivacyScanner
+
+    scanner = PrivacyScanner(secret_tags=["stripe"], secret_min_severity="CRITICAL")
+    result = scanner.scan(f"{_GITHUB} {_STRIPE}", detectors=[PiiType.SECRET])
+    assert [f.text for f in result.findings] == [_STRIPE]
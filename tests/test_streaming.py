@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from privacy_guard import PiiType, PrivacyScanner, RegexGuard
+
+_LINES = [
+    "Kunde Hans Müller meldet sich wegen der Rechnung.",
+    "Bitte überweisen auf DE89 3704 0044 0532 0130 00 bis Freitag.",
+    "Rückfragen an max@example.de oder telefonisch.",
+    "Maria Weber übernimmt den Fall, Hans Müller ist informiert.",
+    "Kein Bezug zu personenbezogenen Daten in dieser Zeile.",
+]
+_TEXT = "\n".join(_LINES * 8)
+
+
+@pytest.fixture(scope="module")
+def scanner() -> PrivacyScanner:
+    return PrivacyScanner()
+
+
+def _spans(findings):
+    return [(f.start, f.end, f.text, f.placeholder) for f in findings]
+
+
+def test_stream_matches_scan(scanner: PrivacyScanner) -> None:
+    expected = scanner.scan(_TEXT)
+    stream = scanner.scan_stream(io.StringIO(_TEXT), window_size=120, overlap=60)
+    assert stream.read() == expected.anonymised_text
+    assert stream.mapping == expected.mapping
+    assert _spans(stream.findings) == _spans(expected.findings)
+
+
+def test_iterator_of_chunks(scanner: PrivacyScanner) -> None:
+    chunks = (_TEXT[i : i + 7] for i in range(0, len(_TEXT), 7))
+    stream = scanner.scan_stream(chunks, window_size=200, overlap=60)
+    assert stream.read() == scanner.scan(_TEXT).anonymised_text
+
+
+def test_finding_across_chunk_boundary_is_merged(scanner: PrivacyScanner) -> None:
+    text = "Kontonummer: DE89 3704 0044 0532 0130 00 danke."
+    # The IBAN straddles both the chunk and the first window boundary
+    chunks = iter([text[:22], text[22:]])
+    stream = scanner.scan_stream(chunks, window_size=20, overlap=30)
+    assert stream.read() == "Kontonummer: [IBAN_1] danke."
+    assert [(f.start, f.end) for f in stream.findings] == [(13, 40)]
+
+
+def test_output_is_incremental(scanner: PrivacyScanner) -> None:
+    pieces = list(scanner.scan_stream(_TEXT, window_size=100, overlap=60))
+    assert len(pieces) > 1
+    assert "".join(pieces) == scanner.scan(_TEXT).anonymised_text
+
+
+def test_numbering_consistent_across_windows(scanner: PrivacyScanner) -> None:
+    stream = scanner.scan_stream(_TEXT, window_size=100, overlap=60)
+    output = stream.read()
+    names = [f for f in stream.findings if f.pii_type == PiiType.NAME]
+    assert {f.text: f.placeholder for f in names} == {
+        "Hans Müller": "[NAME_1]",
+        "Maria Weber": "[NAME_2]",
+    }
+    assert stream.restore(output) == _TEXT
+
+
+def test_keep_findings_false(scanner: PrivacyScanner) -> None:
+    stream = scanner.scan_stream(_TEXT, keep_findings=False)
+    assert "[IBAN_1]" in stream.read()
+    assert stream.findings == []
+    assert "[IBAN_1]" in stream.mapping
+
+
+def test_empty_stream(scanner: PrivacyScanner) -> None:
+    assert scanner.scan_stream(io.StringIO("")).read() == ""
+
+
+def test_iterate_once(scanner: PrivacyScanner) -> None:
+    stream = scanner.scan_stream("text")
+    stream.read()
+    with pytest.raises(RuntimeError):
+        iter(stream)
+
+
+def test_invalid_window(scanner: PrivacyScanner) -> None:
+    with pytest.raises(ValueError):
+        scanner.scan_stream("text", window_size=0)
+    with pytest.raises(ValueError):
+        scanner.scan_stream("text", overlap=-1)
+
+
+def test_guard_budget_exceeded_is_reported_per_window() -> None:
+    guard = RegexGuard(budget=0.001, budget_per_char=1e-6)
+    scanner = PrivacyScanner(guard=guard, name_backend="gazetteer")
+    # Backtracks quadratically in the e-mail pattern, but only in later windows
+    text = "Rückfragen an max@example.de. " * 800 + "a." * 10_000 + "@"
+    stream = scanner.scan_stream(text, window_size=20_000, overlap=20)
+    reported = [list(stream.budget_exceeded) for _ in stream]
+    assert reported[0] == []
+    assert reported[-1] == ["EMAIL"]
+    assert stream.budget_exceeded == ["EMAIL"]
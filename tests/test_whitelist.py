@@ -53,3 +53,35 @@ def test_partial_name_not_whitelisted(wl):
     result = wl.is_whitelisted("Merz")
     # "merz" is contained in "friedrich merz" so this returns True
     assert result is True
+
+
+def test_overlay_adds_names_without_changing_base(wl):
+    layer = wl.overlay(["Hans Mustermann"])
+    assert layer.is_whitelisted("Hans Mustermann") is True
+    assert layer.is_whitelisted("Friedrich Merz") is True
+    assert wl.is_whitelisted("Hans Mustermann") is False
+
+
+def test_words_in_order_match(wl):
+    wl.add("Angela Dorothea Merkel")
+    assert wl.is_whitelisted("Angela Merkel") is True
+    assert wl.is_whitelisted("Merkel Angela") is False
+
+
+def test_partial_word_not_whitelisted(wl):
+    # Matching works on whole words; "Fried" is not a word of "Friedrich Merz"
+    assert wl.is_whitelisted("Fried") is False
+
+
+def test_remove_updates_index(wl):
+    wl.add("Erika Beispielfrau")
+    assert wl.is_whitelisted("Beispielfrau") is True
+    wl.remove("Erika Beispielfrau")
+    assert wl.is_whitelisted("Beispielfrau") is False
+
+
+def test_large_whitelist():
+    names = [f"Vorname{i} Nachname{i}" for i in range(100_000)]
+    wl = WhitelistManager(extra_names=names)
+    assert wl.is_whitelisted("Nachname99999") is True
+    assert wl.is_whitelisted("Vorname1 Nachname2") is False
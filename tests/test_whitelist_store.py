@@ -0,0 +1,139 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from privacy_guard import PiiType, PrivacyScanner, SegmentCache
+from privacy_guard.whitelist import _DATA_DIR, WhitelistManager
+from privacy_guard.whitelist_store import (
+    MappedWhitelist,
+    build_whitelist_store,
+    main,
+)
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = tmp_path / "names.pgwl"
+    build_whitelist_store(["Friedrich Merz", "Angela Dorothea Merkel", "# c", ""], path)
+    return path
+
+
+def test_exact_and_word_matches(store_path):
+    store = MappedWhitelist(store_path)
+    assert len(store) == 2
+    assert "friedrich merz" in store
+    assert store.is_whitelisted("FRIEDRICH MERZ")
+    assert store.is_whitelisted("Merz")
+    assert store.is_whitelisted("Angela Merkel")
+    assert not store.is_whitelisted("Merkel Angela")
+    assert not store.is_whitelisted("Fried")
+    assert not store.is_whitelisted("Hans Mustermann")
+    assert not store.is_whitelisted("")
+
+
+def test_matches_in_memory_whitelist(tmp_path):
+    path = tmp_path / "public.pgwl"
+    with (_DATA_DIR / "public_figures.txt").open(encoding="utf-8") as fh:
+        build_whitelist_store(fh, path)
+    store = MappedWhitelist(path)
+    wl = WhitelistManager()
+    queries = ["Olaf Scholz", "Scholz", "Merkel", "Hans Mustermann", "Anna Schmidt"]
+    for query in queries:
+        assert store.is_whitelisted(query) == wl.is_whitelisted(query), query
+
+
+def test_replaced_file_is_picked_up(store_path):
+    store = MappedWhitelist(store_path, check_interval=0)
+    assert store.generation == 0
+    build_whitelist_store(["Hans Mustermann"], store_path)
+    assert store.is_whitelisted("Hans Mustermann")
+    assert not store.is_whitelisted("Friedrich Merz")
+    assert store.generation == 1
+
+
+def test_no_automatic_reload_without_interval(store_path):
+    store = MappedWhitelist(store_path, check_interval=None)
+    build_whitelist_store(["Hans Mustermann"], store_path)
+    assert not store.is_whitelisted("Hans Mustermann")
+    assert store.reload() is True
+    assert store.is_whitelisted("Hans Mustermann")
+    assert store.reload() is False
+
+
+def test_unreadable_replacement_keeps_previous_version(store_path):
+    store = MappedWhitelist(store_path, check_interval=0)
+    broken = store_path.with_name("broken")
+    broken.write_bytes(b"not a store")
+    os.replace(broken, store_path)
+    assert store.is_whitelisted("Friedrich Merz")
+    with pytest.raises(ValueError):
+        store.reload()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "names.txt"
+    path.write_text("Friedrich Merz\n" * 10, encoding="utf-8")
+    with pytest.raises(ValueError):
+        MappedWhitelist(path)
+
+
+def test_whitelist_manager_with_store(store_path):
+    wl = WhitelistManager(store=MappedWhitelist(store_path))
+    assert wl.is_whitelisted("Merz")
+    # The bundled list is replaced by the store
+    assert not wl.is_whitelisted("Olaf Scholz")
+    wl.add("Erika Musterfrau")
+    assert wl.is_whitelisted("Erika Musterfrau")
+    assert wl.overlay(["Hans Mustermann"]).is_whitelisted("Merz")
+
+
+def test_store_reload_invalidates_scan_cache(store_path):
+    store = MappedWhitelist(store_path, check_interval=0)
+    scanner = PrivacyScanner(
+        whitelist=WhitelistManager(store=store),
+        cache=SegmentCache(max_entries=16),
+        name_backend="gazetteer",
+    )
+    text = "Bitte Hans Müller anrufen."
+    first = scanner.scan(text, detectors=[PiiType.NAME])
+    assert first.findings
+    build_whitelist_store(["Hans Müller"], store_path)
+    assert not scanner.scan(text, detectors=[PiiType.NAME]).findings
+
+
+def test_cli_includes_bundled_list(tmp_path, capsys):
+    names = tmp_path / "customers.txt"
+    names.write_text("Erika Musterfrau\n", encoding="utf-8")
+    output = tmp_path / "out.pgwl"
+    main([str(output), str(names)])
+    assert "Wrote" in capsys.readouterr().out
+    store = MappedWhitelist(output)
+    assert store.is_whitelisted("Erika Musterfrau")
+    assert store.is_whitelisted("Olaf Scholz")
+
+    main([str(output), str(names), "--no-defaults"])
+    assert not MappedWhitelist(output).is_whitelisted("Olaf Scholz")
+
+
+def test_cli_runs_as_module_without_warnings(tmp_path):
+    output = tmp_path / "out.pgwl"
+    proc = subprocess.run(
+        [sys.executable, "-m", "privacy_guard.whitelist_store", str(output)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # The package must not import the module before it runs as __main__
+    assert proc.stderr == ""
+    assert MappedWhitelist(output).is_whitelisted("Olaf Scholz")
+
+
+def test_large_store(tmp_path):
+    path = tmp_path / "large.pgwl"
+    build_whitelist_store((f"vorname{i} nachname{i}" for i in range(100_000)), path)
+    store = MappedWhitelist(path)
+    assert len(store) == 100_000
+    assert store.is_whitelisted("Vorname99999 Nachname99999")
+    assert store.is_whitelisted("Nachname5")
+    assert not store.is_whitelisted("Vorname1 Nachname2")